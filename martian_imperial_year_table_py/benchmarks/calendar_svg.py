@@ -0,0 +1,46 @@
+"""
+帝國火星曆の一年分の暦をSVGで描く時閒を測る.
+
+`python -m benchmarks.calendar_svg` で實行する. 初めて描く年 (月の暦を求める分を含む) と、
+二度目に描く年 (記憶した月の暦を使ふ) とを比べる.
+"""
+
+from imperial_calendar import ImperialDateTime
+from imperial_calendar.CalendarImage import CalendarImage
+import io
+import time
+
+years = range(1425, 1435)
+
+
+def render_year(year: int) -> int:
+    """一年分の暦を描いて、書き出した文字數を返す."""
+    stream = io.StringIO()
+    for month in range(1, 25):
+        CalendarImage(
+            ImperialDateTime(year, month, 1, 0, 0, 0, "+00:00"), "+09:00"
+        ).write_svg(stream)
+    return len(stream.getvalue())
+
+
+def main() -> None:
+    """Run."""
+    print(
+        "{:<8}{:>12}{:>12}{:>12}".format("year", "first (ms)", "cached (ms)", "chars")
+    )
+    for year in years:
+        start = time.perf_counter()
+        render_year(year)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        chars = render_year(year)
+        cached = time.perf_counter() - start
+        print(
+            "{:<8}{:>12.1f}{:>12.1f}{:>12}".format(
+                year, first * 1000, cached * 1000, chars
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
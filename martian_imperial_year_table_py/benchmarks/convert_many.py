@@ -0,0 +1,81 @@
+"""
+`convert_fields_many` と `convert_many` との竝列度每の處理量を測る.
+
+`python -m benchmarks.convert_many` で實行する. 1900年から2100年迄のグレゴリオ曆の日時を變換し、
+worker一つの時に對する速さの比を示す. 比は此の機械のCPUの數を超えない. `convert_many` はobjectの
+讀み書きを呼んだprocessで行ふので、配列で渡す `convert_fields_many` 程には伸びない.
+"""
+
+from imperial_calendar import GregorianDateTime
+from imperial_calendar.parallel import convert_fields_many, convert_many
+import os
+import random
+import time
+import typing as t
+
+count = 400000
+worker_counts = (1, 2, 4, 8)
+
+
+def main() -> None:
+    """Run."""
+    rng = random.Random(1425)
+    values = [
+        GregorianDateTime(
+            rng.randint(1900, 2100),
+            rng.randint(1, 12),
+            rng.randint(1, 28),
+            rng.randint(0, 23),
+            rng.randint(0, 59),
+            rng.randint(0, 59),
+            "Asia/Tokyo",
+        )
+        for _ in range(count)
+    ]
+    fields = [
+        [getattr(value, name) for value in values]
+        for name in ("year", "month", "day", "hour", "minute", "second")
+    ]
+    print(f"{count} values, {os.cpu_count()} CPUs")
+    measure(
+        "convert_fields_many",
+        lambda workers: convert_fields_many(
+            fields,
+            True,
+            "Asia/Tokyo",
+            "+09:00",
+            chunk_size=count // 64,
+            max_workers=workers,
+        ),
+    )
+    measure(
+        "convert_many",
+        lambda workers: convert_many(
+            values, "Asia/Tokyo", "+09:00", max_workers=workers
+        ),
+    )
+
+
+def measure(name: str, convert: t.Callable[[int], object]) -> None:
+    """worker數每に變換の時閒を測って表にする."""
+    print()
+    print(name)
+    print(
+        "{:<10}{:>12}{:>14}{:>10}".format("workers", "time (s)", "values/s", "speedup")
+    )
+    base = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        convert(workers)
+        elapsed = time.perf_counter() - start
+        if base is None:
+            base = elapsed
+        print(
+            "{:<10}{:>12.2f}{:>14.0f}{:>10.2f}".format(
+                workers, elapsed, count / elapsed, base / elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
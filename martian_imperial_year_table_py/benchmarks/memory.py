@@ -0,0 +1,68 @@
+"""
+曆のobject一つ當りのmemoryを測る.
+
+`python -m benchmarks.memory` で實行する. __slots__ を持つ現在の class と、
+同じ __init__ で __dict__ に屬性を持つ class とを比べる.
+"""
+
+from imperial_calendar import (
+    GregorianDateTime,
+    ImperialDateTime,
+    ImperialSolNumber,
+    ImperialYearMonth,
+    JulianDay,
+    MarsSolDate,
+    TerrestrialTime,
+)
+import gc
+import sys
+import tracemalloc
+import typing as t
+
+count = 100000
+
+
+def dict_backed(cls: type) -> type:
+    """__slots__ を持たない同じ形の class を作る."""
+    return type(
+        cls.__name__ + "WithDict", (object,), {"__init__": vars(cls)["__init__"]}
+    )
+
+
+def bytes_per_instance(factory: t.Callable[[int], object]) -> float:
+    """factoryで作ったobjectの一つ當りの確保量 (byte)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # list自體の分を除く
+    return (after - before - sys.getsizeof(instances)) / len(instances)
+
+
+def main() -> None:
+    """Run."""
+    factories: t.List[t.Tuple[type, t.Callable[[type, int], object]]] = [
+        (GregorianDateTime, lambda cls, i: cls(2000, 1, 1, 0, 0, i % 60, None)),
+        (ImperialDateTime, lambda cls, i: cls(1425, 1, 1, 0, 0, i % 60, None)),
+        (ImperialSolNumber, lambda cls, i: cls(i, 0.5)),
+        (ImperialYearMonth, lambda cls, i: cls(i, 1)),
+        (JulianDay, lambda cls, i: cls(i, 0.5)),
+        (MarsSolDate, lambda cls, i: cls(i + 0.5)),
+        (TerrestrialTime, lambda cls, i: cls(i + 0.5)),
+    ]
+    print("{:<20}{:>12}{:>12}".format("class", "__dict__", "__slots__"))
+    for cls, factory in factories:
+        with_dict = dict_backed(cls)
+        print(
+            "{:<20}{:>12.1f}{:>12.1f}".format(
+                cls.__name__,
+                bytes_per_instance(lambda i: factory(with_dict, i)),
+                bytes_per_instance(lambda i: factory(cls, i)),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
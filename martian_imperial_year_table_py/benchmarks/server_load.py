@@ -0,0 +1,176 @@
+"""
+日時の變換のHTTP serverの負荷試驗.
+
+`python -m benchmarks.server_load` で實行する. `--port` を省くと `python -m imperial_calendar serve` を
+別のprocessで始めて其れに要求を送る. 各接續はkeep-aliveで要求を續けて送り、`--pipeline` 個づつ
+應答を待たずに送る. 經路每のp50, p99の待ち時閒と每秒の要求數とを示す.
+"""
+
+from imperial_calendar.server import server_keep_alive_timeout
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import typing as t
+
+requests = {
+    "current": ("GET", "/api/imperial-datetime/current?timezone=%2B09:00", None),
+    "from-imperial": (
+        "POST",
+        "/api/gregorian-datetime/from-imperial",
+        {
+            "imperialDateTimeFormatted": "1425-01-01T00:00:00+00:00",
+            "gregorianTimezone": "+09:00",
+        },
+    ),
+    "from-gregorian": (
+        "POST",
+        "/api/imperial-datetime/from-gregorian",
+        {"gregorianDateTime": "2019-01-10T13:06:47Z", "imperialTimezone": "+09:00"},
+    ),
+}
+
+
+def encode(method: str, target: str, body: t.Optional[dict]) -> bytes:
+    """HTTP/1.1の要求."""
+    payload = b"" if body is None else json.dumps(body).encode("utf-8")
+    return (
+        f"{method} {target} HTTP/1.1\r\n"
+        "Host: localhost\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        "\r\n"
+    ).encode("latin-1") + payload
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    """應答を一つ讀んで statusを返す."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    length = 0
+    for line in lines[1:]:
+        (name, _, value) = line.partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(lines[0].split(" ")[1])
+
+
+async def connection(
+    port: int,
+    name: str,
+    count: int,
+    pipeline: int,
+    latencies: t.List[float],
+) -> None:
+    """一つの接續でcount個の要求を送り、各要求の待ち時閒を記録する."""
+    (reader, writer) = await asyncio.open_connection("127.0.0.1", port)
+    payload = encode(*requests[name])
+    for start in range(0, count, pipeline):
+        batch = min(pipeline, count - start)
+        sent = time.perf_counter()
+        writer.write(payload * batch)
+        await writer.drain()
+        for _ in range(batch):
+            status = await read_response(reader)
+            if status != 200:
+                raise Exception(f"Unexpected status: {status}")
+            latencies.append(time.perf_counter() - sent)
+    writer.close()
+
+
+async def run(
+    port: int, name: str, connections: int, count: int, pipeline: int
+) -> t.Tuple[t.List[float], float]:
+    """全ての接續を同時に走らせて、待ち時閒の一覽と經過時閒とを返す."""
+    latencies: t.List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            connection(port, name, count, pipeline, latencies)
+            for _ in range(connections)
+        )
+    )
+    return (latencies, time.perf_counter() - start)
+
+
+def percentile(values: t.List[float], p: float) -> float:
+    """竝べた値のp百分位數."""
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def free_port() -> int:
+    """空いてゐるport."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int) -> None:
+    """Serverが接續を受け附ける迄待つ."""
+    deadline = time.monotonic() + server_keep_alive_timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port)).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def main() -> None:
+    """Run."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.server_load")
+    parser.add_argument("--connections", default=16, type=int, help="同時の接續數")
+    parser.add_argument(
+        "--pipeline", default=1, type=int, help="應答を待たずに送る要求數"
+    )
+    parser.add_argument(
+        "--port", default=None, type=int, help="既に動いてゐるserverのport"
+    )
+    parser.add_argument("--requests", default=500, type=int, help="接續每の要求數")
+    args = parser.parse_args()
+    process = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "imperial_calendar", "serve", "--port", str(port)],
+            env=dict(os.environ, PYTHONPATH=os.getcwd()),
+            stderr=subprocess.DEVNULL,
+        )
+        wait_for_port(port)
+    try:
+        print(
+            f"{args.connections} connections x {args.requests} requests,"
+            f" pipeline {args.pipeline}"
+        )
+        print(
+            "{:<16}{:>12}{:>12}{:>12}".format("route", "p50 (ms)", "p99 (ms)", "req/s")
+        )
+        for name in requests:
+            (latencies, elapsed) = asyncio.run(
+                run(port, name, args.connections, args.requests, args.pipeline)
+            )
+            latencies.sort()
+            print(
+                "{:<16}{:>12.2f}{:>12.2f}{:>12.0f}".format(
+                    name,
+                    percentile(latencies, 50) * 1000,
+                    percentile(latencies, 99) * 1000,
+                    len(latencies) / elapsed,
+                )
+            )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
 from imperial_calendar import *
+from imperial_calendar.internal.consts import imperial_month_to_imsn_table
+from imperial_calendar.internal.ImperialYear import (
+    ImperialYear,
+    is_leap_year_array,
+    new_years_day_array,
+)
 from imperial_calendar.transform import *
+import numpy as np
 
 
 def grdt_all(year, month, day, hour, minute, second, tze, tzm):
@@ -130,46 +137,23 @@ def imdt_all(year, month, day, hour, minute, second, tzm, tze):
 
 def year_to_ls270(year):
     """火星年->其の年の天文學上の冬至の日"""
-    last_sol_imsn = imdt_to_imsn(ImperialDateTime(year, 24, 27, 0, 0, 0, "+00:00"))
-    for i in range(0, 668):
-        check_sol = ImperialSolNumber(last_sol_imsn.imperial_sol_number - i)
-        after_sol = ImperialSolNumber(last_sol_imsn.imperial_sol_number - i + 1)
-        mrls_of_check_sol = tert_to_mrls(mrsd_to_tert(imsn_to_mrsd(check_sol)))
-        mrls_of_after_sol = tert_to_mrls(mrsd_to_tert(imsn_to_mrsd(after_sol)))
-        if mrls_of_check_sol <= 270 and mrls_of_after_sol > 270:
-            return imsn_to_imdt(check_sol, 0)
-            break
-    else:
-        print("error")
+    return imsn_to_imdt(ImperialSolNumber(mrls_to_imsn(year, 270).day, 0.0))
 
 
 def touji_zure(year):
     """1000年の冬至のずれを一覽する"""
-    text = str()
-    for i in range(0, 1000):
-        check_sol = imdt_to_imsn(year_to_ls270(year + i))
-        ref_sol = imdt_to_imsn(ImperialDateTime(year + i, 22, 1, 0, 0, 0, "+00:00"))
-        dif_sol = (check_sol.imperial_sol_number - ref_sol.imperial_sol_number) // 1
-        letter = str(int(dif_sol % 10))
-        text += letter
-        if i % 40 == 39 and i != 1000:
-            text += str("\n")
-    print(text)
+    check_sol, _ = mrls_to_imsn_array(np.arange(year, year + 1000), 270)
+    ref_sol = (
+        new_years_day_array(year, year + 1000)[:-1] + imperial_month_to_imsn_table[21]
+    )
+    letters = ((check_sol - ref_sol) % 10).astype(str)
+    print("\n".join("".join(letters[i : i + 40]) for i in range(0, 1000, 40)))
 
 
 def leap1000(year):
     """1000年の閏年を一覽する"""
-    text = str()
-    for i in range(0, 1000):
-        check_bool = ImperialYear(year + i).is_leap_year()
-        if check_bool == True:
-            letter = "1"
-        else:
-            letter = "0"
-        text += letter
-        if i % 50 == 49 and i != 1000:
-            text += str("\n")
-    print(text)
+    letters = is_leap_year_array(year, year + 1000).astype(int).astype(str)
+    print("\n".join("".join(letters[i : i + 50]) for i in range(0, 1000, 50)))
 
 
 def imdt_to_mrls(imdt):
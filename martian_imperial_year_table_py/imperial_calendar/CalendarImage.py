@@ -0,0 +1,475 @@
+"""
+帝國火星曆の一月の暦をSVGで描く.
+
+`packages/calendar_svg` の `CalendarImage` と同じSVGを、DOMを作らずに文字列で書き出す.
+月に依らない枠と曜日とは一度だけ組み立てて使ひ回し、各日の配置は `ImperialYearMonth.grid` から求める.
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+from imperial_calendar.GregorianDateTime import GregorianDateTime
+from imperial_calendar.ImperialDateTime import ImperialDateTime, japanese_month_names
+from imperial_calendar.ImperialYearMonth import ImperialYearMonth
+from imperial_calendar.internal.MonthGrid import MonthGrid, MonthGridGregorianDay
+import io
+import math
+import typing as t
+
+BLACK = "#000000"
+BLUE = "#008dcc"
+FONT_FAMILY_BOLD = (
+    'fot-tsukubrdgothic-std, "FOT-TsukuBRdGothic Std B", "FOT-筑紫B丸ゴシック Std B", '
+    'TsukuBRdGothic-Bold, "筑紫B丸ゴシック ボールド", sans-serif'
+)
+FONT_FAMILY_REGULAR = FONT_FAMILY_BOLD
+FONT_SIZE_ANNOTATION = 8.0
+FONT_SIZE_BOLD_LARGE = 32.0
+FONT_SIZE_LARGE = 20.0
+FONT_SIZE_SMALL = 10.0
+GRAY_BLUE = "#6bb4d6"
+GRAY_RED = "#ff9d80"
+GRAY = "#888888"
+HEIGHT_DAYS_GAP = 4.5
+HEIGHT_GRDT_BELT = 5.5
+HEIGHT_TOP_SPACE = 15.0
+RED = "#e03f0c"
+SIZE_DAY_SQUARE = 22.5
+STROKE_WIDTH_BOLD = "0.4mm"
+STROKE_WIDTH_THIN = "0.15mm"
+WHITE = "#ffffff"
+WIDTH_LEFT_SPACE = 45.0
+
+SVG_NS = "http://www.w3.org/2000/svg"
+TAttributes = t.List[t.Tuple[str, str]]
+
+weekday_names = ["月", "火", "水", "木", "金", "土", "日"]
+
+
+class CalendarImage(object):
+    """帝國火星曆の一月の暦の畫像."""
+
+    __slots__ = ("grdt_timezone", "imdt")
+
+    def __init__(self, imdt: ImperialDateTime, grdt_timezone: str):
+        """Init."""
+        self.grdt_timezone = grdt_timezone
+        self.imdt = ImperialDateTime(imdt.year, imdt.month, 1, 0, 0, 0, imdt.timezone)
+
+    def draw_as_svg(self) -> str:
+        """SVGの文字列."""
+        stream = io.StringIO()
+        self.write_svg(stream)
+        return stream.getvalue()
+
+    def write_svg(self, stream: t.TextIO) -> None:
+        """SVGをstreamに書き出す."""
+        grid = ImperialYearMonth(self.imdt.year, self.imdt.month).grid(
+            self.grdt_timezone, self.imdt.timezone
+        )
+        stream.write(_svg_open_tag)
+        stream.write(
+            _element("title", [], f"帝國火星曆{self.imdt.year}年{self.imdt.month}月")
+        )
+        stream.write(_group_open_tag)
+        _write_title(stream, grid)
+        stream.write(_joubi_texts)
+        stream.write(_static_frame(grid.days))
+        _write_imdt_days(stream, grid)
+        _write_grdt_days(stream, grid)
+        stream.write("</g></svg>")
+
+
+def draw_calendar_svg(imdt: ImperialDateTime, grdt_timezone: str) -> str:
+    """帝國火星曆の一月の暦のSVG."""
+    return CalendarImage(imdt, grdt_timezone).draw_as_svg()
+
+
+def _number(value: float) -> str:
+    """JavaScriptの `String(number)` と同じ書式の數."""
+    if value == 0:
+        return "0"
+    text = repr(float(value))
+    if "e" in text:
+        text = format(Decimal(text), "f")
+    if text.endswith(".0"):
+        text = text[:-2]
+    return text
+
+
+def _escape(text: str) -> str:
+    """XMLの文字列を escape する."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _open_tag(tag: str, attributes: TAttributes) -> str:
+    """開始タグ."""
+    return "<{}{}>".format(
+        tag,
+        "".join(
+            ' {}="{}"'.format(key, _escape(value).replace('"', "&quot;"))
+            for (key, value) in attributes
+        ),
+    )
+
+
+def _element(tag: str, attributes: TAttributes, text: t.Optional[str] = None) -> str:
+    """要素. textが無ければ空要素にする."""
+    if text is None:
+        return _open_tag(tag, attributes)[:-1] + "/>"
+    return f"{_open_tag(tag, attributes)}{_escape(text)}</{tag}>"
+
+
+def _text(attributes: TAttributes, font_size: float, y: float, text: str) -> str:
+    """文字. `CalendarImage.ts` の `drawText` と同じく、font-sizeとyとは其の位置に書く."""
+    converted: TAttributes = []
+    for key, value in attributes:
+        if key == "font-size":
+            value = f"{_number(font_size)}pt"
+        elif key == "y":
+            value = f"{_number(y + font_size * 0.353)}mm"
+        converted.append((key, value))
+    return _element("text", converted, text)
+
+
+def _line(x1: str, x2: str, y1: str, y2: str, stroke_width: str) -> str:
+    """線."""
+    return _element(
+        "line",
+        [
+            ("stroke", BLACK),
+            ("stroke-width", stroke_width),
+            ("x1", x1),
+            ("x2", x2),
+            ("y1", y1),
+            ("y2", y2),
+        ],
+    )
+
+
+_svg_open_tag = _open_tag(
+    "svg",
+    [
+        ("xmlns", SVG_NS),
+        ("height", "148mm"),
+        ("style", f"background-color: {WHITE};"),
+        ("width", "210mm"),
+    ],
+)
+_group_open_tag = _open_tag("g", [("font-family", FONT_FAMILY_REGULAR)])
+
+
+_joubi_texts = "".join(
+    _text(
+        [
+            ("fill", color),
+            ("font-size", ""),
+            ("x", f"{_number(WIDTH_LEFT_SPACE + SIZE_DAY_SQUARE / 2 - 2 + x)}mm"),
+            ("y", ""),
+        ],
+        FONT_SIZE_SMALL,
+        HEIGHT_TOP_SPACE - 5,
+        label,
+    )
+    for (label, color, x) in [
+        (label, color, SIZE_DAY_SQUARE * index)
+        for (index, (label, color)) in enumerate(
+            [
+                ("日", RED),
+                ("月", BLACK),
+                ("火", BLACK),
+                ("水", BLACK),
+                ("木", BLACK),
+                ("金", BLACK),
+                ("土", BLUE),
+            ]
+        )
+    ]
+)
+
+
+@lru_cache(maxsize=None)
+def _static_frame(days: int) -> str:
+    """日の枠. 27日の月は最後の週が六日."""
+    fragments = []
+    for row in range(4):
+        days_of_week = 6 if row == 3 and days == 27 else 7
+        y = (
+            HEIGHT_TOP_SPACE
+            + (SIZE_DAY_SQUARE + HEIGHT_GRDT_BELT + HEIGHT_DAYS_GAP) * row
+        )
+        fragments.append(
+            _element(
+                "rect",
+                [
+                    ("fill", WHITE),
+                    ("height", f"{_number(SIZE_DAY_SQUARE + HEIGHT_GRDT_BELT)}mm"),
+                    ("stroke", BLACK),
+                    ("stroke-width", STROKE_WIDTH_BOLD),
+                    ("width", f"{_number(SIZE_DAY_SQUARE * days_of_week)}mm"),
+                    ("x", f"{_number(WIDTH_LEFT_SPACE)}mm"),
+                    ("y", f"{_number(y)}mm"),
+                ],
+            )
+        )
+        line_y = (
+            HEIGHT_TOP_SPACE
+            + SIZE_DAY_SQUARE
+            + (SIZE_DAY_SQUARE + HEIGHT_GRDT_BELT + HEIGHT_DAYS_GAP) * row
+        )
+        fragments.append(
+            _line(
+                f"{_number(WIDTH_LEFT_SPACE)}mm",
+                f"{_number(WIDTH_LEFT_SPACE + SIZE_DAY_SQUARE * days_of_week)}mm",
+                f"{_number(line_y)}mm",
+                f"{_number(line_y)}mm",
+                STROKE_WIDTH_THIN,
+            )
+        )
+        for column in range(days_of_week):
+            x = f"{_number(WIDTH_LEFT_SPACE + SIZE_DAY_SQUARE * (column + 1))}mm"
+            fragments.append(
+                _line(
+                    x, x, f"{_number(y)}mm", f"{_number(line_y)}mm", STROKE_WIDTH_BOLD
+                )
+            )
+    return "".join(fragments)
+
+
+def _container_open_tag(height: str, x: str, y: str) -> str:
+    """文字を收める入れ子のSVG."""
+    return _open_tag(
+        "svg",
+        [
+            ("height", height),
+            ("style", "background-color: transparent;"),
+            ("width", f"{_number(WIDTH_LEFT_SPACE - 8)}mm"),
+            ("x", x),
+            ("y", y),
+        ],
+    )
+
+
+_title_text = _text(
+    [("fill", BLACK), ("font-size", ""), ("x", "5mm"), ("y", "")],
+    FONT_SIZE_LARGE,
+    9.5,
+    "帝國火星暦",  # 筑紫B丸ゴシックは「曆」を搭載しない爲「暦」を使ふ
+)
+_wave_dash_text = _text(
+    [
+        ("fill", GRAY),
+        ("font-size", ""),
+        ("x", f"{_number(WIDTH_LEFT_SPACE - 5.5)}mm"),
+        ("y", ""),
+    ],
+    FONT_SIZE_ANNOTATION,
+    52.0,
+    "～",
+)
+_month_container_open_tag = _container_open_tag("44mm", "0mm", "28mm")
+_period_container_open_tag = _container_open_tag("8mm", "2mm", "52mm")
+
+
+def _period(grdt: GregorianDateTime, with_year: bool) -> str:
+    """期閒の端のグレゴリオ曆の日時."""
+    prefix = f"{grdt.year}/" if with_year else ""
+    return (
+        f"{prefix}{grdt.month}/{grdt.day}({weekday_names[grdt.weekday - 1]})"
+        f"{grdt.hour:02}:{grdt.minute:02}:{grdt.second:02}"
+    )
+
+
+def _period_text(y: float, text: str) -> str:
+    """期閒の端の文字."""
+    return _text(
+        [
+            ("fill", GRAY),
+            ("font-size", ""),
+            ("text-anchor", "end"),
+            ("x", "100%"),
+            ("y", ""),
+        ],
+        FONT_SIZE_ANNOTATION,
+        y,
+        text,
+    )
+
+
+def _write_title(stream: t.TextIO, grid: MonthGrid) -> None:
+    """表題."""
+    stream.write(_title_text)
+    stream.write(
+        _text(
+            [("fill", BLACK), ("font-size", ""), ("x", "11mm"), ("y", "")],
+            FONT_SIZE_LARGE,
+            18.0,
+            f"{grid.year}年",
+        )
+    )
+    stream.write(_month_container_open_tag)
+    stream.write(
+        _text(
+            [
+                ("fill", BLACK),
+                ("font-family", FONT_FAMILY_BOLD),
+                ("font-size", ""),
+                ("text-anchor", "middle"),
+                ("x", "64%"),
+                ("y", ""),
+            ],
+            FONT_SIZE_BOLD_LARGE,
+            0.0,
+            f"{grid.month}月",
+        )
+    )
+    stream.write("</svg>")
+    stream.write(
+        _text(
+            [("fill", BLACK), ("font-size", ""), ("x", "9.5mm"), ("y", "")],
+            FONT_SIZE_LARGE,
+            42.0,
+            f"({japanese_month_names[grid.month - 1]}月)",
+        )
+    )
+    stream.write(_wave_dash_text)
+    stream.write(_period_container_open_tag)
+    stream.write(_period_text(0.0, _period(grid.start, True)))
+    stream.write(_period_text(4.0, _period(grid.end, grid.start.year != grid.end.year)))
+    stream.write("</svg>")
+
+
+# 日每に變はる要素の雛形. 値は `str.format` で埋める
+_small_text_template = _element(
+    "text",
+    [("fill", "{0}"), ("font-size", "10pt"), ("x", "{1}mm"), ("y", "{2}mm")],
+    "{3}",
+)
+_holiday_text_template = _element(
+    "text",
+    [
+        ("fill", "{0}"),
+        ("font-size", "8pt"),
+        ("style", "inline-size: {1}mm;"),
+        ("x", "{2}mm"),
+        ("y", "{3}mm"),
+    ],
+    "{4}",
+)
+_belt_line_template = _line("{0}mm", "{0}mm", "{1}mm", "{2}mm", STROKE_WIDTH_THIN)
+
+
+def _small_text(color: str, x: float, y: float, text: str) -> str:
+    """小さい文字."""
+    return _small_text_template.format(
+        color, _number(x), _number(y + FONT_SIZE_SMALL * 0.353), _escape(text)
+    )
+
+
+@lru_cache(maxsize=None)
+def _imdt_day_text(day: int, color: str) -> str:
+    """帝國火星曆の日."""
+    return _small_text(color, *_imdt_day_position(day), str(day))
+
+
+def _imdt_day_position(day: int) -> t.Tuple[float, float]:
+    """帝國火星曆の日を描く位置."""
+    x = WIDTH_LEFT_SPACE + 1 + SIZE_DAY_SQUARE * ((day - 1) % 7)
+    y = (
+        HEIGHT_TOP_SPACE
+        + 1
+        + (SIZE_DAY_SQUARE + HEIGHT_GRDT_BELT + HEIGHT_DAYS_GAP) * ((day - 1) // 7)
+    )
+    return (x, y)
+
+
+def _write_imdt_days(stream: t.TextIO, grid: MonthGrid) -> None:
+    """帝國火星曆の日と祝日."""
+    for sol in grid.sols:
+        if sol.is_holiday or sol.day % 7 == 1:
+            color = RED
+        elif sol.day % 7 == 0:
+            color = BLUE
+        else:
+            color = BLACK
+        stream.write(_imdt_day_text(sol.day, color))
+        if sol.is_holiday:
+            (x, y) = _imdt_day_position(sol.day)
+            day_width = FONT_SIZE_SMALL * (0.353 - 0.06) * len(str(sol.day))
+            stream.write(
+                _holiday_text_template.format(
+                    color,
+                    _number(SIZE_DAY_SQUARE - day_width - 1),
+                    _number(x + day_width),
+                    _number(y + 0.2 + FONT_SIZE_ANNOTATION * 0.353),
+                    _escape("・".join(sol.holiday_names)),
+                )
+            )
+
+
+def _line_x(grdt_day: MonthGridGregorianDay) -> float:
+    """グレゴリオ曆の日の始まりの、帝國火星曆の日の枠の中での位置."""
+    imdt = grdt_day.imdt
+    seconds = ((imdt.hour * 60 + imdt.minute) * 60 + imdt.second) / (24 * 60 * 60)
+    return seconds * SIZE_DAY_SQUARE
+
+
+def _write_grdt_days(stream: t.TextIO, grid: MonthGrid) -> None:
+    """グレゴリオ曆の日."""
+    belt_y = HEIGHT_TOP_SPACE + SIZE_DAY_SQUARE + 0.5
+    row_height = HEIGHT_GRDT_BELT + HEIGHT_DAYS_GAP + SIZE_DAY_SQUARE
+    month_header_width = 0.353 * FONT_SIZE_SMALL * (len("10/10") * 0.6) + 1.5
+    for i, grdt_day in enumerate(grid.grdt_days):
+        grdt = grdt_day.grdt
+        imdt = grdt_day.imdt
+        line_x = _line_x(grdt_day)
+        in_month = imdt.month == grid.month
+        column = (imdt.day - 1) % 7
+        if in_month:
+            y_base = (
+                HEIGHT_TOP_SPACE + SIZE_DAY_SQUARE + row_height * ((imdt.day - 1) // 7)
+            )
+            stream.write(
+                _belt_line_template.format(
+                    _number(WIDTH_LEFT_SPACE + line_x + SIZE_DAY_SQUARE * column),
+                    _number(y_base),
+                    _number(y_base + HEIGHT_GRDT_BELT),
+                )
+            )
+        # 翌日の始まりが月の外に出るのは月の最後の日だけで、其の時は見出しを描かない
+        can_draw_month_header = (
+            i + 1 < len(grid.grdt_days)
+            and _line_x(grid.grdt_days[i + 1]) > month_header_width
+        )
+        if grdt_day.is_holiday or grdt_day.weekday == 7:
+            color = GRAY_RED
+        elif grdt_day.weekday == 6:
+            color = GRAY_BLUE
+        else:
+            color = GRAY
+        if in_month:
+            if grdt.day == 1 or (imdt.day == 1 and not can_draw_month_header):
+                show_month_day = f"{grdt.month}/{grdt.day}"
+            else:
+                show_month_day = f"{grdt.day}"
+            can_draw_in_cell = (
+                SIZE_DAY_SQUARE - line_x
+                > 0.353 * FONT_SIZE_SMALL * (len(show_month_day) * 0.6) + 1.5
+            )
+            if imdt.day == grid.days and not can_draw_in_cell:
+                continue
+            if imdt.day % 7 == 0 and not can_draw_in_cell:
+                # 枠の右端に收まらなければ次の週の左端に描く
+                x = WIDTH_LEFT_SPACE + 1
+                row = math.ceil(imdt.day / 7)
+            else:
+                x = WIDTH_LEFT_SPACE + line_x + 1 + SIZE_DAY_SQUARE * column
+                row = (imdt.day - 1) // 7
+            stream.write(
+                _small_text(color, x, belt_y + row_height * row, show_month_day)
+            )
+        elif can_draw_month_header:
+            stream.write(
+                _small_text(
+                    color, WIDTH_LEFT_SPACE + 1, belt_y, f"{grdt.month}/{grdt.day}"
+                )
+            )
@@ -1,34 +1,78 @@
 """グレゴリオ曆の日時."""
 
+from imperial_calendar.internal.Frozen import Frozen  # __:skip
 import typing as t
 
 # __pragma__("skip")
-from datetime import date, datetime, timedelta, timezone as tz_c, tzinfo
+from datetime import date, MAXYEAR, MINYEAR, tzinfo
 from holiday_jp import HolidayJp
-from pytz import timezone as tz, utc
-import re
+from imperial_calendar.internal.timezone import fixed_offset_seconds, resolve_timezone
+from imperial_calendar.internal.TimezoneTransitions import (
+    TimezoneTransitions,
+    civil_to_seconds,
+    civil_to_seconds_array,
+    days_from_civil,
+    seconds_to_civil,
+    timezone_transitions,
+)
+import numpy as np
+import numpy.typing as npt
 
 # __pragma__("noskip")
 
 
 # __pragma__("skip")
 def parse_timezone(timezone: str) -> tzinfo:
-    """Parse timezone to offset."""
-    match = re.match(
-        r"^(?P<sign>[-+])(?P<hours>\d{1,2}):(?P<minutes>\d{1,2})$", timezone
+    """Parse timezone to offset. 解決した時閒帶は記憶して使ひ回す."""
+    return resolve_timezone(timezone)
+
+
+# __pragma__("noskip")
+
+
+# __pragma__("skip")
+def local_offsets_array(
+    timezone: str,
+    year: npt.ArrayLike,
+    month: npt.ArrayLike,
+    day: npt.ArrayLike,
+    hour: npt.ArrayLike,
+    minute: npt.ArrayLike,
+    second: npt.ArrayLike,
+) -> np.ndarray:
+    """地方時の日時の配列に對するUTCからのオフセット (秒) の配列を求める."""
+    offset = fixed_offset_seconds(timezone)
+    if offset is not None:
+        return np.full(np.shape(year), offset, dtype=np.float64)
+    return (
+        t.cast(TimezoneTransitions, timezone_transitions(timezone))
+        .local_offsets(civil_to_seconds_array(year, month, day, hour, minute, second))
+        .astype(np.float64)
+    )
+
+
+# __pragma__("noskip")
+
+
+# __pragma__("skip")
+def utc_offsets_array(
+    timezone: str,
+    year: npt.ArrayLike,
+    month: npt.ArrayLike,
+    day: npt.ArrayLike,
+    hour: npt.ArrayLike,
+    minute: npt.ArrayLike,
+    second: npt.ArrayLike,
+) -> np.ndarray:
+    """UTCの日時の配列に對する地方時のオフセット (秒) の配列を求める."""
+    offset = fixed_offset_seconds(timezone)
+    if offset is not None:
+        return np.full(np.shape(year), offset, dtype=np.float64)
+    return (
+        t.cast(TimezoneTransitions, timezone_transitions(timezone))
+        .utc_offsets(civil_to_seconds_array(year, month, day, hour, minute, second))
+        .astype(np.float64)
     )
-    if match:
-        if match.group("sign") == "-":
-            sign = -1
-        else:
-            sign = 1
-        return tz_c(
-            sign
-            * timedelta(
-                hours=int(match.group("hours")), minutes=int(match.group("minutes"))
-            )
-        )
-    return tz(timezone)
 
 
 # __pragma__("noskip")
@@ -37,6 +81,8 @@ def parse_timezone(timezone: str) -> tzinfo:
 class GregorianDateTime(object):
     """グレゴリオ曆の日時."""
 
+    __slots__ = ("year", "month", "day", "hour", "minute", "second", "timezone")
+
     dummy = 42
 
     # __pragma__("skip")
@@ -45,40 +91,42 @@ class GregorianDateTime(object):
         cls, grdt: "GregorianDateTime", timezone: str
     ) -> "GregorianDateTime":
         """From UTC naive GregorianDateTime."""
+        from imperial_calendar.JulianDay import JulianDay
         from imperial_calendar.transform import grdt_to_juld, juld_to_grdt
 
         if not (grdt.timezone is None):
-            raise Exception(f"This is not naive: {grdt.__dict__}")
-        parsed_tz = parse_timezone(timezone)
-        if hasattr(parsed_tz, "localize") and callable(
-            t.cast(t.Any, parsed_tz).localize
-        ):
-            dt = datetime(
-                grdt.year,
-                grdt.month,
-                grdt.day,
-                grdt.hour,
-                grdt.minute,
-                grdt.second,
-                tzinfo=utc,
+            raise Exception(f"This is not naive: {grdt!r}")
+        offset = fixed_offset_seconds(timezone)
+        if offset is None:
+            utc_seconds = civil_to_seconds(
+                grdt.year, grdt.month, grdt.day, grdt.hour, grdt.minute, grdt.second
             )
-            dt = dt.astimezone(parsed_tz)
-            return cls(
-                dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, timezone
+            civil = seconds_to_civil(
+                utc_seconds
+                + t.cast(
+                    TimezoneTransitions, timezone_transitions(timezone)
+                ).utc_offset(utc_seconds)
             )
+            return cls(*civil, timezone)
         juld = grdt_to_juld(grdt)
-        juld.second += (
-            parsed_tz.utcoffset(datetime(1970, 1, 1, 0, 0, 0)) or timedelta(0)
-        ).total_seconds()
-        if juld.second < 0.0:
-            juld.day -= 1
-            juld.second += 24.0 * 60.0 * 60.0
-        elif juld.second >= 24.0 * 60.0 * 60.0:
-            juld.day += 1
-            juld.second -= 24.0 * 60.0 * 60.0
-        grdt = juld_to_grdt(juld)
-        grdt.timezone = timezone
-        return grdt
+        day = juld.day
+        second = juld.second + offset
+        if second < 0.0:
+            day -= 1
+            second += 24.0 * 60.0 * 60.0
+        elif second >= 24.0 * 60.0 * 60.0:
+            day += 1
+            second -= 24.0 * 60.0 * 60.0
+        grdt = juld_to_grdt(JulianDay(day, second))
+        return cls(
+            grdt.year,
+            grdt.month,
+            grdt.day,
+            grdt.hour,
+            grdt.minute,
+            grdt.second,
+            timezone,
+        )
 
     # __pragma__("noskip")
 
@@ -103,7 +151,31 @@ class GregorianDateTime(object):
 
     def __eq__(self, other: object) -> bool:
         """Eq."""
-        return isinstance(other, GregorianDateTime) and self.__dict__ == other.__dict__
+        return (
+            isinstance(other, GregorianDateTime)
+            and self.year == other.year
+            and self.month == other.month
+            and self.day == other.day
+            and self.hour == other.hour
+            and self.minute == other.minute
+            and self.second == other.second
+            and self.timezone == other.timezone
+        )
+
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (
+            self.__class__,
+            (
+                self.year,
+                self.month,
+                self.day,
+                self.hour,
+                self.minute,
+                self.second,
+                self.timezone,
+            ),
+        )
 
     def __repr__(self) -> str:
         """Representation."""
@@ -132,7 +204,9 @@ class GregorianDateTime(object):
     # __pragma__("skip")
     @property
     def is_holiday(self) -> bool:
-        """Return the day is a holiday or not."""
+        """Return the day is a holiday or not. `date` で表せない年に祝日は無い."""
+        if not MINYEAR <= self.year <= MAXYEAR:
+            return False
         return HolidayJp(date(self.year, self.month, self.day)).is_holiday
 
     # __pragma__("noskip")
@@ -142,57 +216,95 @@ class GregorianDateTime(object):
     def offset(self) -> float:
         """Offset hours from UTC."""
         if self.timezone is None:
-            raise Exception(f"This is naive: {self.__dict__}")
-        timezone = parse_timezone(self.timezone)
-        if hasattr(timezone, "localize") and callable(t.cast(t.Any, timezone).localize):
-            td = timezone.utcoffset(
-                datetime(
+            raise Exception(f"This is naive: {self!r}")
+        offset = fixed_offset_seconds(self.timezone)
+        if offset is None:
+            offset = t.cast(
+                TimezoneTransitions, timezone_transitions(self.timezone)
+            ).local_offset(
+                civil_to_seconds(
                     self.year, self.month, self.day, self.hour, self.minute, self.second
-                )
-            ) or timedelta(0)
-        else:
-            td = timezone.utcoffset(datetime(1970, 1, 1, 0, 0, 0)) or timedelta(0)
-        return td.total_seconds() / (60.0 * 60.0)
+                ),
+                None,
+            )
+        return offset / (60.0 * 60.0)
 
     # __pragma__("noskip")
 
     # __pragma__("skip")
     def to_utc_naive(self) -> "GregorianDateTime":
         """Convert to naive GregorianDateTime as UTC."""
+        from imperial_calendar.JulianDay import JulianDay
         from imperial_calendar.transform import grdt_to_juld, juld_to_grdt
 
         if self.timezone is None:
-            raise Exception(f"This is naive: {self.__dict__}")
-        parsed_tz = parse_timezone(self.timezone)
-        if hasattr(parsed_tz, "localize") and callable(
-            t.cast(t.Any, parsed_tz).localize
-        ):
-            dt: datetime = t.cast(t.Any, parsed_tz).localize(
-                datetime(
-                    self.year, self.month, self.day, self.hour, self.minute, self.second
-                )
+            raise Exception(f"This is naive: {self!r}")
+        offset = fixed_offset_seconds(self.timezone)
+        if offset is None:
+            local_seconds = civil_to_seconds(
+                self.year, self.month, self.day, self.hour, self.minute, self.second
             )
-            dt = dt.astimezone(utc)
-            return self.__class__(
-                dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, None
+            civil = seconds_to_civil(
+                local_seconds
+                - t.cast(
+                    TimezoneTransitions, timezone_transitions(self.timezone)
+                ).local_offset(local_seconds)
             )
-        grdt = self.copy()
-        grdt.timezone = None
-        juld = grdt_to_juld(grdt)
-        juld.second -= (
-            parsed_tz.utcoffset(datetime(1970, 1, 1, 0, 0, 0)) or timedelta(0)
-        ).total_seconds()
-        if juld.second < 0.0:
-            juld.day -= 1
-            juld.second += 24.0 * 60.0 * 60.0
-        elif juld.second >= 24.0 * 60.0 * 60.0:
-            juld.day += 1
-            juld.second -= 24.0 * 60.0 * 60.0
-        return juld_to_grdt(juld)
+            return self.__class__(*civil, None)
+        juld = grdt_to_juld(
+            GregorianDateTime(
+                self.year,
+                self.month,
+                self.day,
+                self.hour,
+                self.minute,
+                self.second,
+                None,
+            )
+        )
+        day = juld.day
+        second = juld.second - offset
+        if second < 0.0:
+            day -= 1
+            second += 24.0 * 60.0 * 60.0
+        elif second >= 24.0 * 60.0 * 60.0:
+            day += 1
+            second -= 24.0 * 60.0 * 60.0
+        grdt = juld_to_grdt(JulianDay(day, second))
+        return self.__class__(
+            grdt.year, grdt.month, grdt.day, grdt.hour, grdt.minute, grdt.second, None
+        )
 
     # __pragma__("noskip")
 
     @property
     def weekday(self) -> int:
         """Caliculate the ISO week day. Monday is 1 then Sunday is 7."""
-        return date(self.year, self.month, self.day).isoweekday()
+        # 1970年1月1日は木曜
+        return (days_from_civil(self.year, self.month, self.day) + 3) % 7 + 1
+
+
+# __pragma__("skip")
+class FrozenGregorianDateTime(Frozen, GregorianDateTime):
+    """不變なグレゴリオ曆の日時. hashを持つのでdictのkeyやsetの要素にできる."""
+
+    __slots__ = ("_hash",)
+
+    _fields = ("year", "month", "day", "hour", "minute", "second", "timezone")
+
+    def __init__(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        second: int,
+        timezone: t.Optional[str],
+    ) -> None:
+        """Init."""
+        super().__init__(year, month, day, hour, minute, second, timezone)
+        self._freeze((year, month, day, hour, minute, second, timezone))
+
+
+# __pragma__("noskip")
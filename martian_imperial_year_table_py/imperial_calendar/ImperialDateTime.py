@@ -1,23 +1,61 @@
 """帝國火星曆の日時."""
 
+from imperial_calendar.internal.consts import imperial_millennium_days  # __:skip
+from imperial_calendar.internal.consts import imperial_month_to_imsn_table  # __:skip
+from imperial_calendar.internal.consts import imperial_year_to_imsn_table  # __:skip
+from imperial_calendar.internal.Frozen import Frozen  # __:skip
 from imperial_calendar.internal.HolidayMars import HolidayMars  # __:skip
-import re  # __:skip
+from imperial_calendar.internal.timezone import offset_hours  # __:skip
 import typing as t
 
+# 月名. n月の名は、火星中心太陽黃經が (315 + 15 * (n - 1)) % 360 度から始まる二十四節氣の名
+japanese_month_names = [
+    "立春",
+    "雨水",
+    "啓蟄",
+    "春分",
+    "清明",
+    "穀雨",
+    "立夏",
+    "小滿",
+    "芒種",
+    "夏至",
+    "小暑",
+    "大暑",
+    "立秋",
+    "處暑",
+    "白露",
+    "秋分",
+    "寒露",
+    "霜降",
+    "立冬",
+    "小雪",
+    "大雪",
+    "冬至",
+    "小寒",
+    "大寒",
+]
+
 
 # __pragma__("skip")
 def parse_timezone(timezone: str) -> float:
-    """Parse timezone to offset."""
-    match = re.match(
-        r"^(?P<sign>[-+])(?P<hours>\d{1,2}):(?P<minutes>\d{1,2})$", timezone
-    )
-    if match:
-        if match.group("sign") == "-":
-            sign = -1.0
-        else:
-            sign = 1.0
-        return sign * (int(match.group("hours")) + (int(match.group("minutes")) / 60.0))
-    raise Exception(f"Unknown timezone format: {timezone}")
+    """Parse timezone to offset. 解析した結果は記憶して使ひ回す."""
+    return offset_hours(timezone)
+
+
+# __pragma__("noskip")
+
+
+# __pragma__("skip")
+def format_timezone(offset: float) -> str:
+    """Format offset hours to timezone."""
+    minutes = round(offset * 60.0)
+    if minutes < 0:
+        sign = "-"
+    else:
+        sign = "+"
+    (hours, minutes) = divmod(abs(minutes), 60)
+    return f"{sign}{hours:02d}:{minutes:02d}"
 
 
 # __pragma__("noskip")
@@ -26,6 +64,16 @@ def parse_timezone(timezone: str) -> float:
 class ImperialDateTime(object):
     """帝國火星曆の日時."""
 
+    __slots__ = (
+        "year",
+        "month",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "timezone",
+    )
+
     dummy = 42
 
     # __pragma__("skip")
@@ -34,21 +82,30 @@ class ImperialDateTime(object):
         cls, imdt: "ImperialDateTime", timezone=str
     ) -> "ImperialDateTime":
         """From standard timezone naive ImperialDateTime."""
+        from imperial_calendar.ImperialSolNumber import ImperialSolNumber
         from imperial_calendar.transform import imdt_to_imsn, imsn_to_imdt
 
         if not (imdt.timezone is None):
-            raise Exception(f"This is not naive: {imdt.__dict__}")
+            raise Exception(f"This is not naive: {imdt!r}")
         imsn = imdt_to_imsn(imdt)
-        imsn.second += parse_timezone(timezone) * 60.0 * 60.0
-        if imsn.second < 0:
-            imsn.day -= 1
-            imsn.second += 24.0 * 60.0 * 60.0
-        elif imsn.second >= 24.0 * 60.0 * 60.0:
-            imsn.day += 1
-            imsn.second -= 24.0 * 60.0 * 60.0
-        imdt = imsn_to_imdt(imsn)
-        imdt.timezone = timezone
-        return imdt
+        day = imsn.day
+        second = imsn.second + parse_timezone(timezone) * 60.0 * 60.0
+        if second < 0:
+            day -= 1
+            second += 24.0 * 60.0 * 60.0
+        elif second >= 24.0 * 60.0 * 60.0:
+            day += 1
+            second -= 24.0 * 60.0 * 60.0
+        imdt = imsn_to_imdt(ImperialSolNumber(day, second))
+        return cls(
+            imdt.year,
+            imdt.month,
+            imdt.day,
+            imdt.hour,
+            imdt.minute,
+            imdt.second,
+            timezone,
+        )
 
     # __pragma__("noskip")
 
@@ -72,44 +129,61 @@ class ImperialDateTime(object):
         self.timezone: t.Optional[str] = timezone
 
     def __eq__(self, other: object) -> bool:
-        """Eq."""
-        return isinstance(other, ImperialDateTime) and self.__dict__ == other.__dict__
+        """
+        Eq. 時閒帶を含めて各欄が等しい時に等しい.
+
+        大小の比較は時閒帶に依らず瞬閒の前後で行ふので、時閒帶の違ふ同じ瞬閒は `<=` と `>=` とが眞でも等しくない.
+        同じ瞬閒かを調べるには `sort_key` を比べる.
+        """
+        return (
+            isinstance(other, ImperialDateTime)
+            and self.year == other.year
+            and self.month == other.month
+            and self.day == other.day
+            and self.hour == other.hour
+            and self.minute == other.minute
+            and self.second == other.second
+            and self.timezone == other.timezone
+        )
 
     # NOTE: Can't apply `@functools.total_ordering` because of Transcrypt.
+    # NOTE: 大小の比較は `sort_key` (瞬閒) で、等値は `__eq__` (各欄) で判定する. 時閒帶の違ふ同じ瞬閒は等しくない.
+    # __pragma__("skip")
+    def __ge__(self, other: "ImperialDateTime") -> bool:
+        """Greater than or equal."""
+        return self.sort_key >= other.sort_key
+
+    def __gt__(self, other: "ImperialDateTime") -> bool:
+        """Greater than."""
+        return self.sort_key > other.sort_key
+
+    def __hash__(self) -> int:
+        """Hash. 變更したobjectのhashは變はるので、setやdictに入れたまま變更しない事."""
+        return hash(self.sort_key)
+
+    def __le__(self, other: "ImperialDateTime") -> bool:
+        """Less than or equal."""
+        return self.sort_key <= other.sort_key
+
     def __lt__(self, other: "ImperialDateTime") -> bool:
         """Less than."""
-        me = self
-        if me.timezone is not None:
-            me = me.to_standard_naive()
-        if other.timezone is not None:
-            other = other.to_standard_naive()
-        return me.year < other.year or (
-            me.year == other.year
-            and (
-                me.month < other.month
-                or (
-                    me.month == other.month
-                    and (
-                        me.day < other.day
-                        or (
-                            me.day == other.day
-                            and (
-                                me.hour < other.hour
-                                or (
-                                    me.hour == other.hour
-                                    and (
-                                        me.minute < other.minute
-                                        or (
-                                            me.minute == other.minute
-                                            and me.second < other.second
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                )
-            )
+        return self.sort_key < other.sort_key
+
+    # __pragma__("noskip")
+
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (
+            self.__class__,
+            (
+                self.year,
+                self.month,
+                self.day,
+                self.hour,
+                self.minute,
+                self.second,
+                self.timezone,
+            ),
         )
 
     def __repr__(self) -> str:
@@ -140,7 +214,7 @@ class ImperialDateTime(object):
     @property
     def holiday(self) -> t.Optional[HolidayMars]:
         """Return the day is a holiday or not."""
-        holiday = HolidayMars(self.year, self.month, self.day)
+        holiday = HolidayMars.of(self.year, self.month, self.day)
         if not holiday.is_holiday:
             return None
         return holiday
@@ -150,60 +224,106 @@ class ImperialDateTime(object):
     @property
     def japanese_month_name(self) -> str:
         """Give a translation to the Japanese (is almose equal to Kwaseg-go) month name."""
-        return [
-            "立春",
-            "雨水",
-            "啓蟄",
-            "春分",
-            "清明",
-            "穀雨",
-            "立夏",
-            "小滿",
-            "芒種",
-            "夏至",
-            "小暑",
-            "大暑",
-            "立秋",
-            "處暑",
-            "白露",
-            "秋分",
-            "寒露",
-            "霜降",
-            "立冬",
-            "小雪",
-            "大雪",
-            "冬至",
-            "小寒",
-            "大寒",
-        ][self.month - 1]
+        return japanese_month_names[self.month - 1]
 
     # __pragma__("skip")
     @property
     def offset(self) -> float:
         """Parse timezone to offset."""
         if self.timezone is None:
-            raise Exception(f"This is naive: {self.__dict__}")
+            raise Exception(f"This is naive: {self!r}")
         return parse_timezone(self.timezone)
 
     # __pragma__("noskip")
 
+    # __pragma__("skip")
+    @property
+    def sort_key(self) -> int:
+        """
+        標準時の通算秒. 時閒帶に依らず同じ瞬閒なら等しい.
+
+        時閒帶を持たない日時は標準時として扱ふ.
+        """
+        days = (
+            self.year // 1000 * imperial_millennium_days
+            + imperial_year_to_imsn_table[self.year % 1000]
+            + imperial_month_to_imsn_table[self.month - 1]
+            + (self.day - 1)
+        )
+        sort_key = (
+            days * 24 * 60 * 60 + self.hour * 60 * 60 + self.minute * 60 + self.second
+        )
+        if self.timezone is not None:
+            sort_key -= round(parse_timezone(self.timezone) * 60 * 60)
+        return sort_key
+
+    # __pragma__("noskip")
+
     # __pragma__("skip")
     def to_standard_naive(self) -> "ImperialDateTime":
         """Convert to naive ImperialDateTime as standard timezone."""
+        from imperial_calendar.ImperialSolNumber import ImperialSolNumber
         from imperial_calendar.transform import imdt_to_imsn, imsn_to_imdt
 
         if self.timezone is None:
-            raise Exception(f"This is naive: {self.__dict__}")
-        imdt = self.copy()
-        imdt.timezone = None
-        imsn = imdt_to_imsn(imdt)
-        imsn.second -= self.offset * 60.0 * 60.0
-        if imsn.second < 0:
-            imsn.day -= 1
-            imsn.second += 24.0 * 60.0 * 60.0
-        elif imsn.second >= 24.0 * 60.0 * 60.0:
-            imsn.day += 1
-            imsn.second -= 24.0 * 60.0 * 60.0
-        return imsn_to_imdt(imsn)
+            raise Exception(f"This is naive: {self!r}")
+        imsn = imdt_to_imsn(
+            ImperialDateTime(
+                self.year,
+                self.month,
+                self.day,
+                self.hour,
+                self.minute,
+                self.second,
+                None,
+            )
+        )
+        day = imsn.day
+        second = imsn.second - self.offset * 60.0 * 60.0
+        if second < 0:
+            day -= 1
+            second += 24.0 * 60.0 * 60.0
+        elif second >= 24.0 * 60.0 * 60.0:
+            day += 1
+            second -= 24.0 * 60.0 * 60.0
+        imdt = imsn_to_imdt(ImperialSolNumber(day, second))
+        return self.__class__(
+            imdt.year, imdt.month, imdt.day, imdt.hour, imdt.minute, imdt.second, None
+        )
 
     # __pragma__("noskip")
+
+
+# __pragma__("skip")
+class FrozenImperialDateTime(Frozen, ImperialDateTime):
+    """不變な帝國火星曆の日時. hashを持つのでdictのkeyやsetの要素にできる."""
+
+    __slots__ = ("_hash", "_sort_key")
+
+    _fields = ("year", "month", "day", "hour", "minute", "second", "timezone")
+
+    _sort_key: int
+
+    def __init__(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        second: int,
+        timezone: t.Optional[str],
+    ) -> None:
+        """Init."""
+        super().__init__(year, month, day, hour, minute, second, timezone)
+        object.__setattr__(self, "_sort_key", super().sort_key)
+        # 等値なImperialDateTimeとhashが等しくなる樣に、sort_keyで計算する
+        self._freeze(self._sort_key)
+
+    @property
+    def sort_key(self) -> int:
+        """標準時の通算秒. 凍結する時に計算して記憶する."""
+        return self._sort_key
+
+
+# __pragma__("noskip")
@@ -0,0 +1,194 @@
+"""帝國火星曆の日時の配列."""
+
+from imperial_calendar.ImperialDateTime import (
+    ImperialDateTime,
+    format_timezone,
+    parse_timezone,
+)
+from imperial_calendar.internal.array import normalize_day
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn_array
+from imperial_calendar.transform.imsn_to_imdt import imsn_to_imdt_array
+import numpy as np
+import numpy.typing as npt
+import typing as t
+
+
+class ImperialDateTimeArray(object):
+    """
+    帝國火星曆の日時の配列.
+
+    年月日時分秒を其々一本の型附きの列 (NumPy配列) に持ち、行毎の `ImperialDateTime` を作らない.
+    時閒帶は全行で共有する timezone か、行毎の offsets (時閒) の何れかで持つ.
+    """
+
+    __slots__ = (
+        "year",
+        "month",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "timezone",
+        "_offsets",
+    )
+
+    @classmethod
+    def from_imperial_date_times(
+        cls, imdts: t.Iterable[ImperialDateTime]
+    ) -> "ImperialDateTimeArray":
+        """ImperialDateTimeの列から作る. 時閒帶が全て同じならtimezoneを共有する."""
+        imdts = list(imdts)
+        year = [imdt.year for imdt in imdts]
+        month = [imdt.month for imdt in imdts]
+        day = [imdt.day for imdt in imdts]
+        hour = [imdt.hour for imdt in imdts]
+        minute = [imdt.minute for imdt in imdts]
+        second = [imdt.second for imdt in imdts]
+        timezones = {imdt.timezone for imdt in imdts}
+        if len(timezones) <= 1:
+            return cls(
+                year, month, day, hour, minute, second, next(iter(timezones), None)
+            )
+        if None in timezones:
+            raise Exception("Cannot mix naive and aware ImperialDateTime.")
+        return cls(
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            offsets=[imdt.offset for imdt in imdts],
+        )
+
+    @classmethod
+    def from_imperial_sol_numbers(
+        cls,
+        day: npt.ArrayLike,
+        second: npt.ArrayLike,
+        timezone: t.Optional[str] = None,
+        offsets: t.Optional[npt.ArrayLike] = None,
+    ) -> "ImperialDateTimeArray":
+        """標準時の通算日の配列 (日, 秒) から、timezoneまたはoffsetsの地方時の日時の配列を作る."""
+        day = np.asarray(day, dtype=np.int64)
+        second = np.asarray(second, dtype=np.float64)
+        if timezone is not None:
+            second = second + parse_timezone(timezone) * 60.0 * 60.0
+            (day, second) = normalize_day(day, second)
+        elif offsets is not None:
+            second = second + np.asarray(offsets, dtype=np.float64) * 60.0 * 60.0
+            (day, second) = normalize_day(day, second)
+        return cls(*imsn_to_imdt_array(day, second), timezone=timezone, offsets=offsets)
+
+    def __init__(
+        self,
+        year: npt.ArrayLike,
+        month: npt.ArrayLike,
+        day: npt.ArrayLike,
+        hour: npt.ArrayLike,
+        minute: npt.ArrayLike,
+        second: npt.ArrayLike,
+        timezone: t.Optional[str] = None,
+        offsets: t.Optional[npt.ArrayLike] = None,
+    ) -> None:
+        """Init."""
+        if timezone is not None and offsets is not None:
+            raise Exception("Give either timezone or offsets.")
+        (year, month, day, hour, minute, second) = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(field))
+                for field in (year, month, day, hour, minute, second)
+            )
+        )
+        if year.ndim != 1:
+            raise Exception(f"Columns must be 1-dimensional: {year.shape}")
+        self.year: np.ndarray = year.astype(np.int64)
+        self.month: np.ndarray = month.astype(np.int8)
+        self.day: np.ndarray = day.astype(np.int8)
+        self.hour: np.ndarray = hour.astype(np.int8)
+        self.minute: np.ndarray = minute.astype(np.int8)
+        self.second: np.ndarray = second.astype(np.int8)
+        self.timezone: t.Optional[str] = timezone
+        self._offsets: t.Optional[np.ndarray] = None
+        if offsets is not None:
+            self._offsets = np.broadcast_to(
+                np.asarray(offsets, dtype=np.float64), self.year.shape
+            )
+
+    def __getitem__(
+        self, key: t.Union[int, slice, t.Sequence[int], np.ndarray]
+    ) -> t.Union[ImperialDateTime, "ImperialDateTimeArray"]:
+        """添字ならImperialDateTimeを、sliceや添字の配列なら其の行のImperialDateTimeArrayを返す."""
+        if isinstance(key, (int, np.integer)):
+            return ImperialDateTime(
+                int(self.year[key]),
+                int(self.month[key]),
+                int(self.day[key]),
+                int(self.hour[key]),
+                int(self.minute[key]),
+                int(self.second[key]),
+                self.timezone_at(int(key)),
+            )
+        offsets = None
+        if self._offsets is not None:
+            offsets = self._offsets[key]
+        return self.__class__(
+            self.year[key],
+            self.month[key],
+            self.day[key],
+            self.hour[key],
+            self.minute[key],
+            self.second[key],
+            self.timezone,
+            offsets,
+        )
+
+    def __iter__(self) -> t.Iterator[ImperialDateTime]:
+        """ImperialDateTimeを一つづつ作って返す."""
+        for i in range(len(self)):
+            yield t.cast(ImperialDateTime, self[i])
+
+    def __len__(self) -> int:
+        """Length."""
+        return len(self.year)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        if self._offsets is not None:
+            timezone = "offsets"
+        else:
+            timezone = repr(self.timezone)
+        return f"ImperialDateTimeArray(len={len(self)}, timezone={timezone})"
+
+    @property
+    def is_naive(self) -> bool:
+        """時閒帶を持たない."""
+        return self.timezone is None and self._offsets is None
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """行毎の標準時からのオフセット (時閒) の配列."""
+        if self._offsets is not None:
+            return self._offsets
+        if self.timezone is None:
+            raise Exception(f"This is naive: {self!r}")
+        return np.full(self.year.shape, parse_timezone(self.timezone))
+
+    def timezone_at(self, index: int) -> t.Optional[str]:
+        """其の行の時閒帶."""
+        if self._offsets is not None:
+            return format_timezone(float(self._offsets[index]))
+        return self.timezone
+
+    def to_imperial_sol_numbers(self) -> t.Tuple[np.ndarray, np.ndarray]:
+        """標準時の通算日の配列 (日, 秒) に變換する."""
+        (day, second) = imdt_to_imsn_array(
+            self.year, self.month, self.day, self.hour, self.minute, self.second
+        )
+        if self.is_naive:
+            return (day, second)
+        return normalize_day(day, second - self.offsets * 60.0 * 60.0)
+
+    def to_standard_naive(self) -> "ImperialDateTimeArray":
+        """標準時の時閒帶を持たない日時の配列に變換する."""
+        return self.__class__(*imsn_to_imdt_array(*self.to_imperial_sol_numbers()))
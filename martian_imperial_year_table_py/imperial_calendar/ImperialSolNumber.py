@@ -1,5 +1,6 @@
 """帝國火星曆の通算日."""
 
+from imperial_calendar.internal.Frozen import Frozen  # __:skip
 import math
 import typing as t
 
@@ -7,6 +8,8 @@ import typing as t
 class ImperialSolNumber(object):
     """帝國火星曆の通算日."""
 
+    __slots__ = ("day", "second")
+
     def __init__(self, day: t.Union[float, int], second=0.0) -> None:
         """Init."""
         if isinstance(day, float):
@@ -34,6 +37,10 @@ class ImperialSolNumber(object):
             abs_tol=0.000005,
         )
 
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (self.__class__, (self.day, self.second))
+
     def __repr__(self) -> str:
         """Representation."""
         return f"ImperialSolNumber({self.day}, {self.second})"
@@ -42,3 +49,24 @@ class ImperialSolNumber(object):
     def imperial_sol_number(self) -> float:
         """秒を考慮したImperial Sol Numberを計算する."""
         return self.day + (self.second / (60.0 * 60.0 * 24.0))
+
+
+# __pragma__("skip")
+class FrozenImperialSolNumber(Frozen, ImperialSolNumber):
+    """
+    不變な帝國火星曆の通算日. hashを持つのでdictのkeyやsetの要素にできる.
+
+    等値性は小數部の近さで判定するので、hashは整數部のみから計算する.
+    """
+
+    __slots__ = ("_hash",)
+
+    _fields = ("day", "second")
+
+    def __init__(self, day: t.Union[float, int], second=0.0) -> None:
+        """Init."""
+        super().__init__(day, second)
+        self._freeze(math.floor(self.imperial_sol_number))
+
+
+# __pragma__("noskip")
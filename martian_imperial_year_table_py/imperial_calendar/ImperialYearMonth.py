@@ -1,12 +1,22 @@
 """帝國火星曆の年月."""
 
+from imperial_calendar.internal.Frozen import Frozen  # __:skip
 from imperial_calendar.internal.ImperialMonth import ImperialMonth
 from imperial_calendar.internal.ImperialYear import ImperialYear
+import typing as t
+
+# __pragma__("skip")
+if t.TYPE_CHECKING:
+    from imperial_calendar.internal.MonthGrid import MonthGrid
+
+# __pragma__("noskip")
 
 
 class ImperialYearMonth(object):
     """帝國火星曆の年月."""
 
+    __slots__ = ("month", "year")
+
     def __init__(self, year: int, month: int):
         """Init."""
         self.month = month
@@ -14,7 +24,15 @@ class ImperialYearMonth(object):
 
     def __eq__(self, other: object) -> bool:
         """Eq."""
-        return isinstance(other, ImperialYearMonth) and self.__dict__ == other.__dict__
+        return (
+            isinstance(other, ImperialYearMonth)
+            and self.year == other.year
+            and self.month == other.month
+        )
+
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (self.__class__, (self.year, self.month))
 
     def __repr__(self) -> str:
         """Repr."""
@@ -27,6 +45,17 @@ class ImperialYearMonth(object):
             days += 1
         return days
 
+    # __pragma__("skip")
+    def grid(
+        self, grdt_timezone: str, imdt_timezone: t.Optional[str] = None
+    ) -> "MonthGrid":
+        """Return the calendar grid of the month. 結果は (年, 月, 時閒帶) 每に記憶する."""
+        from imperial_calendar.internal.MonthGrid import month_grid
+
+        return month_grid(self.year, self.month, grdt_timezone, imdt_timezone)
+
+    # __pragma__("noskip")
+
     def next_month(self) -> "ImperialYearMonth":
         """Return the next month."""
         if self.month == 24:
@@ -38,3 +67,20 @@ class ImperialYearMonth(object):
         if self.month == 1:
             return ImperialYearMonth(self.year - 1, 24)
         return ImperialYearMonth(self.year, self.month - 1)
+
+
+# __pragma__("skip")
+class FrozenImperialYearMonth(Frozen, ImperialYearMonth):
+    """不變な帝國火星曆の年月. hashを持つのでdictのkeyやsetの要素にできる."""
+
+    __slots__ = ("_hash",)
+
+    _fields = ("year", "month")
+
+    def __init__(self, year: int, month: int):
+        """Init."""
+        super().__init__(year, month)
+        self._freeze((year, month))
+
+
+# __pragma__("noskip")
@@ -1,14 +1,27 @@
 """ユリウス通日."""
 
+from imperial_calendar.internal.consts import delta_t_breakpoint_years  # __:skip
+from imperial_calendar.internal.consts import delta_t_polynomials  # __:skip
+from imperial_calendar.internal.DeltaTCache import delta_t_cache  # __:skip
+from imperial_calendar.internal.DeltaTCache import delta_t_polynomial  # __:skip
+from imperial_calendar.internal.DeltaTCache import evaluate_delta_t  # __:skip
+from imperial_calendar.internal.Frozen import Frozen  # __:skip
 import math
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
 import typing as t
 
 
 # __pragma__("skip")
 def julian_day_to_julian_year(juld) -> float:
     """ユリウス通日をユリウス年表示に變換する."""
+    return julian_year_number(juld.julian_day)
+
+
+def julian_year_number(julian_day: float) -> float:
+    """ユリウス通日 (float) をユリウス年表示に變換する."""
     julian_day_to_julian_year_intercept = 1721117.5
-    tweaked_julian_day = juld.julian_day - julian_day_to_julian_year_intercept
+    tweaked_julian_day = julian_day - julian_day_to_julian_year_intercept
     # ユリウス曆0年3月1日正子を0とする通算日數を計算。
     quadrennium = divmod(tweaked_julian_day, (365 * 4 + 1))
     if quadrennium[1] < 365:
@@ -38,21 +51,23 @@ def julian_day_to_julian_year(juld) -> float:
 # __pragma__("noskip")
 
 
+# __pragma__("skip")
+def julian_day_to_delta_t(julian_day: float) -> float:
+    """ユリウス通日 (float) からΔTを算出する. JulianDayを作らない."""
+    if julian_day < JulianDay.calendar_reform:
+        year_number = julian_year_number(julian_day)
+        return evaluate_delta_t(delta_t_polynomial(year_number), year_number)
+    return delta_t_cache.of(julian_day).delta_t(julian_day)
+
+
+# __pragma__("noskip")
+
+
 # __pragma__("skip")
 def julian_day_to_gregorian_year(juld) -> float:
     """ユリウス通日をグレゴリオ年表示に變換する."""
-    from imperial_calendar.GregorianDateTime import GregorianDateTime
-    from imperial_calendar.transform.grdt_to_juld import grdt_to_juld
-    from imperial_calendar.transform.juld_to_grdt import juld_to_grdt
-
-    year = juld_to_grdt(juld).year
-    january_1st = grdt_to_juld(GregorianDateTime(year, 1, 1, 0, 0, 0, None))
-    next_january_1st = grdt_to_juld(GregorianDateTime(year + 1, 1, 1, 0, 0, 0, None))
-    # 年內日數の小數表示
-    annual_day = (juld.julian_day - january_1st.julian_day) / (
-        next_january_1st.julian_day - january_1st.julian_day
-    )
-    return year + annual_day
+    julian_day = juld.julian_day
+    return delta_t_cache.of(julian_day).year_number(julian_day)
 
 
 # __pragma__("noskip")
@@ -61,6 +76,8 @@ def julian_day_to_gregorian_year(juld) -> float:
 class JulianDay(object):
     """ユリウス通日."""
 
+    __slots__ = ("day", "second")
+
     calendar_reform = 2299160.5
 
     def __init__(self, day: t.Union[float, int], second=0.0) -> None:
@@ -82,10 +99,14 @@ class JulianDay(object):
         """Eq."""
         if not isinstance(other, JulianDay):
             return False
-        return self.day == self.day and math.isclose(
-            self.second, self.second, abs_tol=0.5
+        return self.day == other.day and math.isclose(
+            self.second, other.second, abs_tol=0.5
         )
 
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (self.__class__, (self.day, self.second))
+
     def __repr__(self) -> str:
         """Representation."""
         return f"JulianDay({self.day, self.second})"
@@ -93,120 +114,12 @@ class JulianDay(object):
     # __pragma__("skip")
     @property
     def delta_t(self) -> float:
-        """ユリウス通日からΔTを算出する."""
-        if self.julian_day < self.calendar_reform:
-            year_number = julian_day_to_julian_year(self)
-        else:
-            year_number = julian_day_to_gregorian_year(self)
-        if year_number < -500:
-            delta_u = (year_number - 1820) / 100
-            return -20 + 32 * delta_u**2
-        elif year_number < 500:
-            delta_u = year_number / 100
-            return (
-                10583.6
-                - 1014.41 * delta_u
-                + 33.78311 * delta_u**2
-                - 5.952053 * delta_u**3
-                - 0.1798452 * delta_u**4
-                + 0.022174192 * delta_u**5
-                + 0.0090316521 * delta_u**6
-            )
-        elif year_number < 1600:
-            delta_u = (year_number - 1000) / 100
-            return (
-                1574.2
-                - 556.01 * delta_u
-                + 71.23472 * delta_u**2
-                + 0.319781 * delta_u**3
-                - 0.8503463 * delta_u**4
-                - 0.005050998 * delta_u**5
-                + 0.0083572073 * delta_u**6
-            )
-        elif year_number < 1700:
-            delta_u = year_number - 1600
-            return 120 - 0.9808 * delta_u - 0.01532 * delta_u**2 + delta_u**3 / 7129
-        elif year_number < 1800:
-            delta_u = year_number - 1700
-            return (
-                8.83
-                + 0.1603 * delta_u
-                - 0.0059285 * delta_u**2
-                + 0.00013336 * delta_u**3
-                - delta_u**4 / 1174000
-            )
-        elif year_number < 1860:
-            delta_u = year_number - 1800
-            return (
-                13.72
-                - 0.332447 * delta_u
-                + 0.0068612 * delta_u**2
-                + 0.0041116 * delta_u**3
-                - 0.00037436 * delta_u**4
-                + 0.0000121272 * delta_u**5
-                - 0.0000001699 * delta_u**6
-                + 0.000000000875 * delta_u**7
-            )
-        elif year_number < 1900:
-            delta_u = year_number - 1860
-            return (
-                7.62
-                + 0.5737 * delta_u
-                - 0.251754 * delta_u**2
-                + 0.01680668 * delta_u**3
-                - 0.0004473624 * delta_u**4
-                + delta_u**5 / 233174
-            )
-        elif year_number < 1920:
-            delta_u = year_number - 1900
-            return (
-                -2.79
-                + 1.494119 * delta_u
-                - 0.0598939 * delta_u**2
-                + 0.0061966 * delta_u**3
-                - 0.000197 * delta_u**4
-            )
-        elif year_number < 1941:
-            delta_u = year_number - 1920
-            return (
-                21.20
-                + 0.84493 * delta_u
-                - 0.076100 * delta_u**2
-                + 0.0020936 * delta_u**3
-            )
-        elif year_number < 1961:
-            delta_u = year_number - 1950
-            return 29.07 + 0.407 * delta_u - delta_u**2 / 233 + delta_u**3 / 2547
-        elif year_number < 1986:
-            delta_u = year_number - 1975
-            return 45.45 + 1.067 * delta_u - delta_u**2 / 260 - delta_u**3 / 718
-        elif year_number < 2005:
-            delta_u = year_number - 2000
-            return (
-                63.86
-                + 0.3345 * delta_u
-                - 0.060734 * delta_u**2
-                + 0.0017275 * delta_u**3
-                + 0.000651814 * delta_u**4
-                + 0.00002373599 * delta_u**5
-            )
-        elif year_number < 2050:
-            delta_u = year_number - 2000
-            return 63.795 + 0.1287 * delta_u + 0.0091 * delta_u**2
-            # 2005-2050の近似式は自作。參考文獻に準拠した式をコメントアウトして置く。
-            # 參考文獻: https://eclipse.gsfc.nasa.gov/SEhelp/deltatpoly2004.html
-            # return 62.92 + \
-            #     0.32217 * delta_u + \
-            #     0.005589 * delta_u**2
-        elif year_number < 2150:
-            return (
-                -20
-                + 32 * ((year_number - 1820) / 100) ** 2
-                - 0.5628 * (2150 - year_number)
-            )
-        else:
-            delta_u = (year_number - 1820) / 100
-            return -20 + 32 * delta_u**2
+        """
+        ユリウス通日からΔTを算出する.
+
+        グレゴリオ曆の日附では年毎の値を `delta_t_cache` に記憶し、同じ年の二度目からは曆の變換を省く.
+        """
+        return julian_day_to_delta_t(self.julian_day)
 
     # __pragma__("noskip")
 
@@ -214,3 +127,127 @@ class JulianDay(object):
     def julian_day(self) -> float:
         """秒を考慮したJulian Dayを計算する."""
         return self.day + (self.second / (60.0 * 60.0 * 24.0))
+
+
+# __pragma__("skip")
+delta_t_breakpoints = np.array(delta_t_breakpoint_years, dtype=np.float64)
+
+_delta_t_origins = np.array([origin for (origin, _, _) in delta_t_polynomials])
+_delta_t_units = np.array([unit for (_, unit, _) in delta_t_polynomials])
+_delta_t_coefficients = np.array(
+    [
+        coefficients + [0.0] * (8 - len(coefficients))
+        for (_, _, coefficients) in delta_t_polynomials
+    ]
+)
+
+
+def julian_day_to_julian_year_array(julian_day: npt.ArrayLike) -> np.ndarray:
+    """ユリウス通日の配列をユリウス年表示の配列に變換する."""
+    tweaked_julian_day = np.asarray(julian_day, dtype=np.float64) - 1721117.5
+    # ユリウス曆0年3月1日正子を0とする通算日數を計算。
+    (quadrennium, day_in_quadrennium) = np.divmod(tweaked_julian_day, 365 * 4 + 1)
+    quadrennial_year = np.minimum(day_in_quadrennium // 365, 3)
+    julian_year = quadrennium * 4 + quadrennial_year
+    annual_day = day_in_quadrennium - quadrennial_year * 365
+    next_year = annual_day >= 306  # 306は3月から12月の日數。過ぎると翌年。
+    annual_day = np.where(
+        next_year,
+        annual_day - 306,
+        annual_day + np.where(julian_year % 4 == 0, 31 + 29, 31 + 28),
+    )
+    julian_year = julian_year + next_year
+    return julian_year + annual_day / np.where(julian_year % 4 == 0, 366, 365)
+
+
+def julian_day_to_gregorian_year_array(julian_day: npt.ArrayLike) -> np.ndarray:
+    """ユリウス通日の配列をグレゴリオ年表示の配列に變換する."""
+    julian_day = np.asarray(julian_day, dtype=np.float64)
+    # juld_to_grdt と同じ計算で年を求める
+    A = np.floor(julian_day + 68569.5)
+    a = np.floor(A / 36524.25)
+    b = A - np.floor(36524.25 * a + 0.75)
+    c = np.floor((b + 1) / 365.25025)
+    d = b - np.floor(365.25 * c) + 31
+    e = np.floor(d / 30.59)
+    year = 100 * (a - 49) + c + np.floor(e / 11.0)
+    january_1st = gregorian_new_years_day_array(year)
+    next_january_1st = gregorian_new_years_day_array(year + 1)
+    # 年內日數の小數表示
+    return year + (julian_day - january_1st) / (next_january_1st - january_1st)
+
+
+def gregorian_new_years_day_array(year: npt.ArrayLike) -> np.ndarray:
+    """グレゴリオ曆の其の年の1月1日正子のユリウス通日の配列を求める."""
+    # grdt_to_juld と同じ計算. 1月は前年の13月として扱ふ.
+    tweaked_year = np.asarray(year, dtype=np.float64) - 1
+    return (
+        np.floor(tweaked_year * 365.25)
+        + np.floor(tweaked_year / 400.0)
+        - np.floor(tweaked_year / 100.0)
+        + math.floor((13 - 2) * 30.59)
+        + 1
+        + 1721088
+        + 0.5
+    )
+
+
+def delta_t_array(julian_day: npt.ArrayLike) -> np.ndarray:
+    """
+    ユリウス通日の配列からΔTの配列を算出する.
+
+    區閒を二分探索で選び、全ての多項式を一度に評價する.
+    年表示の計算の丸め方のみが `JulianDay.delta_t` と異なり、
+    差は相對誤差1e-12または絕對誤差1e-6秒の何れかに收まる.
+    """
+    year_number = julian_day_to_year_number_array(julian_day)
+    return evaluate_delta_t_array(year_number, delta_t_segment_array(year_number))
+
+
+def julian_day_to_year_number_array(julian_day: npt.ArrayLike) -> np.ndarray:
+    """ユリウス通日の配列を、ΔTの計算に使ふ年表示 (改曆前はユリウス年) の配列に變換する."""
+    julian_day = np.asarray(julian_day, dtype=np.float64)
+    return np.where(
+        julian_day < JulianDay.calendar_reform,
+        julian_day_to_julian_year_array(julian_day),
+        julian_day_to_gregorian_year_array(julian_day),
+    )
+
+
+def delta_t_segment_array(year_number: np.ndarray) -> np.ndarray:
+    """年表示の配列に對應するΔTの多項式の區閒の番號の配列."""
+    return np.searchsorted(delta_t_breakpoints, year_number, side="right")
+
+
+def evaluate_delta_t_array(year_number: np.ndarray, segment: np.ndarray) -> np.ndarray:
+    """區閒の番號で選んだΔTの多項式を年表示の配列について評價する."""
+    delta_u = (year_number - _delta_t_origins[segment]) / _delta_t_units[segment]
+    coefficients = _delta_t_coefficients[segment]
+    delta_t = coefficients[..., -1]
+    for k in range(coefficients.shape[-1] - 2, -1, -1):
+        delta_t = delta_t * delta_u + coefficients[..., k]
+    return delta_t
+
+
+# __pragma__("noskip")
+
+
+# __pragma__("skip")
+class FrozenJulianDay(Frozen, JulianDay):
+    """
+    不變なユリウス通日. hashを持つのでdictのkeyやsetの要素にできる.
+
+    等値性は日と秒の近さとで判定するので、hashは日のみから計算する.
+    """
+
+    __slots__ = ("_hash",)
+
+    _fields = ("day", "second")
+
+    def __init__(self, day: t.Union[float, int], second=0.0) -> None:
+        """Init."""
+        super().__init__(day, second)
+        self._freeze(self.day)
+
+
+# __pragma__("noskip")
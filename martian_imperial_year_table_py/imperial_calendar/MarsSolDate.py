@@ -1,11 +1,15 @@
 """Mars Sol Date."""
 
+from imperial_calendar.internal.Frozen import Frozen  # __:skip
 import math
+import typing as t
 
 
 class MarsSolDate(object):
     """Mars Sol Date."""
 
+    __slots__ = ("mars_sol_date",)
+
     def __init__(self, mars_sol_date: float) -> None:
         """Init."""
         self.mars_sol_date: float = mars_sol_date
@@ -20,6 +24,31 @@ class MarsSolDate(object):
             self.mars_sol_date % 1, other.mars_sol_date % 1, abs_tol=0.000005
         )
 
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (self.__class__, (self.mars_sol_date,))
+
     def __repr__(self) -> str:
         """Representation."""
         return f"MarsSolDate({self.mars_sol_date})"
+
+
+# __pragma__("skip")
+class FrozenMarsSolDate(Frozen, MarsSolDate):
+    """
+    不變なMars Sol Date. hashを持つのでdictのkeyやsetの要素にできる.
+
+    等値性は小數部の近さで判定するので、hashは整數部のみから計算する.
+    """
+
+    __slots__ = ("_hash",)
+
+    _fields = ("mars_sol_date",)
+
+    def __init__(self, mars_sol_date: float) -> None:
+        """Init."""
+        super().__init__(mars_sol_date)
+        self._freeze(math.floor(mars_sol_date))
+
+
+# __pragma__("noskip")
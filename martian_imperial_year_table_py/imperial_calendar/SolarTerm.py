@@ -0,0 +1,140 @@
+"""
+二十四節氣.
+
+節氣の境界は同梱の表 (`data/solar_terms.npy`) から二分探索で求め、表の範圍外の時はLsの方程式を解いて求める.
+"""
+
+from imperial_calendar.ImperialDateTime import ImperialDateTime, japanese_month_names
+from imperial_calendar.ImperialSolNumber import ImperialSolNumber
+from imperial_calendar.internal.SolarTermTable import (
+    SolarTermTable,
+    generate_solar_term_table,
+    imsn_to_offset_t_j2000_array,
+    load_solar_term_table,
+    offset_t_j2000_to_imsn_array,
+    solar_term_count,
+    solar_term_mrls,
+)
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn
+from imperial_calendar.transform.mrls_to_imsn import (
+    mars_tropical_year,
+    next_mrls_crossing,
+)
+from imperial_calendar.transform.tert_to_mrls import (
+    offset_t_j2000_to_areocentric_solar_longitude,
+)
+import math
+import os.path
+import typing as t
+
+solar_term_table_path = os.path.join(
+    os.path.dirname(__file__), "data", "solar_terms.npy"
+)
+
+
+class SolarTerms(object):
+    """Proxy the solar term table for test."""
+
+    path: str = solar_term_table_path
+    _loaded: bool = False
+    _table: t.Optional[SolarTermTable] = None
+
+    @classmethod
+    def setUpForTest(cls, table: t.Optional[SolarTermTable]):
+        """Override the solar term table by given table."""
+        cls._loaded = True
+        cls._table = table
+
+    @classmethod
+    def table(cls) -> t.Optional[SolarTermTable]:
+        """同梱の表. 初めて使ふ時にmemory-mapする. 表が無ければNone."""
+        if not cls._loaded:
+            cls._loaded = True
+            if os.path.exists(cls.path):
+                cls._table = load_solar_term_table(cls.path)
+        return cls._table
+
+    @classmethod
+    def tearDownForTest(cls):
+        """Restore the solar term table."""
+        cls._loaded = False
+        cls._table = None
+
+
+class SolarTerm(object):
+    """二十四節氣の一つ. 番號は立春を0とし、名は月名と同じ."""
+
+    __slots__ = ("start", "term")
+
+    def __init__(self, term: int, start: ImperialSolNumber):
+        """Init."""
+        self.start = start
+        self.term = term
+
+    def __eq__(self, other: object) -> bool:
+        """Eq."""
+        return (
+            isinstance(other, SolarTerm)
+            and self.term == other.term
+            and self.start == other.start
+        )
+
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (self.__class__, (self.term, self.start))
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"SolarTerm({self.term}, {self.start!r})"
+
+    @property
+    def mrls(self) -> float:
+        """節氣の始まりのLs."""
+        return float(solar_term_mrls(self.term))
+
+    @property
+    def name(self) -> str:
+        """節氣の名."""
+        return japanese_month_names[self.term]
+
+
+def solar_term_of(instant: t.Union[ImperialDateTime, ImperialSolNumber]) -> SolarTerm:
+    """其の時刻の節氣."""
+    if isinstance(instant, ImperialDateTime):
+        if instant.timezone is not None:
+            instant = instant.to_standard_naive()
+        instant = imdt_to_imsn(instant)
+    imperial_sol_number = instant.imperial_sol_number
+    table = SolarTerms.table()
+    found = None if table is None else table.find(imperial_sol_number)
+    if found is not None:
+        (term, start) = found
+        return SolarTerm(term, ImperialSolNumber(start))
+    offset_t_j2000 = float(imsn_to_offset_t_j2000_array(imperial_sol_number))
+    mrls = offset_t_j2000_to_areocentric_solar_longitude(offset_t_j2000)
+    term = math.floor((mrls - 315.0) % 360.0 / 15.0) % solar_term_count
+    # 直前の境界は一つの節氣の長さ以內に在り、其の前の境界は一太陽年前なので、半太陽年前から探して最初の解が其れである
+    start = next_mrls_crossing(
+        offset_t_j2000 - mars_tropical_year / 2, float(solar_term_mrls(term))
+    )
+    return SolarTerm(
+        term, ImperialSolNumber(float(offset_t_j2000_to_imsn_array(start)))
+    )
+
+
+def solar_terms_of_year(year: int) -> t.List[SolarTerm]:
+    """其の年の元日から翌年の元日迄に始まる節氣の一覽."""
+    start = float(imdt_to_imsn(ImperialDateTime(year, 1, 1, 0, 0, 0, None)).day)
+    stop = float(imdt_to_imsn(ImperialDateTime(year + 1, 1, 1, 0, 0, 0, None)).day)
+    table = SolarTerms.table()
+    if table is not None and table.covers(start, stop):
+        terms = table.between(start, stop)
+    else:
+        terms = [
+            (int(term), float(imperial_sol_number))
+            for (imperial_sol_number, term) in generate_solar_term_table(year, year + 1)
+        ]
+    return [
+        SolarTerm(term, ImperialSolNumber(imperial_sol_number))
+        for (term, imperial_sol_number) in terms
+    ]
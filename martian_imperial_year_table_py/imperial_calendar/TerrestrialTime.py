@@ -1,11 +1,15 @@
 """地球時 (テレストリアルタイム)."""
 
+from imperial_calendar.internal.Frozen import Frozen  # __:skip
 import math
+import typing as t
 
 
 class TerrestrialTime(object):
     """地球時 (テレストリアルタイム)."""
 
+    __slots__ = ("terrestrial_time",)
+
     def __init__(self, terrestrial_time: float) -> None:
         """Init."""
         self.terrestrial_time: float = terrestrial_time
@@ -20,6 +24,31 @@ class TerrestrialTime(object):
             self.terrestrial_time % 1, other.terrestrial_time % 1, abs_tol=0.000005
         )
 
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (self.__class__, (self.terrestrial_time,))
+
     def __repr__(self) -> str:
         """Representation."""
         return f"TerrestrialTime({self.terrestrial_time})"
+
+
+# __pragma__("skip")
+class FrozenTerrestrialTime(Frozen, TerrestrialTime):
+    """
+    不變な地球時. hashを持つのでdictのkeyやsetの要素にできる.
+
+    等値性は小數部の近さで判定するので、hashは整數部のみから計算する.
+    """
+
+    __slots__ = ("_hash",)
+
+    _fields = ("terrestrial_time",)
+
+    def __init__(self, terrestrial_time: float) -> None:
+        """Init."""
+        super().__init__(terrestrial_time)
+        self._freeze(math.floor(terrestrial_time))
+
+
+# __pragma__("noskip")
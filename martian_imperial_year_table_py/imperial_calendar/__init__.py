@@ -1,16 +1,32 @@
 """Imperial Calendar (帝國火星曆)."""
 
 from imperial_calendar.GregorianDateTime import GregorianDateTime
+from imperial_calendar.GregorianDateTime import FrozenGregorianDateTime  # __:skip
 from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.ImperialDateTime import FrozenImperialDateTime  # __:skip
+from imperial_calendar.ImperialDateTimeArray import ImperialDateTimeArray  # __:skip
 from imperial_calendar.ImperialSolNumber import ImperialSolNumber
+from imperial_calendar.ImperialSolNumber import FrozenImperialSolNumber  # __:skip
 from imperial_calendar.ImperialYearMonth import ImperialYearMonth
+from imperial_calendar.ImperialYearMonth import FrozenImperialYearMonth  # __:skip
 from imperial_calendar.JulianDay import JulianDay
+from imperial_calendar.JulianDay import FrozenJulianDay  # __:skip
 from imperial_calendar.MarsSolDate import MarsSolDate
+from imperial_calendar.MarsSolDate import FrozenMarsSolDate  # __:skip
 from imperial_calendar.TerrestrialTime import TerrestrialTime
+from imperial_calendar.TerrestrialTime import FrozenTerrestrialTime  # __:skip
 
 __all__ = [
+    "FrozenGregorianDateTime",
+    "FrozenImperialDateTime",
+    "FrozenImperialSolNumber",
+    "FrozenImperialYearMonth",
+    "FrozenJulianDay",
+    "FrozenMarsSolDate",
+    "FrozenTerrestrialTime",
     "GregorianDateTime",
     "ImperialDateTime",
+    "ImperialDateTimeArray",
     "ImperialSolNumber",
     "ImperialYearMonth",
     "JulianDay",
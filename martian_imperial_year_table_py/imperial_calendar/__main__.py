@@ -0,0 +1,86 @@
+"""
+帝國火星曆のcommand line.
+
+`python -m imperial_calendar table 1425 1434 --timezone Asia/Tokyo` で帝國火星曆1425年から1434年迄の
+對照表をCSVで標準出力に書き出す. `python -m imperial_calendar serve` で日時の變換のHTTP serverを始める.
+"""
+
+from imperial_calendar.internal.timezone import fixed_offset, resolve_timezone
+from imperial_calendar.server import serve
+from imperial_calendar.table import table_formats, table_rows, write_table
+import argparse
+import asyncio
+import os
+from pytz import UnknownTimeZoneError
+import sys
+import typing as t
+
+
+def parse_args(argv: t.Optional[t.List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(prog="python -m imperial_calendar")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    table = subparsers.add_parser(
+        "table", help="帝國火星曆とグレゴリオ曆との對照表を一日一行で書き出す"
+    )
+    table.add_argument("start_year", type=int, help="最初の帝國火星曆の年")
+    table.add_argument("end_year", type=int, help="最後の帝國火星曆の年 (含む)")
+    table.add_argument(
+        "--format",
+        choices=table_formats,
+        default="csv",
+        dest="table_format",
+        help="出力の形式",
+    )
+    table.add_argument(
+        "--imdt-timezone",
+        default=None,
+        help="各日の始まりの帝國火星曆の時閒帶. 省略すると標準時",
+    )
+    table.add_argument(
+        "--timezone",
+        default="+00:00",
+        dest="grdt_timezone",
+        help="グレゴリオ曆の時閒帶",
+    )
+    serve = subparsers.add_parser("serve", help="日時の變換のHTTP serverを始める")
+    serve.add_argument("--host", default="127.0.0.1", help="待ち受けるaddress")
+    serve.add_argument("--port", default=8080, type=int, help="待ち受けるport")
+    args = parser.parse_args(argv)
+    if args.command == "table":
+        if args.imdt_timezone is not None and fixed_offset(args.imdt_timezone) is None:
+            parser.error(f"--imdt-timezone must be ±HH:MM: {args.imdt_timezone}")
+        try:
+            resolve_timezone(args.grdt_timezone)
+        except UnknownTimeZoneError:
+            parser.error(f"Unknown timezone: {args.grdt_timezone}")
+    return args
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> None:
+    """Run."""
+    args = parse_args(argv)
+    try:
+        if args.command == "table":
+            write_table(
+                table_rows(
+                    args.start_year,
+                    args.end_year,
+                    args.grdt_timezone,
+                    args.imdt_timezone,
+                ),
+                sys.stdout,
+                args.table_format,
+            )
+        elif args.command == "serve":
+            asyncio.run(serve(args.host, args.port))
+        sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # `| head` 等で讀み手が先に閉ぢた時は、殘りを捨てて正常に終はる
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+帝國火星曆の時刻の列の一括處理.
+
+ImperialDateTimeやImperialSolNumberのlistと、ImperialDateTimeArrayや通算日の配列の組 (日, 秒)
+とを同じ樣に扱ふ. 何れの關數も要素毎の鍵 (標準時の通算日, 其の日の秒) を一度だけ計算し、其の後は
+鍵の構造化配列で處理する. ImperialSolNumberの秒の小數部も順序に含める.
+"""
+
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.ImperialDateTimeArray import ImperialDateTimeArray
+from imperial_calendar.ImperialSolNumber import ImperialSolNumber
+import heapq
+import numpy as np
+import numpy.typing as npt
+import typing as t
+
+TTimestamp = t.Union[ImperialDateTime, ImperialSolNumber]
+TTimestamps = t.Union[
+    t.Sequence[TTimestamp], ImperialDateTimeArray, t.Tuple[np.ndarray, ...]
+]
+T = t.TypeVar("T", t.List[TTimestamp], ImperialDateTimeArray, t.Tuple[np.ndarray, ...])
+
+# 鍵 (標準時の通算日, 其の日の秒) の構造化配列の型. 日、秒の順に辭書式に竝ぶ
+sort_key_dtype = np.dtype([("day", np.int64), ("second", np.float64)])
+
+
+def sort_key(value: TTimestamp) -> t.Tuple[int, float]:
+    """一つの時刻の鍵 (標準時の通算日, 其の日の秒)."""
+    if isinstance(value, ImperialDateTime):
+        (day, second) = divmod(value.sort_key, 24 * 60 * 60)
+        return (day, float(second))
+    if isinstance(value, ImperialSolNumber):
+        return (value.day, value.second)
+    raise Exception(f"Unknown timestamp: {value!r}")
+
+
+def sort_keys(values: TTimestamps) -> np.ndarray:
+    """時刻の列の鍵 (標準時の通算日, 其の日の秒) の構造化配列."""
+    if isinstance(values, ImperialDateTimeArray):
+        # ImperialDateTimeの秒は整數なので、時閒帶の換算の誤差を丸める
+        (day, second) = values.to_imperial_sol_numbers()
+        (carry, second) = np.divmod(
+            np.round(np.asarray(second, dtype=np.float64)), 24 * 60 * 60
+        )
+        return _keys(np.asarray(day, dtype=np.int64) + carry.astype(np.int64), second)
+    if _is_imperial_sol_number_columns(values):
+        (day, second) = t.cast(t.Tuple[np.ndarray, np.ndarray], values)
+        return _keys(day, second)
+    return np.fromiter(
+        (sort_key(value) for value in t.cast(t.Sequence[TTimestamp], values)),
+        dtype=sort_key_dtype,
+        count=len(t.cast(t.Sized, values)),
+    )
+
+
+def argsort(values: TTimestamps) -> np.ndarray:
+    """時刻の列を竝べる添字の配列. 同じ時刻の要素は元の順を保つ."""
+    keys = sort_keys(values)
+    return np.lexsort((keys["second"], keys["day"]))
+
+
+def sort(values: T) -> T:
+    """時刻の列を竝べた新しい列を返す. 入力と同じ形で返す."""
+    return take(values, argsort(values))
+
+
+def searchsorted(
+    sorted_values: t.Union[TTimestamps, np.ndarray],
+    targets: t.Union[TTimestamp, TTimestamps],
+    side: str = "left",
+) -> t.Union[int, np.ndarray]:
+    """
+    竝んだ時刻の列に targets を竝びを崩さずに插入できる位置.
+
+    targetsが一つの時刻なら位置を、列なら位置の配列を返す. sideは `numpy.searchsorted` と同じ.
+    sorted_valuesの代はりに `sort_keys` で計算した鍵の配列を渡せば、鍵を計算し直さずに二分探索だけをする.
+    同じ列を何度も探す時は鍵の配列を渡す.
+    """
+    if isinstance(sorted_values, np.ndarray):
+        keys = sorted_values
+    else:
+        keys = sort_keys(sorted_values)
+    if isinstance(targets, (ImperialDateTime, ImperialSolNumber)):
+        return int(np.searchsorted(keys, sort_keys([targets]), side=side)[0])  # type: ignore
+    return np.searchsorted(keys, sort_keys(targets), side=side)  # type: ignore
+
+
+def between(values: T, start: TTimestamp, end: TTimestamp) -> T:
+    """start以上end未滿の時刻を元の順で返す. 入力と同じ形で返す."""
+    keys = sort_keys(values)
+    return take(
+        values,
+        np.nonzero(~_less(keys, sort_key(start)) & _less(keys, sort_key(end)))[0],
+    )
+
+
+def merge(*streams: t.Iterable[TTimestamp]) -> t.Iterator[TTimestamp]:
+    """竝んだ時刻の列を一つの竝んだ列に併合する. 入力は遲延して讀む."""
+    return heapq.merge(*streams, key=sort_key)
+
+
+def merge_arrays(*arrays: T) -> T:
+    """
+    竝んだ時刻の列の配列版を一つの竝んだ列に併合する.
+
+    ImperialDateTimeArray同士または通算日の配列の組同士を受け取り、同じ形で返す.
+    """
+    merged = concatenate(*arrays)
+    return take(merged, argsort(merged))
+
+
+def concatenate(*arrays: T) -> T:
+    """時刻の列を繫ぐ."""
+    if all(isinstance(array, ImperialDateTimeArray) for array in arrays):
+        idt_arrays = t.cast(t.Tuple[ImperialDateTimeArray, ...], arrays)
+        timezones = {array.timezone for array in idt_arrays if array.is_naive is False}
+        (year, month, day, hour, minute, second) = (
+            np.concatenate([getattr(array, field) for array in idt_arrays])
+            for field in ("year", "month", "day", "hour", "minute", "second")
+        )
+        if all(array.is_naive for array in idt_arrays):
+            return t.cast(
+                T, ImperialDateTimeArray(year, month, day, hour, minute, second)
+            )
+        if any(array.is_naive for array in idt_arrays):
+            raise Exception("Cannot mix naive and aware ImperialDateTimeArray.")
+        if len(timezones) == 1 and None not in timezones:
+            return t.cast(
+                T,
+                ImperialDateTimeArray(
+                    year, month, day, hour, minute, second, timezones.pop()
+                ),
+            )
+        return t.cast(
+            T,
+            ImperialDateTimeArray(
+                year,
+                month,
+                day,
+                hour,
+                minute,
+                second,
+                offsets=np.concatenate([array.offsets for array in idt_arrays]),
+            ),
+        )
+    if all(_is_imperial_sol_number_columns(array) for array in arrays):
+        return t.cast(
+            T,
+            tuple(
+                np.concatenate([np.asarray(array[i]) for array in arrays])  # type: ignore
+                for i in range(2)
+            ),
+        )
+    return t.cast(T, [value for array in arrays for value in array])
+
+
+def take(values: T, indices: np.ndarray) -> T:
+    """添字の配列で選んだ時刻の列を入力と同じ形で返す."""
+    if isinstance(values, ImperialDateTimeArray):
+        return t.cast(T, values[indices])
+    if _is_imperial_sol_number_columns(values):
+        return t.cast(
+            T, tuple(np.asarray(column)[indices] for column in values)  # type: ignore
+        )
+    sequence = t.cast(t.Sequence[TTimestamp], values)
+    return t.cast(T, [sequence[i] for i in indices])
+
+
+def _keys(day: npt.ArrayLike, second: npt.ArrayLike) -> np.ndarray:
+    """通算日の配列 (日, 秒) の鍵."""
+    day = np.asarray(day, dtype=np.int64)
+    keys = np.empty(day.shape, dtype=sort_key_dtype)
+    keys["day"] = day
+    keys["second"] = second
+    return keys
+
+
+def _less(keys: np.ndarray, key: t.Tuple[int, float]) -> np.ndarray:
+    """各鍵がkeyより前か."""
+    (day, second) = key
+    return (keys["day"] < day) | ((keys["day"] == day) & (keys["second"] < second))
+
+
+def _is_imperial_sol_number_columns(values: t.Any) -> bool:
+    """通算日の配列の組 (日, 秒) か."""
+    return (
+        isinstance(values, tuple)
+        and len(values) == 2
+        and all(isinstance(column, np.ndarray) for column in values)
+    )
@@ -0,0 +1,198 @@
+"""
+日時の變換のAPIの應答.
+
+`packages/martian_api` の `datetime-conversion.ts` と同じ檢證をし、同じ形の應答を作る.
+入力が不正な時は、TS版と同じ文言のExceptionを投げる.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from imperial_calendar.GregorianDateTime import GregorianDateTime
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.ImperialYearMonth import ImperialYearMonth
+from imperial_calendar.JulianDay import JulianDay
+from imperial_calendar.transform import (
+    grdt_to_juld,
+    imdt_to_imsn,
+    imsn_to_imdt,
+    imsn_to_mrsd,
+    juld_to_grdt,
+    juld_to_tert,
+    mrsd_to_imsn,
+    mrsd_to_tert,
+    tert_to_juld,
+    tert_to_mrsd,
+)
+import re
+import typing as t
+
+timezone_pattern = re.compile(r"^([+-])(\d{2}):(\d{2})$", re.ASCII)
+imperial_date_time_format_pattern = re.compile(
+    r"^(\d{4,})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})([+-])(\d{2}):(\d{2})$", re.ASCII
+)
+gregorian_date_time_with_timezone_pattern = re.compile(
+    r"^(\d{4,})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,3}))?(?:(Z)|([+-])(\d{2}):(\d{2}))$",
+    re.ASCII,
+)
+
+TImperialDateTimeBody = t.Dict[str, t.Union[int, str]]
+
+
+def validate_timezone(timezone: str) -> t.Optional[str]:
+    """時閒帶が「±HH:MM」でなければ其の理由を返す."""
+    match = timezone_pattern.fullmatch(timezone)
+    if match is None:
+        return "Invalid timezone format"
+    if int(match[2]) > 23 or int(match[3]) > 59:
+        return "Invalid timezone value"
+    return None
+
+
+def format_imperial(body: TImperialDateTimeBody) -> str:
+    """帝國火星曆の日時の書式."""
+    return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}{}".format(
+        int(body["year"]),
+        int(body["month"]),
+        int(body["day"]),
+        int(body["hour"]),
+        int(body["minute"]),
+        int(body["second"]),
+        body["timezone"],
+    )
+
+
+def format_gregorian(grdt: GregorianDateTime) -> str:
+    """グレゴリオ曆の日時の書式."""
+    return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}{}".format(
+        grdt.year,
+        grdt.month,
+        grdt.day,
+        grdt.hour,
+        grdt.minute,
+        grdt.second,
+        "+00:00" if grdt.timezone is None else grdt.timezone,
+    )
+
+
+def format_iso_utc(instant: datetime) -> str:
+    """JavaScriptの `Date.prototype.toISOString` と同じ書式."""
+    instant = instant.astimezone(dt_timezone.utc)
+    return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}.{:03d}Z".format(
+        instant.year,
+        instant.month,
+        instant.day,
+        instant.hour,
+        instant.minute,
+        instant.second,
+        instant.microsecond // 1000,
+    )
+
+
+def to_imperial_date_time(instant: datetime, timezone: str) -> ImperialDateTime:
+    """timezone附きのdatetimeを帝國火星曆の日時に變換する. ミリ秒迄を使ふ."""
+    instant = instant.astimezone(dt_timezone.utc)
+    juld = grdt_to_juld(
+        GregorianDateTime(
+            instant.year,
+            instant.month,
+            instant.day,
+            instant.hour,
+            instant.minute,
+            instant.second,
+            None,
+        )
+    )
+    juld = JulianDay(juld.day, juld.second + instant.microsecond // 1000 / 1000.0)
+    imdt = imsn_to_imdt(mrsd_to_imsn(tert_to_mrsd(juld_to_tert(juld))))
+    return ImperialDateTime.from_standard_naive(imdt, timezone)
+
+
+def to_imperial_date_time_body(imdt: ImperialDateTime) -> TImperialDateTimeBody:
+    """帝國火星曆の日時の應答の形."""
+    if imdt.timezone is None:
+        raise Exception("ImperialDateTime timezone is required")
+    return {
+        "year": imdt.year,
+        "month": imdt.month,
+        "day": imdt.day,
+        "hour": imdt.hour,
+        "minute": imdt.minute,
+        "second": imdt.second,
+        "timezone": imdt.timezone,
+    }
+
+
+def parse_imperial_date_time_formatted(value: str) -> t.Optional[ImperialDateTime]:
+    """`format_imperial` の書式の帝國火星曆の日時を讀む. 不正ならNone."""
+    match = imperial_date_time_format_pattern.fullmatch(value)
+    if match is None:
+        return None
+    timezone = f"{match[7]}{match[8]}:{match[9]}"
+    if validate_timezone(timezone) is not None:
+        return None
+    (year, month, day, hour, minute, second) = (int(match[i]) for i in range(1, 7))
+    if month < 1 or month > 24 or day < 1:
+        return None
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    if day > ImperialYearMonth(year, month).days():
+        return None
+    return ImperialDateTime(year, month, day, hour, minute, second, timezone)
+
+
+def build_imperial_to_gregorian_response(
+    imperial_date_time_formatted: str, gregorian_timezone: str
+) -> t.Dict[str, t.Any]:
+    """帝國火星曆の日時をグレゴリオ曆の日時に變換した應答."""
+    imdt = parse_imperial_date_time_formatted(imperial_date_time_formatted)
+    if imdt is None:
+        raise Exception("Invalid imperialDateTimeFormatted")
+    juld = tert_to_juld(
+        mrsd_to_tert(imsn_to_mrsd(imdt_to_imsn(imdt.to_standard_naive())))
+    )
+    grdt = GregorianDateTime.from_utc_naive(juld_to_grdt(juld), gregorian_timezone)
+    return {"gregorianDateTime": format_gregorian(grdt)}
+
+
+def build_current_imperial_date_time_response(
+    now: datetime, timezone: str
+) -> t.Dict[str, t.Any]:
+    """nowの帝國火星曆の日時の應答."""
+    body = to_imperial_date_time_body(to_imperial_date_time(now, timezone))
+    return {
+        "gregorianDateTime": format_iso_utc(now),
+        "imperialDateTime": body,
+        "imperialDateTimeFormatted": format_imperial(body),
+    }
+
+
+def build_gregorian_to_imperial_response(
+    gregorian_date_time: str, imperial_timezone: str
+) -> t.Dict[str, t.Any]:
+    """時閒帶附きのグレゴリオ曆の日時を帝國火星曆の日時に變換した應答."""
+    match = gregorian_date_time_with_timezone_pattern.fullmatch(gregorian_date_time)
+    if match is None:
+        raise Exception("Invalid gregorianDateTime format")
+    try:
+        offset = (
+            timedelta(0)
+            if match[8] is not None
+            else (1 if match[9] == "+" else -1)
+            * timedelta(hours=int(match[10]), minutes=int(match[11]))
+        )
+        instant = datetime(
+            int(match[1]),
+            int(match[2]),
+            int(match[3]),
+            int(match[4]),
+            int(match[5]),
+            int(match[6]),
+            int((match[7] or "0").ljust(3, "0")) * 1000,
+            tzinfo=dt_timezone(offset),
+        ).astimezone(dt_timezone.utc)
+    except (OverflowError, ValueError):
+        raise Exception("Invalid gregorianDateTime")
+    body = to_imperial_date_time_body(to_imperial_date_time(instant, imperial_timezone))
+    return {
+        "imperialDateTime": body,
+        "imperialDateTimeFormatted": format_imperial(body),
+    }
@@ -0,0 +1,135 @@
+"""ΔTを年毎に記憶する."""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from imperial_calendar.internal.consts import (
+    delta_t_breakpoint_years,
+    delta_t_polynomials,
+)
+import math
+import threading
+import typing as t
+
+
+def delta_t_polynomial(year_number: float) -> t.Tuple[float, float, t.List[float]]:
+    """年表示に對應するΔTの多項式 (基準年, 年の單位, 係數) を選ぶ."""
+    return delta_t_polynomials[bisect_right(delta_t_breakpoint_years, year_number)]
+
+
+def evaluate_delta_t(
+    polynomial: t.Tuple[float, float, t.List[float]], year_number: float
+) -> float:
+    """ΔTの多項式を評價する."""
+    (origin, unit, coefficients) = polynomial
+    delta_u = (year_number - origin) / unit
+    delta_t = 0.0
+    for coefficient in reversed(coefficients):
+        delta_t = delta_t * delta_u + coefficient
+    return delta_t
+
+
+def gregorian_year_of(julian_day: float) -> int:
+    """ユリウス通日が屬するグレゴリオ曆の年. juld_to_grdt と同じ計算."""
+    A = math.floor(julian_day + 68569.5)
+    a = math.floor(A / 36524.25)
+    b = A - math.floor(36524.25 * a + 0.75)
+    c = math.floor((b + 1) / 365.25025)
+    d = b - math.floor(365.25 * c) + 31
+    e = math.floor(d / 30.59)
+    return 100 * (a - 49) + c + math.floor(e / 11.0)
+
+
+def gregorian_new_years_day(year: int) -> float:
+    """グレゴリオ曆の其の年の1月1日正子のユリウス通日. grdt_to_juld と同じ計算."""
+    tweaked_year = year - 1  # 1月は前年の13月として扱ふ
+    return (
+        math.floor(tweaked_year * 365.25)
+        + math.floor(tweaked_year / 400.0)
+        - math.floor(tweaked_year / 100.0)
+        + math.floor((13 - 2) * 30.59)
+        + 1
+        + 1721088
+        + 0.5
+    )
+
+
+class DeltaTYear(object):
+    """グレゴリオ曆の一年分のΔTの計算に要る値."""
+
+    __slots__ = ("year", "january_1st", "next_january_1st", "polynomial")
+
+    def __init__(self, year: int) -> None:
+        """Init."""
+        self.year: int = year
+        self.january_1st: float = gregorian_new_years_day(year)
+        self.next_january_1st: float = gregorian_new_years_day(year + 1)
+        # 區閒の境界は整數年なので、一年の閒に多項式は變はらない
+        self.polynomial = delta_t_polynomial(year)
+
+    def year_number(self, julian_day: float) -> float:
+        """ユリウス通日をグレゴリオ年表示に變換する."""
+        # 年內日數の小數表示
+        annual_day = (julian_day - self.january_1st) / (
+            self.next_january_1st - self.january_1st
+        )
+        return self.year + annual_day
+
+    def delta_t(self, julian_day: float) -> float:
+        """ユリウス通日からΔTを算出する."""
+        return evaluate_delta_t(self.polynomial, self.year_number(julian_day))
+
+
+class DeltaTCache(object):
+    """
+    ΔTの計算に要る値をグレゴリオ曆の年毎に記憶する.
+
+    最も古く使った年から捨てる (LRU). hits と misses とで效き具合を觀測できる.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Init."""
+        self.hits: int = 0
+        self.maxsize: int = maxsize
+        self.misses: int = 0
+        self._lock = threading.Lock()
+        self._years: "OrderedDict[int, DeltaTYear]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """記憶してゐる年の數."""
+        return len(self._years)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return "DeltaTCache(hits={}, misses={}, maxsize={}, currsize={})".format(
+            self.hits, self.misses, self.maxsize, len(self)
+        )
+
+    def clear(self) -> None:
+        """記憶と計數とを消す."""
+        with self._lock:
+            self._years.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def year(self, year: int) -> DeltaTYear:
+        """其の年の値を返す. 無ければ計算して記憶する."""
+        with self._lock:
+            delta_t_year = self._years.get(year)
+            if delta_t_year is not None:
+                self.hits += 1
+                self._years.move_to_end(year)
+                return delta_t_year
+            self.misses += 1
+        delta_t_year = DeltaTYear(year)
+        with self._lock:
+            self._years[year] = delta_t_year
+            while len(self._years) > self.maxsize:
+                self._years.popitem(last=False)
+        return delta_t_year
+
+    def of(self, julian_day: float) -> DeltaTYear:
+        """ユリウス通日が屬する年の値を返す."""
+        return self.year(gregorian_year_of(julian_day))
+
+
+delta_t_cache = DeltaTCache()
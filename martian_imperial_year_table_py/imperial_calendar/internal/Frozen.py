@@ -0,0 +1,44 @@
+"""不變なobject."""
+
+import typing as t
+
+
+class Frozen(object):
+    """
+    不變なobjectの mixin.
+
+    繼承する class は `__slots__ = ("_hash",)` と `_fields` (`__init__` の引數名) とを持ち、
+    `__init__` の最後に `_freeze` を呼ぶ. `_freeze` の後は屬性を變更できない.
+    """
+
+    __slots__ = ()
+
+    _fields: t.Tuple[str, ...] = ()
+
+    def __delattr__(self, name: str) -> None:
+        """Delete attribute."""
+        raise Exception(f"{self!r} is frozen.")
+
+    def __hash__(self) -> int:
+        """Hash."""
+        return t.cast(t.Any, self)._hash
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Set attribute."""
+        if hasattr(self, "_hash"):
+            raise Exception(f"{self!r} is frozen.")
+        object.__setattr__(self, name, value)
+
+    def _freeze(self, key: t.Hashable) -> None:
+        """Hashを計算して凍結する. 等値なobjectのkeyは等しくなければならない."""
+        object.__setattr__(self, "_hash", hash(key))
+
+    def replace(self, **changes: t.Any) -> t.Any:
+        """一部の屬性を置き換へた新しいobjectを返す."""
+        unknown = set(changes) - set(self._fields)
+        if unknown:
+            raise Exception(f"Unknown fields: {sorted(unknown)}")
+        (cls, args) = t.cast(t.Any, self).__reduce__()
+        fields = dict(zip(self._fields, args))
+        fields.update(changes)
+        return cls(**fields)
@@ -1,9 +1,15 @@
 """火星帝國の祝日."""
 
-from functools import total_ordering
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, total_ordering
 from imperial_calendar.ImperialYearMonth import ImperialYearMonth
+from imperial_calendar.internal.HolidayRules import generate_holidays
+import itertools
 import typing as t
 
+# 規則から生成した祝日を保持する年數
+holiday_cache_size = 256
+
 
 class Internal(object):
     """Internal data expression."""
@@ -23,7 +29,9 @@ class Internal(object):
         return f"Internal({self.name})"
 
 
-THolidays = t.Dict[int, t.Dict[int, t.Dict[int, t.Union[Internal, t.List[Internal]]]]]
+THolidayYear = t.Dict[int, t.Dict[int, t.Union[Internal, t.List[Internal]]]]
+THolidays = t.Dict[int, THolidayYear]
+TDate = t.Tuple[int, int, int]
 
 HOLIDAYS: THolidays = {
     1425: {
@@ -105,19 +113,211 @@ HOLIDAYS: THolidays = {
 
 
 class Holidays(object):
-    """Proxy HOLIDAYS constant for test."""
+    """
+    Proxy HOLIDAYS constant for test.
+
+    HOLIDAYSに無い年の祝日は規則から生成する.
+    """
 
+    generates: bool = True
     holidays: THolidays = HOLIDAYS
+    _index: t.Optional["HolidayIndex"] = None
 
     @classmethod
-    def setUpForTest(cls, holidays: THolidays):
+    def index(cls) -> "HolidayIndex":
+        """祝日の索引. holidaysが差し替へられてゐたら作り直す."""
+        if (
+            cls._index is None
+            or cls._index.holidays is not cls.holidays
+            or cls._index.generates != cls.generates
+        ):
+            cls._index = HolidayIndex(cls.holidays, cls.generates)
+        return cls._index
+
+    @classmethod
+    def setUpForTest(cls, holidays: THolidays, generates: bool = False):
         """Override HOLIDAYS by given holidays."""
+        cls.generates = generates
         cls.holidays = holidays
+        cls._index = None
 
     @classmethod
     def tearDownForTest(cls):
         """Restore the HOLIDAYS."""
+        cls.generates = True
         cls.holidays = HOLIDAYS
+        cls._index = None
+
+    @classmethod
+    def year(cls, year: int) -> t.Optional[THolidayYear]:
+        """其の年の祝日."""
+        if year in cls.holidays:
+            return cls.holidays[year]
+        if cls.generates:
+            return generated_holidays(year)
+        return None
+
+
+@lru_cache(maxsize=holiday_cache_size)
+def generated_holidays(year: int) -> THolidayYear:
+    """規則から生成した其の年の祝日."""
+    return {
+        month: {
+            day: (
+                Internal(name=names[0])
+                if len(names) == 1
+                else [Internal(name=name) for name in names]
+            )
+            for (day, names) in days.items()
+        }
+        for (month, days) in generate_holidays(year).items()
+    }
+
+
+@lru_cache(maxsize=holiday_cache_size)
+def generated_holiday_year(year: int) -> "HolidayYear":
+    """規則から生成した其の年の祝日の索引."""
+    return HolidayYear(year, generated_holidays(year))
+
+
+class HolidayYear(object):
+    """
+    一年分の祝日を日附順に竝べた索引.
+
+    日附 (年, 月, 日) の順は通算日の順と同じなので、日附の組を鍵にbisectで探す.
+    HolidayMarsは一日に一つだけ作り、檢索の度に共有する.
+    """
+
+    by_date: t.Dict[TDate, "HolidayMars"]
+    dates: t.List[TDate]
+    entries: t.List["HolidayMars"]
+
+    def __init__(self, year: int, holidays: THolidayYear):
+        """Init."""
+        self.dates = sorted(
+            (year, month, day)
+            for (month, hm) in holidays.items()
+            if 1 <= month <= 24
+            for day in hm.keys()
+            if 1 <= day <= ImperialYearMonth(year, month).days()
+        )
+        self.entries = [HolidayMars(*date) for date in self.dates]
+        self.by_date = dict(zip(self.dates, self.entries))
+
+    def between(self, lhs: "HolidayMars", rhs: "HolidayMars") -> t.List["HolidayMars"]:
+        """lhs以上rhs以下の祝日."""
+        (start, stop) = self._range(lhs, rhs)
+        return self.entries[start:stop]
+
+    def count_between(self, lhs: "HolidayMars", rhs: "HolidayMars") -> int:
+        """lhs以上rhs以下の祝日の數."""
+        (start, stop) = self._range(lhs, rhs)
+        return stop - start
+
+    def next_holiday(self, after: "HolidayMars") -> t.Optional["HolidayMars"]:
+        """afterより後の最初の祝日."""
+        i = bisect_right(self.dates, _date_of(after))
+        return self.entries[i] if i < len(self.entries) else None
+
+    def previous_holiday(self, before: "HolidayMars") -> t.Optional["HolidayMars"]:
+        """beforeより前の最後の祝日."""
+        i = bisect_left(self.dates, _date_of(before))
+        return self.entries[i - 1] if i > 0 else None
+
+    def _range(self, lhs: "HolidayMars", rhs: "HolidayMars") -> t.Tuple[int, int]:
+        start = bisect_left(self.dates, _date_of(lhs))
+        return (start, max(start, bisect_right(self.dates, _date_of(rhs))))
+
+
+class HolidayIndex(object):
+    """
+    祝日の索引.
+
+    holidaysに在る年は初めに索引を作り、其れ以外の年はgeneratesの時に規則から生成した索引を使ふ.
+    """
+
+    generates: bool
+    holidays: THolidays
+    years: t.List[int]
+    _years: t.Dict[int, HolidayYear]
+
+    def __init__(self, holidays: THolidays, generates: bool):
+        """Init."""
+        self.generates = generates
+        self.holidays = holidays
+        self.years = sorted(holidays.keys())
+        self._years = {year: HolidayYear(year, holidays[year]) for year in self.years}
+
+    def between(self, lhs: "HolidayMars", rhs: "HolidayMars") -> t.List["HolidayMars"]:
+        """lhs以上rhs以下の祝日."""
+        return [
+            holiday
+            for holiday_year in self._years_between(lhs.year, rhs.year)
+            for holiday in holiday_year.between(lhs, rhs)
+        ]
+
+    def count_between(self, lhs: "HolidayMars", rhs: "HolidayMars") -> int:
+        """lhs以上rhs以下の祝日の數."""
+        return sum(
+            holiday_year.count_between(lhs, rhs)
+            for holiday_year in self._years_between(lhs.year, rhs.year)
+        )
+
+    def next_holiday(self, after: "HolidayMars") -> t.Optional["HolidayMars"]:
+        """afterより後の最初の祝日."""
+        for holiday_year in self._years_from(after.year, 1):
+            holiday = holiday_year.next_holiday(after)
+            if holiday is not None:
+                return holiday
+        return None
+
+    def previous_holiday(self, before: "HolidayMars") -> t.Optional["HolidayMars"]:
+        """beforeより前の最後の祝日."""
+        for holiday_year in self._years_from(before.year, -1):
+            holiday = holiday_year.previous_holiday(before)
+            if holiday is not None:
+                return holiday
+        return None
+
+    def year(self, year: int) -> t.Optional[HolidayYear]:
+        """其の年の祝日の索引."""
+        if year in self._years:
+            return self._years[year]
+        if self.generates:
+            return generated_holiday_year(year)
+        return None
+
+    def _years_between(self, start: int, stop: int) -> t.Iterator[HolidayYear]:
+        if self.generates:
+            years: t.Iterable[int] = range(start, stop + 1)
+        else:
+            lower = bisect_left(self.years, start)
+            upper = bisect_right(self.years, stop)
+            years = self.years[lower:upper]
+        for year in years:
+            holiday_year = self.year(year)
+            if holiday_year is not None:
+                yield holiday_year
+
+    def _years_from(self, start: int, step: int) -> t.Iterator[HolidayYear]:
+        # 規則から生成した年には必ず祝日が在るので、generatesの時は高々二年で見附かる
+        if self.generates:
+            years: t.Iterable[int] = itertools.count(start, step)
+        elif step > 0:
+            lower = bisect_left(self.years, start)
+            years = self.years[lower:]
+        else:
+            upper = bisect_right(self.years, start)
+            years = reversed(self.years[:upper])
+        for year in years:
+            holiday_year = self.year(year)
+            if holiday_year is not None:
+                yield holiday_year
+
+
+def _date_of(value: "HolidayMars") -> TDate:
+    """year, month, dayを持つobjectの日附."""
+    return (value.year, value.month, value.day)
 
 
 @total_ordering
@@ -132,30 +332,35 @@ class HolidayMars(object):
     @classmethod
     def between(cls, lhs: "HolidayMars", rhs: "HolidayMars") -> t.List["HolidayMars"]:
         """List holidays on imdt in the period."""
-        if lhs > rhs:
-            return []
-        holidays = []
-        for year in range(
-            max(lhs.year, min(Holidays.holidays.keys())),
-            min(rhs.year, max(Holidays.holidays.keys())) + 1,
-        ):
-            for month in range(
-                lhs.month if lhs.year == year else 1,
-                (rhs.month if rhs.year == year else 24) + 1,
-            ):
-                if month in Holidays.holidays[year]:
-                    for day in sorted(Holidays.holidays[year][month].keys()):
-                        if day in range(
-                            lhs.day if lhs.year == year and lhs.month == month else 1,
-                            (
-                                rhs.day
-                                if rhs.year == year and rhs.month == month
-                                else ImperialYearMonth(year, month).days()
-                            )
-                            + 1,
-                        ):
-                            holidays.append(cls(year, month, day))
-        return holidays
+        return Holidays.index().between(lhs, rhs)
+
+    @classmethod
+    def count_between(cls, lhs: "HolidayMars", rhs: "HolidayMars") -> int:
+        """Count holidays on imdt in the period."""
+        return Holidays.index().count_between(lhs, rhs)
+
+    @classmethod
+    def next_holiday(cls, after: "HolidayMars") -> t.Optional["HolidayMars"]:
+        """Return the first holiday after the day."""
+        return Holidays.index().next_holiday(after)
+
+    @classmethod
+    def of(cls, year: int, month: int, day: int) -> "HolidayMars":
+        """Return the shared HolidayMars of the day."""
+        holiday_year = Holidays.index().year(year)
+        holiday = (
+            None
+            if holiday_year is None
+            else holiday_year.by_date.get((year, month, day))
+        )
+        if holiday is None:
+            return cls(year, month, day)
+        return holiday
+
+    @classmethod
+    def previous_holiday(cls, before: "HolidayMars") -> t.Optional["HolidayMars"]:
+        """Return the last holiday before the day."""
+        return Holidays.index().previous_holiday(before)
 
     def __init__(self, year: int, month: int, day: int):
         """Init."""
@@ -163,8 +368,8 @@ class HolidayMars(object):
         self.internals = []
         self.month = month
         self.year = year
-        if year in Holidays.holidays:
-            hy = Holidays.holidays[year]
+        hy = Holidays.year(year)
+        if hy is not None:
             if month in hy:
                 hm = hy[month]
                 if day in hm:
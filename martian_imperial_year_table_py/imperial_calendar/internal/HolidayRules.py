@@ -0,0 +1,113 @@
+"""
+火星帝國の祝日の規則.
+
+任意の年の祝日を規則から生成する. 規則は次の三種.
+
+- 日附の決まった祝日. 年末の三日閒は月の日數に依って日附が變はる.
+- 火星中心太陽黃經 (Ls) に依る祝日. Lsが其の値を過ぎる標準時の日.
+- 振替休日. 祝日が日曜 (各月の1, 8, 15, 22日) に當る時は、其の後の最初の祝日でない日を休日とする.
+"""
+
+from imperial_calendar.ImperialYearMonth import ImperialYearMonth
+import numpy as np
+import typing as t
+
+TDate = t.Tuple[int, int]
+THolidayNames = t.Dict[int, t.Dict[int, t.List[str]]]
+
+# (月, 日, 呼び名)
+fixed_holidays: t.List[t.Tuple[int, int, str]] = [
+    (1, 1, "四方節"),
+    (1, 3, "元始祭"),
+    (1, 15, "元宵節"),
+    (5, 17, "神武天皇祭"),
+    (6, 4, "紀元節"),
+    (10, 13, "夏至祭"),
+    (12, 26, "大祓前日"),
+    (12, 27, "夏越大祓"),
+    (13, 1, "裏元日"),
+    (17, 19, "天長節"),
+    (18, 2, "地久節"),
+    (20, 16, "神嘗祭"),
+    (22, 1, "新嘗祭"),
+]
+
+# 年末から數へて (日, 呼び名). 0が大晦日
+year_end_holidays: t.List[t.Tuple[int, str]] = [
+    (2, "大祓前々日"),
+    (1, "大祓前日"),
+    (0, "年越大祓"),
+]
+
+# (Ls, 呼び名)
+solar_longitude_holidays: t.List[t.Tuple[float, str]] = [
+    (0.0, "春季皇靈祭"),
+    (180.0, "秋季皇靈祭"),
+]
+
+substitute_holiday = "振替休日"
+
+
+def is_sunday(day: int) -> bool:
+    """日曜か. 每月1日から七日每に日曜が來る."""
+    return day % 7 == 1
+
+
+def year_dates(year: int) -> t.List[TDate]:
+    """其の年の全ての日附 (月, 日)."""
+    return [
+        (month, day)
+        for month in range(1, 25)
+        for day in range(1, ImperialYearMonth(year, month).days() + 1)
+    ]
+
+
+def solar_longitude_dates(year: int, dates: t.List[TDate]) -> t.Dict[float, TDate]:
+    """
+    Lsが各祝日の値を過ぎる日附.
+
+    標準時の各日の始まりのLsを求め、[其の日の始まり, 翌日の始まり) にLsが値を過ぎる日を選ぶ.
+    """
+    from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn_array
+    from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd_array
+    from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert_array
+    from imperial_calendar.transform.tert_to_mrls import tert_to_mrls_array
+
+    (start, _) = imdt_to_imsn_array([year], [1], [1], [0], [0], [0])
+    days = start[0] + np.arange(len(dates) + 1, dtype=np.int64)
+    mrls = tert_to_mrls_array(
+        mrsd_to_tert_array(imsn_to_mrsd_array(days, np.zeros(len(days))))
+    )
+    found = {}
+    for ls, _ in solar_longitude_holidays:
+        angle = (mrls - ls + 180.0) % 360.0 - 180.0
+        crossing = np.nonzero((angle[:-1] <= 0.0) & (0.0 < angle[1:]))[0]
+        if len(crossing) != 0:
+            found[ls] = dates[crossing[0]]
+    return found
+
+
+def generate_holidays(year: int) -> THolidayNames:
+    """其の年の祝日の呼び名を規則から生成する. 返り値は {月: {日: [呼び名]}}."""
+    dates = year_dates(year)
+    names: t.Dict[TDate, t.List[str]] = {}
+    for month, day, name in fixed_holidays:
+        names.setdefault((month, day), []).append(name)
+    for days_before_end, name in year_end_holidays:
+        names.setdefault(dates[-1 - days_before_end], []).append(name)
+    found = solar_longitude_dates(year, dates)
+    for ls, name in solar_longitude_holidays:
+        if ls in found:
+            names.setdefault(found[ls], []).append(name)
+    for date in sorted(names.keys()):
+        if substitute_holiday in names[date] or not is_sunday(date[1]):
+            continue
+        i = dates.index(date) + 1
+        while i < len(dates) and dates[i] in names:
+            i += 1
+        if i < len(dates):
+            names[dates[i]] = [substitute_holiday]
+    holidays: THolidayNames = {}
+    for month, day in sorted(names.keys()):
+        holidays.setdefault(month, {})[day] = names[(month, day)]
+    return holidays
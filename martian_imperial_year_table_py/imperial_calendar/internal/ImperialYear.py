@@ -1,5 +1,7 @@
 """帝國火星曆の年."""
 
+import numpy as np  # __:skip
+
 
 class ImperialYear(object):
     """帝國火星曆の年."""
@@ -19,3 +21,37 @@ class ImperialYear(object):
             return 669
         else:
             return 668
+
+
+# __pragma__("skip")
+def years_array(start_year: int, stop_year: int) -> np.ndarray:
+    """start_year年からstop_year年の前年迄の年の配列."""
+    return np.arange(start_year, stop_year, dtype=np.int64)
+
+
+def is_leap_year_array(start_year: int, stop_year: int) -> np.ndarray:
+    """start_year年からstop_year年の前年迄の各年が閏年か否かの配列. 負の年も扱ふ."""
+    year = years_array(start_year, stop_year)
+    return (year % 2 == 1) | ((year % 10 == 0) & (year % 250 != 0))
+
+
+def days_array(start_year: int, stop_year: int) -> np.ndarray:
+    """start_year年からstop_year年の前年迄の各年の日數の配列."""
+    return np.where(is_leap_year_array(start_year, stop_year), 669, 668)
+
+
+def new_years_day_array(start_year: int, stop_year: int) -> np.ndarray:
+    """
+    start_year年からstop_year年迄 (stop_year年を含む) の各年の元日の通算日の配列.
+
+    0年の元日を0として、其れ迄の閏年の數を數へて直接求める. 隣り合ふ値の差が各年の日數になる.
+    """
+    year = years_array(start_year, stop_year + 1)
+    # 奇數年、10の倍數の年、250の倍數の年の數. 負の年では負に數へる
+    odd_years = year // 2
+    decade_years = -(-year // 10)
+    quarter_millennium_years = -(-year // 250)
+    return 668 * year + odd_years + decade_years - quarter_millennium_years
+
+
+# __pragma__("noskip")
@@ -0,0 +1,259 @@
+"""
+帝國火星曆の一月の暦の配置.
+
+`packages/calendar_svg` の `CalendarImage` が描く一月の暦と同じ內容を、描畫から切り離して求める.
+月の始まりと翌月の始まりとだけをUTCに變換し、其の閒は一火星日の長さづつ進めて各日を求めるので、
+日數に依らず曆法の變換は二回で濟む. 結果は (年, 月, 時閒帶) 每に記憶する.
+"""
+
+from functools import lru_cache
+from imperial_calendar.GregorianDateTime import FrozenGregorianDateTime
+from imperial_calendar.ImperialDateTime import FrozenImperialDateTime, ImperialDateTime
+from imperial_calendar.ImperialSolNumber import ImperialSolNumber
+from imperial_calendar.ImperialYearMonth import ImperialYearMonth
+from imperial_calendar.internal.HolidayMars import HolidayMars
+from imperial_calendar.internal.TimezoneTransitions import (
+    civil_from_days,
+    days_from_civil,
+)
+from imperial_calendar.internal.utc_seconds import (
+    imsn_to_utc_seconds,
+    local_midnight_to_utc_seconds,
+    utc_seconds_to_local_civil,
+)
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn
+import typing as t
+
+# 記憶する月の數
+month_grid_cache_size = 256
+# 一週の日數. 各月の1日が日曜
+days_of_week = 7
+
+
+class MonthGridSol(object):
+    """暦の一日. weekdayは日曜を0とし、grdtは其の日の始まりのグレゴリオ曆の日時."""
+
+    __slots__ = (
+        "column",
+        "day",
+        "grdt",
+        "holiday_names",
+        "is_grdt_holiday",
+        "is_holiday",
+        "row",
+        "weekday",
+    )
+
+    def __init__(
+        self,
+        day: int,
+        grdt: FrozenGregorianDateTime,
+        holiday_names: t.Tuple[str, ...],
+        is_grdt_holiday: bool,
+    ):
+        """Init."""
+        self.column = (day - 1) % days_of_week
+        self.day = day
+        self.grdt = grdt
+        self.holiday_names = holiday_names
+        self.is_grdt_holiday = is_grdt_holiday
+        self.is_holiday = len(holiday_names) != 0
+        self.row = (day - 1) // days_of_week
+        self.weekday = self.column
+
+    def __eq__(self, other: object) -> bool:
+        """Eq."""
+        return (
+            isinstance(other, MonthGridSol)
+            and self.day == other.day
+            and self.grdt == other.grdt
+            and self.holiday_names == other.holiday_names
+            and self.is_grdt_holiday == other.is_grdt_holiday
+        )
+
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (
+            self.__class__,
+            (self.day, self.grdt, self.holiday_names, self.is_grdt_holiday),
+        )
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"MonthGridSol({self.day}, {self.grdt!r}, {self.holiday_names!r}, {self.is_grdt_holiday!r})"
+
+
+class MonthGridGregorianDay(object):
+    """暦に掛かるグレゴリオ曆の一日. imdtは其の日の始まりの帝國火星曆の日時."""
+
+    __slots__ = ("grdt", "imdt", "is_holiday", "weekday")
+
+    def __init__(
+        self,
+        grdt: FrozenGregorianDateTime,
+        imdt: FrozenImperialDateTime,
+        is_holiday: bool,
+    ):
+        """Init."""
+        self.grdt = grdt
+        self.imdt = imdt
+        self.is_holiday = is_holiday
+        self.weekday = grdt.weekday
+
+    def __eq__(self, other: object) -> bool:
+        """Eq."""
+        return (
+            isinstance(other, MonthGridGregorianDay)
+            and self.grdt == other.grdt
+            and self.imdt == other.imdt
+            and self.is_holiday == other.is_holiday
+        )
+
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Pickle."""
+        return (self.__class__, (self.grdt, self.imdt, self.is_holiday))
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"MonthGridGregorianDay({self.grdt!r}, {self.imdt!r}, {self.is_holiday!r})"
+        )
+
+
+class MonthGrid(object):
+    """
+    帝國火星曆の一月の暦.
+
+    solsは月の各日、grdt_daysは月に掛かるグレゴリオ曆の各日 (月の始まりを含む日から).
+    startとendとは月の始まりと翌月の始まりとのグレゴリオ曆の日時.
+    """
+
+    __slots__ = (
+        "end",
+        "grdt_days",
+        "grdt_timezone",
+        "imdt_timezone",
+        "month",
+        "sols",
+        "start",
+        "year",
+    )
+
+    def __init__(
+        self,
+        year: int,
+        month: int,
+        grdt_timezone: str,
+        imdt_timezone: t.Optional[str],
+        sols: t.Tuple[MonthGridSol, ...],
+        grdt_days: t.Tuple[MonthGridGregorianDay, ...],
+        start: FrozenGregorianDateTime,
+        end: FrozenGregorianDateTime,
+    ):
+        """Init."""
+        self.end = end
+        self.grdt_days = grdt_days
+        self.grdt_timezone = grdt_timezone
+        self.imdt_timezone = imdt_timezone
+        self.month = month
+        self.sols = sols
+        self.start = start
+        self.year = year
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"MonthGrid({self.year}, {self.month}, {self.grdt_timezone!r}, {self.imdt_timezone!r})"
+
+    @property
+    def days(self) -> int:
+        """月の日數."""
+        return len(self.sols)
+
+    @property
+    def rows(self) -> int:
+        """暦の週の數."""
+        return -(-len(self.sols) // days_of_week)
+
+
+@lru_cache(maxsize=month_grid_cache_size)
+def month_grid(
+    year: int, month: int, grdt_timezone: str, imdt_timezone: t.Optional[str] = None
+) -> MonthGrid:
+    """
+    帝國火星曆のyear年month月の暦.
+
+    各日の始まりは、imdt_timezoneの時閒帶 (Noneなら標準時) の0時とし、grdt_timezoneの時閒帶のグレゴリオ曆で表す.
+    """
+    year_month = ImperialYearMonth(year, month)
+    days = year_month.days()
+    first = ImperialDateTime(year, month, 1, 0, 0, 0, imdt_timezone)
+    if imdt_timezone is not None:
+        first = first.to_standard_naive()
+    imsn = imdt_to_imsn(first)
+    start_utc = imsn_to_utc_seconds(imsn)
+    # 月の閒のΔTの變化は一次式で十分に近似できる
+    sol_seconds = (
+        imsn_to_utc_seconds(ImperialSolNumber(imsn.day + days, imsn.second)) - start_utc
+    ) / days
+    grdts = [
+        _utc_seconds_to_grdt(round(start_utc + sol_seconds * day), grdt_timezone)
+        for day in range(days + 1)
+    ]
+    sols = tuple(
+        MonthGridSol(
+            day,
+            grdts[day - 1],
+            tuple(HolidayMars.of(year, month, day).names),
+            grdts[day - 1].is_holiday,
+        )
+        for day in range(1, days + 1)
+    )
+    (start, end) = (grdts[0], grdts[-1])
+    # グレゴリオ曆の日付は0年以前も扱へる樣に1970年1月1日からの日數で數へる
+    first_days = days_from_civil(start.year, start.month, start.day)
+    last_days = days_from_civil(end.year, end.month, end.day)
+    if (end.hour, end.minute, end.second) == (0, 0, 0):
+        last_days -= 1
+    prev_month = year_month.prev_month()
+    grdt_days = []
+    for days in range(first_days, last_days + 1):
+        grdt_date = civil_from_days(days)
+        # 月の始まりからの秒數を火星日に換算して日と時刻とに分ける
+        (day, second) = divmod(
+            round(
+                (local_midnight_to_utc_seconds(*grdt_date, grdt_timezone) - start_utc)
+                / sol_seconds
+                * 24
+                * 60
+                * 60
+            ),
+            24 * 60 * 60,
+        )
+        (hour, minute) = divmod(second, 60 * 60)
+        (minute, second) = divmod(minute, 60)
+        if day < 0:
+            imdt = FrozenImperialDateTime(
+                prev_month.year,
+                prev_month.month,
+                prev_month.days() + day + 1,
+                hour,
+                minute,
+                second,
+                imdt_timezone,
+            )
+        else:
+            imdt = FrozenImperialDateTime(
+                year, month, day + 1, hour, minute, second, imdt_timezone
+            )
+        grdt = FrozenGregorianDateTime(*grdt_date, 0, 0, 0, grdt_timezone)
+        grdt_days.append(MonthGridGregorianDay(grdt, imdt, grdt.is_holiday))
+    return MonthGrid(
+        year, month, grdt_timezone, imdt_timezone, sols, tuple(grdt_days), start, end
+    )
+
+
+def _utc_seconds_to_grdt(utc_seconds: int, timezone: str) -> FrozenGregorianDateTime:
+    """UTCの1970年1月1日正子からの秒數を地方時のグレゴリオ曆の日時に變換する."""
+    return FrozenGregorianDateTime(
+        *utc_seconds_to_local_civil(utc_seconds, timezone), timezone
+    )
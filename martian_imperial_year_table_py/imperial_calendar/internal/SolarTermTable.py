@@ -0,0 +1,162 @@
+"""
+二十四節氣の境界の時刻の表.
+
+表は帝國火星日 (float64) と節氣の番號 (uint8) との組を時刻順に竝べた構造化配列で、`.npy` 形式で保存する.
+讀み込む時はmemory-mapするので、表の大きさに依らず讀み込みは速く、檢索は二分探索で濟む.
+
+`python -m imperial_calendar.internal.SolarTermTable <path> <start_year> <stop_year>` で表を生成する.
+"""
+
+from imperial_calendar.internal.ImperialYear import new_years_day_array
+from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd_array
+from imperial_calendar.transform.mrls_to_imsn import (
+    mars_tropical_year,
+    next_mrls_crossing_array,
+)
+from imperial_calendar.transform.mrsd_to_imsn import mrsd_to_imsn_array
+from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert_array
+from imperial_calendar.transform.tert_to_mrsd import tert_to_mrsd_array
+import argparse
+import numpy as np
+import numpy.typing as npt
+import typing as t
+
+solar_term_count = 24
+solar_term_dtype = np.dtype([("imperial_sol_number", "<f8"), ("term", "u1")])
+
+
+def solar_term_mrls(term: npt.ArrayLike) -> np.ndarray:
+    """節氣の始まりのLs. 0番の立春が315度."""
+    return (315.0 + 15.0 * np.asarray(term)) % 360.0
+
+
+def imsn_to_offset_t_j2000_array(imperial_sol_number: npt.ArrayLike) -> np.ndarray:
+    """帝國火星日の配列をJ2000元期からの經過日數 (地球時) の配列に變換する."""
+    imperial_sol_number = np.asarray(imperial_sol_number, dtype=np.float64)
+    day = np.floor(imperial_sol_number).astype(np.int64)
+    second = (imperial_sol_number - day) * 60.0 * 60.0 * 24.0
+    return mrsd_to_tert_array(imsn_to_mrsd_array(day, second)) - 2451545.0
+
+
+def offset_t_j2000_to_imsn_array(offset_t_j2000: npt.ArrayLike) -> np.ndarray:
+    """J2000元期からの經過日數 (地球時) の配列を帝國火星日の配列に變換する."""
+    (day, second) = mrsd_to_imsn_array(
+        tert_to_mrsd_array(np.asarray(offset_t_j2000, dtype=np.float64) + 2451545.0)
+    )
+    return day + second / (60.0 * 60.0 * 24.0)
+
+
+def year_start_imsn_array(start_year: int, stop_year: int) -> np.ndarray:
+    """start_year年からstop_year年迄 (兩端を含む) の元日の帝國火星日の配列."""
+    return new_years_day_array(start_year, stop_year).astype(np.float64)
+
+
+def generate_solar_term_table(start_year: int, stop_year: int) -> np.ndarray:
+    """
+    start_year年の元日からstop_year年の元日迄の節氣の境界の表を生成する.
+
+    一年の長さは太陽年と僅かに違ふので、各年の元日と其の半太陽年後との二つの時刻から一太陽年の閒を探して、
+    漏れ無く求めてから重複を除く.
+    """
+    year_starts = year_start_imsn_array(start_year, stop_year)
+    offsets = imsn_to_offset_t_j2000_array(year_starts)
+    window_starts = np.concatenate(
+        [offsets[:-1], offsets[:-1] + mars_tropical_year / 2]
+    )
+    terms = np.arange(solar_term_count, dtype=np.uint8)
+    crossings = next_mrls_crossing_array(
+        window_starts[:, np.newaxis], solar_term_mrls(terms)[np.newaxis, :]
+    ).ravel()
+    crossing_terms = np.broadcast_to(terms, (window_starts.size, terms.size)).ravel()
+    order = np.argsort(crossings, kind="stable")
+    crossings = crossings[order]
+    crossing_terms = crossing_terms[order]
+    # 同じ境界を二つの時刻から求めた重複. 異なる境界は二十日以上離れてゐる
+    unique = np.concatenate([[True], np.diff(crossings) > 1.0])
+    imperial_sol_numbers = offset_t_j2000_to_imsn_array(crossings[unique])
+    crossing_terms = crossing_terms[unique]
+    within = (year_starts[0] <= imperial_sol_numbers) & (
+        imperial_sol_numbers < year_starts[-1]
+    )
+    table = np.empty(np.count_nonzero(within), dtype=solar_term_dtype)
+    table["imperial_sol_number"] = imperial_sol_numbers[within]
+    table["term"] = crossing_terms[within]
+    return table
+
+
+def save_solar_term_table(path: str, table: np.ndarray) -> None:
+    """表を `.npy` 形式で保存する."""
+    with open(path, "wb") as file:
+        np.save(file, table, allow_pickle=False)
+
+
+def load_solar_term_table(path: str) -> "SolarTermTable":
+    """表をmemory-mapして讀み込む."""
+    table = np.load(path, mmap_mode="r", allow_pickle=False)
+    if table.dtype != solar_term_dtype or table.ndim != 1:
+        raise Exception(f"Not a solar term table: {path}")
+    return SolarTermTable(table)
+
+
+class SolarTermTable(object):
+    """節氣の境界の表を二分探索する."""
+
+    imperial_sol_numbers: np.ndarray
+    table: np.ndarray
+    terms: np.ndarray
+
+    def __init__(self, table: np.ndarray):
+        """Init."""
+        self.imperial_sol_numbers = table["imperial_sol_number"]
+        self.table = table
+        self.terms = table["term"]
+
+    def __len__(self) -> int:
+        """Len."""
+        return len(self.table)
+
+    def covers(self, start: float, stop: float) -> bool:
+        """[start, stop) の節氣が表から分かるか. 最初の境界より前と最後の境界以後とは分からない."""
+        return (
+            len(self.table) != 0
+            and self.imperial_sol_numbers[0] <= start
+            and stop <= self.imperial_sol_numbers[-1]
+        )
+
+    def find(self, imperial_sol_number: float) -> t.Optional[t.Tuple[int, float]]:
+        """其の時刻の節氣 (番號, 始まりの帝國火星日). 表の範圍外ならNone."""
+        if not self.covers(imperial_sol_number, imperial_sol_number):
+            return None
+        i = int(
+            np.searchsorted(self.imperial_sol_numbers, imperial_sol_number, "right")
+        )
+        if i == len(self.table):
+            return None
+        return (int(self.terms[i - 1]), float(self.imperial_sol_numbers[i - 1]))
+
+    def between(self, start: float, stop: float) -> t.List[t.Tuple[int, float]]:
+        """[start, stop) に始まる節氣 (番號, 始まりの帝國火星日) の一覽."""
+        lower = int(np.searchsorted(self.imperial_sol_numbers, start, "left"))
+        upper = int(np.searchsorted(self.imperial_sol_numbers, stop, "left"))
+        return [
+            (int(term), float(imperial_sol_number))
+            for (imperial_sol_number, term) in zip(
+                self.imperial_sol_numbers[lower:upper], self.terms[lower:upper]
+            )
+        ]
+
+
+def main() -> None:
+    """表を生成して保存する."""
+    parser = argparse.ArgumentParser(description="二十四節氣の境界の表を生成する.")
+    parser.add_argument("path")
+    parser.add_argument("start_year", type=int)
+    parser.add_argument("stop_year", type=int)
+    args = parser.parse_args()
+    table = generate_solar_term_table(args.start_year, args.stop_year)
+    save_solar_term_table(args.path, table)
+    print(f"{args.path}: {len(table)} terms, {table.nbytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
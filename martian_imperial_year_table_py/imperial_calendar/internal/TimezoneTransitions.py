@@ -0,0 +1,187 @@
+"""名前附きの時閒帶の切替の表."""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
+from imperial_calendar.internal.timezone import (
+    fixed_offset_seconds,
+    resolve_timezone,
+    timezone_cache_size,
+)
+import numpy as np
+import numpy.typing as npt
+import typing as t
+
+epoch = datetime(1970, 1, 1)
+
+
+def civil_to_seconds_array(
+    year: npt.ArrayLike,
+    month: npt.ArrayLike,
+    day: npt.ArrayLike,
+    hour: npt.ArrayLike,
+    minute: npt.ArrayLike,
+    second: npt.ArrayLike,
+) -> np.ndarray:
+    """グレゴリオ曆の日時の配列を1970年1月1日正子からの秒數の配列に變換する."""
+    (year, month, day, hour, minute, second) = np.broadcast_arrays(
+        *(
+            np.asarray(field, dtype=np.int64)
+            for field in (year, month, day, hour, minute, second)
+        )
+    )
+    days = (
+        (year - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (month - 1)
+    ).astype("datetime64[D]").astype(np.int64) + (day - 1)
+    return days * (24 * 60 * 60) + hour * (60 * 60) + minute * 60 + second
+
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """
+    グレゴリオ曆の日付を1970年1月1日からの日數に變換する.
+
+    `datetime` を使はず整數で計算するので、0年以前や10000年以後も扱へる. 年は天文學的な年 (紀元前1年が0年).
+    """
+    # 3月始まりの年に直すと閏日が年の最後に來る
+    year -= 1 if month <= 2 else 0
+    (era, year_of_era) = divmod(year, 400)
+    day_of_year = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def civil_from_days(days: int) -> t.Tuple[int, int, int]:
+    """1970年1月1日からの日數をグレゴリオ曆の日付 (年, 月, 日) に變換する. `days_from_civil` の逆."""
+    (era, day_of_era) = divmod(days + 719468, 146097)
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 if shifted_month < 10 else shifted_month - 9
+    return (era * 400 + year_of_era + (1 if month <= 2 else 0), month, day)
+
+
+def civil_to_seconds(
+    year: int, month: int, day: int, hour: int, minute: int, second: int
+) -> int:
+    """グレゴリオ曆の日時を1970年1月1日正子からの秒數に變換する."""
+    return (
+        days_from_civil(year, month, day) * (24 * 60 * 60)
+        + hour * (60 * 60)
+        + minute * 60
+        + second
+    )
+
+
+def seconds_to_civil(seconds: int) -> t.Tuple[int, int, int, int, int, int]:
+    """1970年1月1日正子からの秒數をグレゴリオ曆の日時 (年, 月, 日, 時, 分, 秒) に變換する."""
+    (days, second) = divmod(seconds, 24 * 60 * 60)
+    (hour, second) = divmod(second, 60 * 60)
+    (minute, second) = divmod(second, 60)
+    (year, month, day) = civil_from_days(days)
+    return (year, month, day, hour, minute, second)
+
+
+def seconds_to_datetime(seconds: int) -> datetime:
+    """1970年1月1日正子からの秒數をnaiveなdatetimeに變換する."""
+    return epoch + timedelta(seconds=seconds)
+
+
+class TimezoneTransitions(object):
+    """
+    名前附きの時閒帶の切替の表.
+
+    pytzの時閒帶から切替の時刻 (UTC) とオフセットとを一度だけ取り出し、二分探索で引く.
+    結果はpytzの `fromutc`・`localize` と同じになる. 地方時が曖昧な時刻と存在しない時刻とだけは
+    pytzに任せる.
+    """
+
+    def __init__(self, zone: tzinfo) -> None:
+        """Init."""
+        self.zone = zone
+        if hasattr(zone, "_utc_transition_times"):
+            any_zone = t.cast(t.Any, zone)
+            self.transitions: t.List[int] = [
+                (transition - epoch) // timedelta(seconds=1)
+                for transition in any_zone._utc_transition_times
+            ]
+            self.offsets: t.List[int] = [
+                utcoffset // timedelta(seconds=1)
+                for (utcoffset, _, _) in any_zone._transition_info
+            ]
+        else:
+            # 切替の無い時閒帶 (UTCなど)
+            utcoffset = zone.utcoffset(epoch) or timedelta(0)
+            self.transitions = [(datetime.min - epoch) // timedelta(seconds=1)]
+            self.offsets = [utcoffset // timedelta(seconds=1)]
+        self._transitions = np.array(self.transitions, dtype=np.int64)
+        self._offsets = np.array(self.offsets, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"TimezoneTransitions({self.zone!r})"
+
+    def utc_offset(self, utc_seconds: int) -> int:
+        """UTCの時刻 (1970年1月1日正子からの秒數) に於ける地方時のオフセット (秒)."""
+        return self.offsets[max(0, bisect_right(self.transitions, utc_seconds) - 1)]
+
+    def utc_offsets(self, utc_seconds: npt.ArrayLike) -> np.ndarray:
+        """UTCの時刻の配列に於ける地方時のオフセット (秒) の配列."""
+        return self._offsets[self._index(np.asarray(utc_seconds, dtype=np.int64))]
+
+    def local_offset(self, local_seconds: int, is_dst: t.Optional[bool] = False) -> int:
+        """地方時の時刻に對するUTCからのオフセット (秒). is_dstはpytzのlocalizeと同じ."""
+        candidates = set()
+        for delta in (-24 * 60 * 60, 24 * 60 * 60):
+            offset = self.offsets[
+                max(0, bisect_right(self.transitions, local_seconds + delta) - 1)
+            ]
+            if self.utc_offset(local_seconds - offset) == offset:
+                candidates.add(offset)
+        if len(candidates) == 1:
+            return candidates.pop()
+        return self._localize_offset(local_seconds, is_dst)
+
+    def local_offsets(
+        self, local_seconds: npt.ArrayLike, is_dst: t.Optional[bool] = False
+    ) -> np.ndarray:
+        """地方時の時刻の配列に對するUTCからのオフセット (秒) の配列."""
+        local_seconds = np.asarray(local_seconds, dtype=np.int64)
+        (before, after) = (
+            self._offsets[self._index(local_seconds + delta)]
+            for delta in (-24 * 60 * 60, 24 * 60 * 60)
+        )
+        before_valid = self.utc_offsets(local_seconds - before) == before
+        after_valid = self.utc_offsets(local_seconds - after) == after
+        offsets = np.where(before_valid, before, after)
+        unresolved = ~(before_valid | after_valid) | (
+            before_valid & after_valid & (before != after)
+        )
+        for index in zip(*np.nonzero(unresolved)):
+            offsets[index] = self._localize_offset(int(local_seconds[index]), is_dst)
+        return offsets
+
+    def _index(self, seconds: np.ndarray) -> np.ndarray:
+        """切替の表の添字."""
+        return np.maximum(
+            0, np.searchsorted(self._transitions, seconds, side="right") - 1
+        )
+
+    def _localize_offset(self, local_seconds: int, is_dst: t.Optional[bool]) -> int:
+        """曖昧な時刻や存在しない時刻のオフセットをpytzで求める."""
+        utcoffset = t.cast(t.Any, self.zone).utcoffset(
+            seconds_to_datetime(local_seconds), is_dst
+        )
+        return (utcoffset or timedelta(0)) // timedelta(seconds=1)
+
+
+@lru_cache(maxsize=timezone_cache_size)
+def timezone_transitions(timezone: str) -> t.Optional[TimezoneTransitions]:
+    """名前附きの時閒帶の切替の表. 固定オフセットの時閒帶ならNoneを返す."""
+    if fixed_offset_seconds(timezone) is not None:
+        return None
+    return TimezoneTransitions(resolve_timezone(timezone))
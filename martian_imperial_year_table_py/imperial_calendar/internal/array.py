@@ -0,0 +1,18 @@
+"""配列演算の補助."""
+
+import numpy as np
+import typing as t
+
+
+def normalize_day(
+    day: np.ndarray, second: np.ndarray
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """秒が一日の範圍を外れた分を日に繰り上げ (繰り下げ) る."""
+    underflow = second < 0.0
+    overflow = second >= 24.0 * 60.0 * 60.0
+    return (
+        day - underflow + overflow,
+        second
+        + np.where(underflow, 24.0 * 60.0 * 60.0, 0.0)
+        - np.where(overflow, 24.0 * 60.0 * 60.0, 0.0),
+    )
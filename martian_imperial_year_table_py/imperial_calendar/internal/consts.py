@@ -2,6 +2,7 @@
 
 from imperial_calendar.internal.ImperialMonth import ImperialMonth
 from imperial_calendar.internal.ImperialYear import ImperialYear
+import typing as t
 
 
 def sums(lst):
@@ -26,3 +27,89 @@ imperial_month_to_imsn_table = [0]
 for month in range(1, 24):
     imperial_month_to_imsn_table.insert(month, ImperialMonth(month).days())
 imperial_month_to_imsn_table = sums(imperial_month_to_imsn_table)
+
+# ΔTの多項式の區閒の境界 (年).
+# 參考文獻: https://eclipse.gsfc.nasa.gov/SEhelp/deltatpoly2004.html
+delta_t_breakpoint_years = [
+    -500,
+    500,
+    1600,
+    1700,
+    1800,
+    1860,
+    1900,
+    1920,
+    1941,
+    1961,
+    1986,
+    2005,
+    2050,
+    2150,
+]
+
+# 區閒毎の (基準年, 年の單位, 多項式の係數). ΔT = Σ 係數[k] * ((年 - 基準年) / 單位)**k
+delta_t_polynomials: t.List[t.Tuple[float, float, t.List[float]]] = [
+    (1820.0, 100.0, [-20.0, 0.0, 32.0]),
+    (
+        0.0,
+        100.0,
+        [
+            10583.6,
+            -1014.41,
+            33.78311,
+            -5.952053,
+            -0.1798452,
+            0.022174192,
+            0.0090316521,
+        ],
+    ),
+    (
+        1000.0,
+        100.0,
+        [
+            1574.2,
+            -556.01,
+            71.23472,
+            0.319781,
+            -0.8503463,
+            -0.005050998,
+            0.0083572073,
+        ],
+    ),
+    (1600.0, 1.0, [120.0, -0.9808, -0.01532, 1 / 7129]),
+    (1700.0, 1.0, [8.83, 0.1603, -0.0059285, 0.00013336, -1 / 1174000]),
+    (
+        1800.0,
+        1.0,
+        [
+            13.72,
+            -0.332447,
+            0.0068612,
+            0.0041116,
+            -0.00037436,
+            0.0000121272,
+            -0.0000001699,
+            0.000000000875,
+        ],
+    ),
+    (
+        1860.0,
+        1.0,
+        [7.62, 0.5737, -0.251754, 0.01680668, -0.0004473624, 1 / 233174],
+    ),
+    (1900.0, 1.0, [-2.79, 1.494119, -0.0598939, 0.0061966, -0.000197]),
+    (1920.0, 1.0, [21.20, 0.84493, -0.076100, 0.0020936]),
+    (1950.0, 1.0, [29.07, 0.407, -1 / 233, 1 / 2547]),
+    (1975.0, 1.0, [45.45, 1.067, -1 / 260, -1 / 718]),
+    (
+        2000.0,
+        1.0,
+        [63.86, 0.3345, -0.060734, 0.0017275, 0.000651814, 0.00002373599],
+    ),
+    # 2005-2050の近似式は自作。參考文獻に準拠した式は下記。
+    # (2000.0, 1.0, [62.92, 0.32217, 0.005589]),
+    (2000.0, 1.0, [63.795, 0.1287, 0.0091]),
+    # -20 + 32 * ((年 - 1820) / 100)**2 - 0.5628 * (2150 - 年) を展開したもの.
+    (1820.0, 100.0, [-20.0 - 0.5628 * 330.0, 0.5628 * 100.0, 32.0]),
+    (1820.0, 100.0, [-20.0, 0.0, 32.0]),
+]
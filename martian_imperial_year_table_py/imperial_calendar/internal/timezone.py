@@ -0,0 +1,80 @@
+"""時閒帶の解決."""
+
+from datetime import timedelta, timezone as tz_c, tzinfo
+from functools import lru_cache
+from pytz import timezone as tz
+import re
+import typing as t
+
+# 記憶する時閒帶の數
+timezone_cache_size = 256
+
+
+def parse_fixed_offset(timezone: str) -> t.Optional[t.Tuple[int, int, int]]:
+    """`±HH:MM` 形式の時閒帶を (符號, 時, 分) に分ける. 其の形式でなければNoneを返す."""
+    (hours, colon, minutes) = timezone[1:].partition(":")
+    if (
+        timezone[:1] in ("+", "-")
+        and colon
+        and 1 <= len(hours) <= 2
+        and 1 <= len(minutes) <= 2
+        and hours.isdecimal()
+        and minutes.isdecimal()
+    ):
+        if timezone[0] == "-":
+            sign = -1
+        else:
+            sign = 1
+        return (sign, int(hours), int(minutes))
+    # 速い經路で讀めない稀な書き方 (末尾の改行など) は正規表現で讀む
+    match = re.match(
+        r"^(?P<sign>[-+])(?P<hours>\d{1,2}):(?P<minutes>\d{1,2})$", timezone
+    )
+    if match:
+        if match.group("sign") == "-":
+            sign = -1
+        else:
+            sign = 1
+        return (sign, int(match.group("hours")), int(match.group("minutes")))
+    return None
+
+
+@lru_cache(maxsize=timezone_cache_size)
+def fixed_offset(timezone: str) -> t.Optional[t.Tuple[int, int, int]]:
+    """parse_fixed_offsetの結果を記憶する."""
+    return parse_fixed_offset(timezone)
+
+
+@lru_cache(maxsize=timezone_cache_size)
+def fixed_timezone(sign: int, hours: int, minutes: int) -> tzinfo:
+    """固定オフセットの時閒帶. 同じオフセットには同じobjectを返す."""
+    return tz_c(sign * timedelta(hours=hours, minutes=minutes))
+
+
+@lru_cache(maxsize=timezone_cache_size)
+def resolve_timezone(timezone: str) -> tzinfo:
+    """時閒帶の文字列を `±HH:MM` なら固定オフセットの、其れ以外ならpytzの時閒帶にする."""
+    offset = fixed_offset(timezone)
+    if offset is not None:
+        return fixed_timezone(*offset)
+    return tz(timezone)
+
+
+@lru_cache(maxsize=timezone_cache_size)
+def fixed_offset_seconds(timezone: str) -> t.Optional[float]:
+    """固定オフセットの時閒帶のUTCからのオフセット (秒). 名前附きの時閒帶ならNoneを返す."""
+    offset = fixed_offset(timezone)
+    if offset is None:
+        return None
+    (sign, hours, minutes) = offset
+    return sign * timedelta(hours=hours, minutes=minutes).total_seconds()
+
+
+@lru_cache(maxsize=timezone_cache_size)
+def offset_hours(timezone: str) -> float:
+    """`±HH:MM` 形式の時閒帶の標準時からのオフセット (時閒)."""
+    offset = fixed_offset(timezone)
+    if offset is None:
+        raise Exception(f"Unknown timezone format: {timezone}")
+    (sign, hours, minutes) = offset
+    return float(sign) * (hours + (minutes / 60.0))
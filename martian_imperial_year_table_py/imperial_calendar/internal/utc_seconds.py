@@ -0,0 +1,49 @@
+"""UTCの1970年1月1日正子からの秒數を介した變換."""
+
+from imperial_calendar.ImperialSolNumber import ImperialSolNumber
+from imperial_calendar.internal.timezone import fixed_offset_seconds
+from imperial_calendar.internal.TimezoneTransitions import (
+    TimezoneTransitions,
+    civil_to_seconds,
+    seconds_to_civil,
+    timezone_transitions,
+)
+from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd
+from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert
+from imperial_calendar.transform.tert_to_juld import tert_to_juld
+import typing as t
+
+# UTCの1970年1月1日正子のユリウス通日
+unix_epoch_juld = 2440587.5
+
+
+def imsn_to_utc_seconds(imsn: ImperialSolNumber) -> float:
+    """帝國火星日をUTCの1970年1月1日正子からの秒數に變換する."""
+    return (
+        tert_to_juld(mrsd_to_tert(imsn_to_mrsd(imsn))).julian_day - unix_epoch_juld
+    ) * (24 * 60 * 60)
+
+
+def local_midnight_to_utc_seconds(
+    year: int, month: int, day: int, timezone: str
+) -> int:
+    """地方時の其の日の0時をUTCの1970年1月1日正子からの秒數に變換する."""
+    local_seconds = civil_to_seconds(year, month, day, 0, 0, 0)
+    offset = fixed_offset_seconds(timezone)
+    if offset is None:
+        offset = t.cast(
+            TimezoneTransitions, timezone_transitions(timezone)
+        ).local_offset(local_seconds)
+    return local_seconds - int(offset)
+
+
+def utc_seconds_to_local_civil(
+    utc_seconds: int, timezone: str
+) -> t.Tuple[int, int, int, int, int, int]:
+    """UTCの1970年1月1日正子からの秒數を地方時のグレゴリオ曆の日時 (年, 月, 日, 時, 分, 秒) に變換する."""
+    offset = fixed_offset_seconds(timezone)
+    if offset is None:
+        offset = t.cast(TimezoneTransitions, timezone_transitions(timezone)).utc_offset(
+            utc_seconds
+        )
+    return seconds_to_civil(utc_seconds + int(offset))
@@ -0,0 +1,177 @@
+"""
+大量の日時をprocess poolで竝列に變換する.
+
+入力を年の順に竝べてchunk_size個づつの塊に分け、`concurrent.futures` のprocess poolに配る.
+一つの塊の日時は近い時期に收まるので、各workerではΔTの多項式の區閒や時閒帶の切替の表が塊の中で使ひ回される.
+塊はworkerへ (年, 月, 日, 時, 分, 秒) の配列で渡し、結果は入力の順に竝べて返す.
+
+workerで竝列に進むのは配列の變換だけである. `convert_many` のobjectの讀み書きは呼んだprocessで行ふので、
+大量の日時は `convert_fields_many` に配列で渡す方が速い.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from imperial_calendar.GregorianDateTime import GregorianDateTime
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.internal.TimezoneTransitions import timezone_transitions
+from imperial_calendar.transform.grdt_to_imdt import grdt_to_imdt_array
+from imperial_calendar.transform.imdt_to_grdt import imdt_to_grdt_array
+from operator import attrgetter
+import numpy as np
+import numpy.typing as npt
+import typing as t
+
+# 一つの塊の日時の數
+convert_many_chunk_size = 65536
+
+TDateTime = t.Union[GregorianDateTime, ImperialDateTime]
+TFields = t.Tuple[
+    np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray
+]
+# (グレゴリオ曆から變換するか, 入力の時閒帶, 出力の時閒帶, 入力の (年, 月, 日, 時, 分, 秒) の配列)
+TChunk = t.Tuple[bool, t.Optional[str], t.Optional[str], TFields]
+
+_fields_of = attrgetter("year", "month", "day", "hour", "minute", "second")
+
+
+def convert_fields_many(
+    fields: t.Sequence[npt.ArrayLike],
+    from_gregorian: bool,
+    timezone: t.Optional[str],
+    target_timezone: t.Optional[str],
+    chunk_size: int = convert_many_chunk_size,
+    max_workers: t.Optional[int] = None,
+) -> TFields:
+    """
+    (年, 月, 日, 時, 分, 秒) の配列の組を一括で變換する.
+
+    from_gregorianならtimezoneのグレゴリオ曆の日時をtarget_timezoneの帝國火星曆の日時に、
+    さうでなければtimezoneの帝國火星曆の日時をtarget_timezoneのグレゴリオ曆の日時に變換する.
+    時閒帶の扱ひは `grdt_to_imdt_array` と `imdt_to_grdt_array` とに從ふ.
+    """
+    columns = t.cast(TFields, tuple(np.asarray(a, dtype=np.int64) for a in fields))
+    parts = _split(columns, from_gregorian, timezone, target_timezone, chunk_size)
+    converted = t.cast(TFields, tuple(np.empty_like(a) for a in columns))
+    for (indices, _), result in zip(
+        parts, _map_chunks([chunk for (_, chunk) in parts], max_workers)
+    ):
+        for column, values in zip(converted, result):
+            column[indices] = values
+    return converted
+
+
+def convert_many(
+    values: t.Sequence[TDateTime],
+    grdt_timezone: t.Optional[str] = None,
+    imdt_timezone: t.Optional[str] = None,
+    chunk_size: int = convert_many_chunk_size,
+    max_workers: t.Optional[int] = None,
+) -> t.List[TDateTime]:
+    """
+    GregorianDateTimeはImperialDateTimeに、ImperialDateTimeはGregorianDateTimeに變換して、入力の順に返す.
+
+    帝國火星曆の日時はimdt_timezoneの時閒帶 (Noneなら標準時)、グレゴリオ曆の日時はgrdt_timezoneの時閒帶
+    (NoneならUTC) で表す. max_workersが1か塊が一つだけなら、process poolを使はずに此のprocessで變換する.
+    """
+    groups: t.Dict[t.Tuple[bool, t.Optional[str]], t.List[int]] = {}
+    for i, value in enumerate(values):
+        if not isinstance(value, (GregorianDateTime, ImperialDateTime)):
+            raise Exception(f"Unknown date time: {value!r}")
+        groups.setdefault(
+            (isinstance(value, GregorianDateTime), value.timezone), []
+        ).append(i)
+    group_indices: t.List[np.ndarray] = []
+    parts: t.List[t.Tuple[np.ndarray, TChunk]] = []
+    for (from_gregorian, timezone), group in groups.items():
+        columns = t.cast(
+            TFields,
+            tuple(
+                np.array([_fields_of(values[i]) for i in group], dtype=np.int64)
+                .reshape(-1, 6)
+                .T
+            ),
+        )
+        group_indices.append(np.asarray(group, dtype=np.int64))
+        parts.extend(
+            (group_indices[-1][indices], chunk)
+            for (indices, chunk) in _split(
+                columns,
+                from_gregorian,
+                timezone,
+                imdt_timezone if from_gregorian else grdt_timezone,
+                chunk_size,
+            )
+        )
+    results: t.List[t.Optional[TDateTime]] = [None] * len(values)
+    for (indices, chunk), converted in zip(
+        parts, _map_chunks([chunk for (_, chunk) in parts], max_workers)
+    ):
+        (from_gregorian, _, target_timezone, _) = chunk
+        cls: t.Type[TDateTime] = (
+            ImperialDateTime if from_gregorian else GregorianDateTime
+        )
+        for i, year, month, day, hour, minute, second in zip(
+            indices.tolist(), *(column.tolist() for column in converted)
+        ):
+            results[i] = cls(year, month, day, hour, minute, second, target_timezone)
+    return t.cast(t.List[TDateTime], results)
+
+
+def _split(
+    columns: TFields,
+    from_gregorian: bool,
+    timezone: t.Optional[str],
+    target_timezone: t.Optional[str],
+    chunk_size: int,
+) -> t.List[t.Tuple[np.ndarray, TChunk]]:
+    """配列の組を年の順に竝べて塊に分け、各塊の元の添字と共に返す."""
+    if chunk_size <= 0:
+        raise Exception(f"chunk_size must be positive: {chunk_size}")
+    order = np.argsort(columns[0], kind="stable")
+    parts = []
+    for start, stop in zip(
+        range(0, len(order), chunk_size),
+        range(chunk_size, len(order) + chunk_size, chunk_size),
+    ):
+        indices = order[start:stop]
+        chunk = (
+            from_gregorian,
+            timezone,
+            target_timezone,
+            t.cast(TFields, tuple(column[indices] for column in columns)),
+        )
+        parts.append((indices, chunk))
+    return parts
+
+
+def _map_chunks(
+    chunks: t.List[TChunk], max_workers: t.Optional[int]
+) -> t.Iterator[TFields]:
+    """各塊を變換する. 結果は塊の順に返す."""
+    if max_workers == 1 or len(chunks) <= 1:
+        return map(_convert_chunk, chunks)
+    timezones = sorted(
+        {
+            timezone
+            for (from_gregorian, source, target, _) in chunks
+            for timezone in ((source,) if from_gregorian else (target,))
+            if timezone is not None
+        }
+    )
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_warm_up, initargs=(timezones,)
+    ) as executor:
+        return iter(list(executor.map(_convert_chunk, chunks)))
+
+
+def _convert_chunk(chunk: TChunk) -> TFields:
+    """一つの塊を變換する. workerで實行する."""
+    (from_gregorian, timezone, target_timezone, fields) = chunk
+    if from_gregorian:
+        return grdt_to_imdt_array(*fields, timezone, target_timezone)
+    return imdt_to_grdt_array(*fields, timezone, target_timezone)
+
+
+def _warm_up(timezones: t.List[str]) -> None:
+    """workerの始めにグレゴリオ曆の時閒帶の切替の表を讀んでおく."""
+    for timezone in timezones:
+        timezone_transitions(timezone)
@@ -0,0 +1,96 @@
+"""
+帝國火星曆の時刻の範圍を一定の閒隔で辿る.
+
+始めの時刻だけを變換し、其の後は年月日時分秒の各欄を繰り上げながら進めるので、各步で `imsn_to_imdt` を呼ばない.
+グレゴリオ曆の日時は帝國火星曆の一秒をUTCの秒に換算して進め、ΔTの變化の分は一定の閒隔で變換し直して補正する.
+"""
+
+from imperial_calendar.GregorianDateTime import GregorianDateTime
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.ImperialYearMonth import ImperialYearMonth
+from imperial_calendar.internal.utc_seconds import (
+    imsn_to_utc_seconds,
+    utc_seconds_to_local_civil,
+)
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn
+import typing as t
+
+# 帝國火星曆の一秒の地球時の秒數. `mrsd_to_tert` の係數
+earth_seconds_per_mars_second = 1.0274912517
+# グレゴリオ曆の日時を變換し直す閒隔 (帝國火星曆の秒)
+imdt_range_resync_seconds = 24 * 60 * 60
+
+
+def imdt_range(
+    start: ImperialDateTime, end: ImperialDateTime, step: int
+) -> t.Iterator[ImperialDateTime]:
+    """
+    start以上end未滿の時刻をstep秒每に返す.
+
+    各時刻はstartと同じ時閒帶で表す. 月の日數は `ImperialYearMonth.days` に從ふ.
+    """
+    for year, month, day, hour, minute, second in imdt_fields_range(start, end, step):
+        yield ImperialDateTime(year, month, day, hour, minute, second, start.timezone)
+
+
+def imdt_fields_range(
+    start: ImperialDateTime, end: ImperialDateTime, step: int
+) -> t.Iterator[t.Tuple[int, int, int, int, int, int]]:
+    """`imdt_range` と同じ時刻を (年, 月, 日, 時, 分, 秒) の組で返す."""
+    if step <= 0:
+        raise Exception(f"step must be positive: {step}")
+    end_key = end.sort_key
+    key = start.sort_key
+    (year, month, day) = (start.year, start.month, start.day)
+    second_of_day = (start.hour * 60 + start.minute) * 60 + start.second
+    days = ImperialYearMonth(year, month).days()
+    while key < end_key:
+        (hour, minute) = divmod(second_of_day, 60 * 60)
+        (minute, second) = divmod(minute, 60)
+        yield (year, month, day, hour, minute, second)
+        key += step
+        (carry, second_of_day) = divmod(second_of_day + step, 24 * 60 * 60)
+        day += carry
+        while day > days:
+            day -= days
+            next_month = ImperialYearMonth(year, month).next_month()
+            (year, month) = (next_month.year, next_month.month)
+            days = next_month.days()
+
+
+def imdt_grdt_range(
+    start: ImperialDateTime,
+    end: ImperialDateTime,
+    step: int,
+    grdt_timezone: str,
+    resync_seconds: int = imdt_range_resync_seconds,
+) -> t.Iterator[t.Tuple[ImperialDateTime, GregorianDateTime]]:
+    """
+    start以上end未滿の時刻をstep秒每に、grdt_timezoneの時閒帶のグレゴリオ曆の日時と組にして返す.
+
+    最後に變換してからresync_seconds秒以上進んだ時刻は變換し直す. 0なら每回變換する.
+    """
+    synced_elapsed = 0
+    synced_utc_seconds = 0.0
+    # 帝國火星曆の一秒に進むUTCの秒數. 二度目に變換し直してからはΔTの變化を含めた實測値を使ふ
+    rate = earth_seconds_per_mars_second
+    for i, imdt in enumerate(imdt_range(start, end, step)):
+        elapsed = i * step
+        if i == 0 or elapsed - synced_elapsed >= resync_seconds:
+            utc_seconds = _imdt_to_utc_seconds(imdt)
+            if i != 0:
+                rate = (utc_seconds - synced_utc_seconds) / (elapsed - synced_elapsed)
+            synced_elapsed = elapsed
+            synced_utc_seconds = utc_seconds
+        civil = utc_seconds_to_local_civil(
+            round(synced_utc_seconds + (elapsed - synced_elapsed) * rate),
+            grdt_timezone,
+        )
+        yield (imdt, GregorianDateTime(*civil, grdt_timezone))
+
+
+def _imdt_to_utc_seconds(imdt: ImperialDateTime) -> float:
+    """帝國火星曆の日時をUTCの1970年1月1日正子からの秒數に變換する."""
+    if imdt.timezone is not None:
+        imdt = imdt.to_standard_naive()
+    return imsn_to_utc_seconds(imdt_to_imsn(imdt))
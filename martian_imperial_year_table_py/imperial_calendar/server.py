@@ -0,0 +1,277 @@
+"""
+日時の變換のHTTP server.
+
+`packages/martian_api` と同じ經路を `asyncio` のstreamの上に實裝する.
+一つの接續で續けて送られた要求 (keep-alive, pipelining) は順に處理し、應答も其の順に返す.
+現在の帝國火星曆の日時は、UTCの一秒每に其の秒の始まりの時刻で時閒帶每の應答を作って記憶し、使ひ回す.
+其の爲、應答のgregorianDateTimeのミリ秒は常に0になる.
+"""
+
+from datetime import datetime, timezone as dt_timezone
+from imperial_calendar.datetime_conversion import (
+    build_current_imperial_date_time_response,
+    build_gregorian_to_imperial_response,
+    build_imperial_to_gregorian_response,
+    validate_timezone,
+)
+from urllib.parse import parse_qsl, urlsplit
+import asyncio
+import json
+import sys
+import time
+import traceback
+import typing as t
+
+# 次の要求を待つ秒數
+server_keep_alive_timeout = 5.0
+# 要求の行とheaderとの大きさの上限
+server_max_header_bytes = 16 * 1024
+# 要求のbodyの大きさの上限
+server_max_body_bytes = 64 * 1024
+# 一秒の閒に記憶する現在の日時の應答の時閒帶の數
+current_response_cache_size = 64
+
+reasons = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+TResponse = t.Tuple[int, bytes]
+
+
+class BadRequest(Exception):
+    """接續を閉ぢる他に無い不正な要求."""
+
+    def __init__(self, status: int, message: str):
+        """Init."""
+        super().__init__(message)
+        self.status = status
+
+
+def json_response(status: int, body: t.Any) -> TResponse:
+    """JSONの應答. JavaScriptの `JSON.stringify` と同じく空白を入れない."""
+    return (
+        status,
+        json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+    )
+
+
+def error_response(status: int, message: str) -> TResponse:
+    """誤りの應答."""
+    return json_response(status, {"message": message})
+
+
+class DateTimeConversionServer(object):
+    """日時の變換のHTTP server."""
+
+    def __init__(self, clock: t.Callable[[], float] = time.time):
+        """Init."""
+        self.clock = clock
+        self._current_second: t.Optional[int] = None
+        self._current_responses: t.Dict[str, TResponse] = {}
+
+    def handle(self, method: str, target: str, body: bytes) -> TResponse:
+        """一つの要求を處理して (status, body) を返す."""
+        url = urlsplit(target)
+        (path, query) = (url.path, url.query)
+        if method == "GET" and path == "/api/imperial-datetime/current":
+            return self.current_imperial_date_time(query)
+        if method == "POST" and path == "/api/gregorian-datetime/from-imperial":
+            return self.gregorian_date_time_from_imperial(body)
+        if method == "POST" and path == "/api/imperial-datetime/from-gregorian":
+            return self.imperial_date_time_from_gregorian(body)
+        return error_response(404, "Not Found")
+
+    def current_imperial_date_time(self, query: str) -> TResponse:
+        """GET /api/imperial-datetime/current."""
+        # 同じ名の引數が幾つも在れば最初のものを使ふ
+        timezone = dict(reversed(parse_qsl(query, keep_blank_values=True))).get(
+            "timezone", "+00:00"
+        )
+        validation_error = validate_timezone(timezone)
+        if validation_error is not None:
+            return error_response(400, validation_error)
+        second = int(self.clock())
+        if second != self._current_second:
+            self._current_second = second
+            self._current_responses = {}
+        response = self._current_responses.get(timezone)
+        if response is None:
+            try:
+                response = json_response(
+                    200,
+                    build_current_imperial_date_time_response(
+                        datetime.fromtimestamp(second, dt_timezone.utc), timezone
+                    ),
+                )
+            except Exception:
+                traceback.print_exc()
+                return error_response(500, "Internal server error")
+            if len(self._current_responses) < current_response_cache_size:
+                self._current_responses[timezone] = response
+        return response
+
+    def gregorian_date_time_from_imperial(self, body: bytes) -> TResponse:
+        """POST /api/gregorian-datetime/from-imperial."""
+        request = _parse_body(body, ("imperialDateTimeFormatted", "gregorianTimezone"))
+        if request is None:
+            return error_response(400, "Invalid request body")
+        (imperial_date_time_formatted, gregorian_timezone) = request
+        validation_error = validate_timezone(gregorian_timezone)
+        if validation_error is not None:
+            return error_response(400, validation_error)
+        try:
+            return json_response(
+                200,
+                build_imperial_to_gregorian_response(
+                    imperial_date_time_formatted, gregorian_timezone
+                ),
+            )
+        except Exception as error:
+            if str(error) == "Invalid imperialDateTimeFormatted":
+                return error_response(400, str(error))
+            traceback.print_exc()
+            return error_response(500, "Internal server error")
+
+    def imperial_date_time_from_gregorian(self, body: bytes) -> TResponse:
+        """POST /api/imperial-datetime/from-gregorian."""
+        request = _parse_body(body, ("gregorianDateTime", "imperialTimezone"))
+        if request is None:
+            return error_response(400, "Invalid request body")
+        (gregorian_date_time, imperial_timezone) = request
+        validation_error = validate_timezone(imperial_timezone)
+        if validation_error is not None:
+            return error_response(400, validation_error)
+        try:
+            return json_response(
+                200,
+                build_gregorian_to_imperial_response(
+                    gregorian_date_time, imperial_timezone
+                ),
+            )
+        except Exception as error:
+            if str(error) in (
+                "Invalid gregorianDateTime",
+                "Invalid gregorianDateTime format",
+            ):
+                return error_response(400, str(error))
+            traceback.print_exc()
+            return error_response(500, "Internal server error")
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """一つの接續の要求を順に處理する."""
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await _read_request(reader)
+                except BadRequest as error:
+                    writer.write(
+                        _serialize(error_response(error.status, str(error)), False)
+                    )
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                (method, target, body, keep_alive) = request
+                writer.write(_serialize(self.handle(method, target, body), keep_alive))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        """Serverを始める. portが0なら空いてゐるportを使ふ."""
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=server_max_header_bytes
+        )
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> t.Optional[t.Tuple[str, str, bytes, bool]]:
+    """要求を一つ讀んで (method, target, body, keep-alive) を返す. 接續が閉ぢられたらNone."""
+    try:
+        head = await asyncio.wait_for(
+            reader.readuntil(b"\r\n\r\n"), server_keep_alive_timeout
+        )
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise BadRequest(431, "Request Header Fields Too Large")
+    lines = head[:-4].decode("latin-1").split("\r\n")
+    request_line = lines[0].split(" ")
+    if len(request_line) != 3 or not request_line[2].startswith("HTTP/1."):
+        raise BadRequest(400, "Bad Request")
+    (method, target, version) = request_line
+    headers = {}
+    for line in lines[1:]:
+        (name, separator, value) = line.partition(":")
+        if separator == "":
+            raise BadRequest(400, "Bad Request")
+        headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise BadRequest(501, "Not Implemented")
+    try:
+        content_length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise BadRequest(400, "Bad Request")
+    if content_length < 0:
+        raise BadRequest(400, "Bad Request")
+    if content_length > server_max_body_bytes:
+        raise BadRequest(413, "Payload Too Large")
+    try:
+        body = await asyncio.wait_for(
+            reader.readexactly(content_length), server_keep_alive_timeout
+        )
+    except asyncio.IncompleteReadError:
+        return None
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        keep_alive = connection == "keep-alive"
+    else:
+        keep_alive = connection != "close"
+    return (method, target, body, keep_alive)
+
+
+def _parse_body(body: bytes, names: t.Tuple[str, str]) -> t.Optional[t.Tuple[str, str]]:
+    """JSONのbodyから二つの文字列を取り出す. 不正ならNone."""
+    try:
+        request = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(request, dict):
+        return None
+    values = tuple(request.get(name) for name in names)
+    if not all(isinstance(value, str) for value in values):
+        return None
+    return t.cast(t.Tuple[str, str], values)
+
+
+def _serialize(response: TResponse, keep_alive: bool) -> bytes:
+    """應答をHTTP/1.1の形にする."""
+    (status, body) = response
+    return (
+        f"HTTP/1.1 {status} {reasons[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    ).encode("latin-1") + body
+
+
+async def serve(host: str, port: int) -> None:
+    """Serverを始めて止められる迄待つ."""
+    server = await DateTimeConversionServer().start(host, port)
+    for socket in server.sockets:
+        print(f"Listening on {socket.getsockname()}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
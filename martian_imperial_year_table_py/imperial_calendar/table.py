@@ -0,0 +1,143 @@
+"""
+帝國火星曆とグレゴリオ曆との對照表.
+
+一年づつ、各日の帝國火星曆の日附を `imdt_fields_range` で繰り上げて求め、グレゴリオ曆の日時とMSDとLsとは
+其の年の分を配列で一括に求める. 何年分の表でも一年分より多くは保持しない.
+"""
+
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.internal.HolidayMars import Holidays
+from imperial_calendar.ranges import imdt_fields_range
+from imperial_calendar.transform.imdt_to_grdt import imdt_to_grdt_array
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn
+from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd_array
+from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert_array
+from imperial_calendar.transform.tert_to_mrls import tert_to_mrls_array
+import csv
+import json
+import numpy as np
+import typing as t
+
+table_columns = (
+    "imperial_date",
+    "gregorian_date_time",
+    "mars_sol_date",
+    "mrls",
+    "holidays",
+)
+table_formats = ("csv", "jsonl")
+
+# (帝國火星曆の日附, グレゴリオ曆の日時, MSD, Ls, 祝日の名)
+TTableRow = t.Tuple[str, str, float, float, t.Tuple[str, ...]]
+
+
+def format_year(year: int) -> str:
+    """年を四桁で書く. 0年より前はISO 8601の擴張形式に倣ひ `-0005` の樣に符號を附ける."""
+    if year < 0:
+        return "-%04d" % -year
+    return "%04d" % year
+
+
+def table_rows(
+    start_year: int,
+    end_year: int,
+    grdt_timezone: str,
+    imdt_timezone: t.Optional[str] = None,
+) -> t.Iterator[TTableRow]:
+    """
+    start_year年からend_year年迄 (兩端を含む) の各日の行.
+
+    各日の始まりは、imdt_timezoneの時閒帶 (Noneなら標準時) の0時とし、grdt_timezoneの時閒帶のグレゴリオ曆で表す.
+    """
+    for year in range(start_year, end_year + 1):
+        start = ImperialDateTime(year, 1, 1, 0, 0, 0, imdt_timezone)
+        dates = [
+            (month, day)
+            for (_, month, day, _, _, _) in imdt_fields_range(
+                start,
+                ImperialDateTime(year + 1, 1, 1, 0, 0, 0, imdt_timezone),
+                24 * 60 * 60,
+            )
+        ]
+        (months, days) = np.array(dates, dtype=np.int64).T
+        zeros = np.zeros(len(dates), dtype=np.int64)
+        grdts = np.stack(
+            imdt_to_grdt_array(
+                np.full(len(dates), year, dtype=np.int64),
+                months,
+                days,
+                zeros,
+                zeros,
+                zeros,
+                imdt_timezone,
+                grdt_timezone,
+            ),
+            axis=1,
+        ).tolist()
+        # 一日づつ進むので、標準時の帝國火星日の秒は年の始まりと變はらない
+        imsn = imdt_to_imsn(
+            start if imdt_timezone is None else start.to_standard_naive()
+        )
+        mars_sol_date = imsn_to_mrsd_array(
+            imsn.day + np.arange(len(dates), dtype=np.int64), imsn.second
+        )
+        mrls = tert_to_mrls_array(mrsd_to_tert_array(mars_sol_date)).tolist()
+        mars_sol_dates = mars_sol_date.tolist()
+        holiday_year = Holidays.index().year(year)
+        holidays = (
+            {}
+            if holiday_year is None
+            else {
+                date[1:]: tuple(holiday.names)
+                for (date, holiday) in holiday_year.by_date.items()
+            }
+        )
+        for i, (month, day) in enumerate(dates):
+            yield (
+                format_year(year) + "-%02d-%02d" % (month, day),
+                format_year(grdts[i][0])
+                + "-%02d-%02dT%02d:%02d:%02d" % tuple(grdts[i][1:]),
+                mars_sol_dates[i],
+                mrls[i],
+                holidays.get((month, day), ()),
+            )
+
+
+def write_table_csv(rows: t.Iterable[TTableRow], stream: t.TextIO) -> None:
+    """表をCSVで書き出す. 祝日の名は「・」で繋ぐ."""
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(table_columns)
+    for row in rows:
+        writer.writerow(row[:-1] + ("・".join(row[-1]),))
+
+
+def write_table_jsonl(rows: t.Iterable[TTableRow], stream: t.TextIO) -> None:
+    """表をJSON Linesで書き出す. 祝日の名は配列にする."""
+    template = (
+        '{"imperial_date": "%s", "gregorian_date_time": "%s", '
+        '"mars_sol_date": %r, "mrls": %r, "holidays": %s}\n'
+    )
+    for imperial_date, gregorian_date_time, mars_sol_date, mrls, names in rows:
+        # 日附と日時とは英數字だけなので、祝日の名だけを符號化する
+        stream.write(
+            template
+            % (
+                imperial_date,
+                gregorian_date_time,
+                mars_sol_date,
+                mrls,
+                json.dumps(list(names), ensure_ascii=False) if names else "[]",
+            )
+        )
+
+
+def write_table(
+    rows: t.Iterable[TTableRow], stream: t.TextIO, table_format: str
+) -> None:
+    """表をtable_formatの形式で書き出す."""
+    if table_format == "csv":
+        write_table_csv(rows, stream)
+    elif table_format == "jsonl":
+        write_table_jsonl(rows, stream)
+    else:
+        raise Exception(f"Unknown table format: {table_format}")
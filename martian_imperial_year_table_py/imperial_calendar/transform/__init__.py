@@ -1,27 +1,52 @@
 """帝國火星曆とグレゴリオ曆とを變換する."""
 
-from imperial_calendar.transform.grdt_to_juld import grdt_to_juld
-from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn
-from imperial_calendar.transform.imsn_to_imdt import imsn_to_imdt
-from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd
-from imperial_calendar.transform.juld_to_grdt import juld_to_grdt
-from imperial_calendar.transform.juld_to_tert import juld_to_tert
-from imperial_calendar.transform.mrsd_to_imsn import mrsd_to_imsn
-from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert
-from imperial_calendar.transform.tert_to_juld import tert_to_juld
-from imperial_calendar.transform.tert_to_mrls import tert_to_mrls
-from imperial_calendar.transform.tert_to_mrsd import tert_to_mrsd
+from imperial_calendar.transform.grdt_to_imdt import grdt_to_imdt_array
+from imperial_calendar.transform.grdt_to_juld import grdt_to_juld, grdt_to_juld_array
+from imperial_calendar.transform.imdt_to_grdt import imdt_to_grdt_array
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn, imdt_to_imsn_array
+from imperial_calendar.transform.imsn_to_imdt import imsn_to_imdt, imsn_to_imdt_array
+from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd, imsn_to_mrsd_array
+from imperial_calendar.transform.juld_to_grdt import juld_to_grdt, juld_to_grdt_array
+from imperial_calendar.transform.juld_to_tert import juld_to_tert, juld_to_tert_array
+from imperial_calendar.transform.mrls_to_imsn import mrls_to_imsn, mrls_to_imsn_array
+from imperial_calendar.transform.mrsd_to_imsn import mrsd_to_imsn, mrsd_to_imsn_array
+from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert, mrsd_to_tert_array
+from imperial_calendar.transform.tert_to_juld import (
+    tert_to_juld,
+    tert_to_juld_array,
+    tert_to_juld_array_with_residual,
+    tert_to_juld_with_residual,
+)
+from imperial_calendar.transform.tert_to_mrls import tert_to_mrls, tert_to_mrls_array
+from imperial_calendar.transform.tert_to_mrsd import tert_to_mrsd, tert_to_mrsd_array
 
 __all__ = [
+    "grdt_to_imdt_array",
     "grdt_to_juld",
+    "grdt_to_juld_array",
+    "imdt_to_grdt_array",
     "imdt_to_imsn",
+    "imdt_to_imsn_array",
     "imsn_to_imdt",
+    "imsn_to_imdt_array",
     "imsn_to_mrsd",
+    "imsn_to_mrsd_array",
     "juld_to_grdt",
+    "juld_to_grdt_array",
     "juld_to_tert",
+    "juld_to_tert_array",
+    "mrls_to_imsn",
+    "mrls_to_imsn_array",
     "mrsd_to_imsn",
+    "mrsd_to_imsn_array",
     "mrsd_to_tert",
+    "mrsd_to_tert_array",
     "tert_to_juld",
+    "tert_to_juld_array",
+    "tert_to_juld_array_with_residual",
+    "tert_to_juld_with_residual",
     "tert_to_mrls",
+    "tert_to_mrls_array",
     "tert_to_mrsd",
+    "tert_to_mrsd_array",
 ]
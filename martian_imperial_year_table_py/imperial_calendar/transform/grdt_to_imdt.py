@@ -0,0 +1,46 @@
+"""グレゴリオ曆の日時の配列を帝國火星曆の日時の配列に一括で變換する."""
+
+from imperial_calendar.GregorianDateTime import local_offsets_array
+from imperial_calendar.ImperialDateTime import parse_timezone
+from imperial_calendar.internal.array import normalize_day
+from imperial_calendar.transform.grdt_to_juld import grdt_to_juld_array
+from imperial_calendar.transform.imsn_to_imdt import imsn_to_imdt_array
+from imperial_calendar.transform.juld_to_tert import juld_to_tert_array
+from imperial_calendar.transform.mrsd_to_imsn import mrsd_to_imsn_array
+from imperial_calendar.transform.tert_to_mrsd import tert_to_mrsd_array
+import numpy as np
+import numpy.typing as npt
+import typing as t
+
+
+def grdt_to_imdt_array(
+    year: npt.ArrayLike,
+    month: npt.ArrayLike,
+    day: npt.ArrayLike,
+    hour: npt.ArrayLike,
+    minute: npt.ArrayLike,
+    second: npt.ArrayLike,
+    timezone: t.Optional[str],
+    imperial_timezone: t.Optional[str] = None,
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    グレゴリオ曆の日時の配列を帝國火星曆の日時の配列に一括で變換する.
+
+    `GregorianDateTime.to_utc_naive` → `grdt_to_juld` → `juld_to_tert` → `tert_to_mrsd`
+    → `mrsd_to_imsn` → `imsn_to_imdt` → `ImperialDateTime.from_standard_naive`
+    と同じ結果を、行每にobjectを作らずに配列演算で求める.
+    timezoneがNoneの時は入力をUTCとして扱ひ、imperial_timezoneがNoneの時は標準時の日時を返す.
+    返り値は (年, 月, 日, 時, 分, 秒) の配列の組.
+    """
+    (juld_day, juld_second) = grdt_to_juld_array(year, month, day, hour, minute, second)
+    if timezone is not None:
+        juld_second = juld_second - local_offsets_array(
+            timezone, year, month, day, hour, minute, second
+        )
+        (juld_day, juld_second) = normalize_day(juld_day, juld_second)
+    tert = juld_to_tert_array(juld_day + juld_second / (24.0 * 60.0 * 60.0))
+    (imsn_day, imsn_second) = mrsd_to_imsn_array(tert_to_mrsd_array(tert))
+    if imperial_timezone is not None:
+        imsn_second = imsn_second + parse_timezone(imperial_timezone) * 60.0 * 60.0
+        (imsn_day, imsn_second) = normalize_day(imsn_day, imsn_second)
+    return imsn_to_imdt_array(imsn_day, imsn_second)
@@ -3,6 +3,9 @@
 from imperial_calendar.GregorianDateTime import GregorianDateTime
 from imperial_calendar.JulianDay import JulianDay
 import math
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
+import typing as t
 
 
 def grdt_to_juld(grdt: GregorianDateTime) -> JulianDay:
@@ -30,3 +33,42 @@ def grdt_to_juld(grdt: GregorianDateTime) -> JulianDay:
         day += 1
         second -= 24.0 * 60.0 * 60.0
     return JulianDay(day, second)
+
+
+# __pragma__("skip")
+def grdt_to_juld_array(
+    year: npt.ArrayLike,
+    month: npt.ArrayLike,
+    day: npt.ArrayLike,
+    hour: npt.ArrayLike,
+    minute: npt.ArrayLike,
+    second: npt.ArrayLike,
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """グレゴリオ曆の日時の配列をユリウス通日の配列 (日, 秒) に變換する."""
+    intercept_day = 1721088
+    intercept_second = 0.5 * 24.0 * 60.0 * 60.0
+    year, month, day, hour, minute, second = np.broadcast_arrays(
+        *(
+            np.asarray(field, dtype=np.int64)
+            for field in (year, month, day, hour, minute, second)
+        )
+    )
+    is_january_or_february = month <= 2
+    tweaked_year = np.where(is_january_or_february, year - 1, year)
+    tweaked_month = np.where(is_january_or_february, month + 12, month)
+    juld_day = (
+        np.floor(tweaked_year * 365.25).astype(np.int64)
+        + np.floor(tweaked_year / 400.0).astype(np.int64)
+        - np.floor(tweaked_year / 100.0).astype(np.int64)
+        + np.floor((tweaked_month - 2) * 30.59).astype(np.int64)
+        + day
+        + intercept_day
+    )
+    juld_second = hour * 60.0 * 60.0 + minute * 60.0 + second + intercept_second
+    overflow = juld_second >= 24.0 * 60.0 * 60.0
+    juld_day = juld_day + overflow
+    juld_second = np.where(overflow, juld_second - 24.0 * 60.0 * 60.0, juld_second)
+    return (juld_day, juld_second)
+
+
+# __pragma__("noskip")
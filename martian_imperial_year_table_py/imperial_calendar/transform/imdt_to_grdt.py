@@ -0,0 +1,47 @@
+"""帝國火星曆の日時の配列をグレゴリオ曆の日時の配列に一括で變換する."""
+
+from imperial_calendar.GregorianDateTime import utc_offsets_array
+from imperial_calendar.ImperialDateTime import parse_timezone
+from imperial_calendar.internal.array import normalize_day
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn_array
+from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd_array
+from imperial_calendar.transform.juld_to_grdt import juld_to_grdt_array
+from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert_array
+from imperial_calendar.transform.tert_to_juld import tert_to_juld_array
+import numpy as np
+import numpy.typing as npt
+import typing as t
+
+
+def imdt_to_grdt_array(
+    year: npt.ArrayLike,
+    month: npt.ArrayLike,
+    day: npt.ArrayLike,
+    hour: npt.ArrayLike,
+    minute: npt.ArrayLike,
+    second: npt.ArrayLike,
+    timezone: t.Optional[str],
+    grdt_timezone: t.Optional[str] = None,
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    帝國火星曆の日時の配列をグレゴリオ曆の日時の配列に一括で變換する.
+
+    `ImperialDateTime.to_standard_naive` → `imdt_to_imsn` → `imsn_to_mrsd` → `mrsd_to_tert`
+    → `tert_to_juld` → `juld_to_grdt` → `GregorianDateTime.from_utc_naive`
+    と同じ結果を、行每にobjectを作らずに配列演算で求める.
+    timezoneがNoneの時は入力を標準時として扱ひ、grdt_timezoneがNoneの時はUTCの日時を返す.
+    返り値は (年, 月, 日, 時, 分, 秒) の配列の組.
+    """
+    (imsn_day, imsn_second) = imdt_to_imsn_array(year, month, day, hour, minute, second)
+    if timezone is not None:
+        imsn_second = imsn_second - parse_timezone(timezone) * 60.0 * 60.0
+        (imsn_day, imsn_second) = normalize_day(imsn_day, imsn_second)
+    tert = mrsd_to_tert_array(imsn_to_mrsd_array(imsn_day, imsn_second))
+    (juld_day, juld_second) = tert_to_juld_array(tert)
+    if grdt_timezone is None:
+        return juld_to_grdt_array(juld_day, juld_second)
+    juld_second = juld_second + utc_offsets_array(
+        grdt_timezone, *juld_to_grdt_array(juld_day, juld_second)
+    )
+    (juld_day, juld_second) = normalize_day(juld_day, juld_second)
+    return juld_to_grdt_array(juld_day, juld_second)
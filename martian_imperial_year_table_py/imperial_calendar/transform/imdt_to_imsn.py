@@ -7,6 +7,9 @@ from imperial_calendar.internal.consts import (
     imperial_year_to_imsn_table,
     imperial_month_to_imsn_table,
 )
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
+import typing as t
 
 
 def imdt_to_imsn(imdt: ImperialDateTime) -> ImperialSolNumber:
@@ -18,3 +21,31 @@ def imdt_to_imsn(imdt: ImperialDateTime) -> ImperialSolNumber:
         days_of_millennium + days_in_millennium + days_in_year + (imdt.day - 1),
         imdt.hour * 60.0 * 60.0 + imdt.minute * 60.0 + imdt.second,
     )
+
+
+# __pragma__("skip")
+def imdt_to_imsn_array(
+    year: npt.ArrayLike,
+    month: npt.ArrayLike,
+    day: npt.ArrayLike,
+    hour: npt.ArrayLike,
+    minute: npt.ArrayLike,
+    second: npt.ArrayLike,
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """帝國火星曆の日時の配列を通算日の配列 (日, 秒) に變換する."""
+    year, month, day, hour, minute, second = np.broadcast_arrays(
+        *(
+            np.asarray(field, dtype=np.int64)
+            for field in (year, month, day, hour, minute, second)
+        )
+    )
+    days_of_millennium = year // 1000 * imperial_millennium_days
+    days_in_millennium = np.take(imperial_year_to_imsn_table, year % 1000)
+    days_in_year = np.take(imperial_month_to_imsn_table, month - 1)
+    return (
+        days_of_millennium + days_in_millennium + days_in_year + (day - 1),
+        hour * 60.0 * 60.0 + minute * 60.0 + second,
+    )
+
+
+# __pragma__("noskip")
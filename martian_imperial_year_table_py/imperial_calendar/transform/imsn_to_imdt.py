@@ -1,5 +1,6 @@
 """帝國火星曆の通算日を日時に變換する."""
 
+from bisect import bisect_right
 from imperial_calendar.ImperialDateTime import ImperialDateTime
 from imperial_calendar.ImperialSolNumber import ImperialSolNumber
 from imperial_calendar.internal.consts import (
@@ -7,20 +8,20 @@ from imperial_calendar.internal.consts import (
     imperial_year_to_imsn_table,
     imperial_month_to_imsn_table,
 )
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
+import typing as t
 
 
 def imsn_to_imdt(imsn: ImperialSolNumber) -> ImperialDateTime:
     """帝國火星曆の通算日を日時に變換する."""
     (millennium, days_in_millennium) = divmod(imsn.day, imperial_millennium_days)
     years_in_millennium = (
-        len(
-            list(filter(lambda x: x <= days_in_millennium, imperial_year_to_imsn_table))
-        )
-        - 1
+        bisect_right(imperial_year_to_imsn_table, days_in_millennium) - 1
     )
     days_before_new_years_day = imperial_year_to_imsn_table[years_in_millennium]
     days_in_year = days_in_millennium - days_before_new_years_day
-    month = len(list(filter(lambda x: x <= days_in_year, imperial_month_to_imsn_table)))
+    month = bisect_right(imperial_month_to_imsn_table, days_in_year)
     days_before_first_day_of_the_month = imperial_month_to_imsn_table[month - 1]
     (hour, minute) = divmod(round(imsn.second), 60 * 60)
     (minute, second) = divmod(minute, 60)
@@ -33,3 +34,39 @@ def imsn_to_imdt(imsn: ImperialSolNumber) -> ImperialDateTime:
         second,
         None,
     )
+
+
+# __pragma__("skip")
+def imsn_to_imdt_array(
+    day: npt.ArrayLike, second: npt.ArrayLike
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """帝國火星曆の通算日の配列 (日, 秒) を日時の配列に變換する."""
+    (millennium, days_in_millennium) = np.divmod(
+        np.asarray(day, dtype=np.int64), imperial_millennium_days
+    )
+    years_in_millennium = (
+        np.searchsorted(imperial_year_to_imsn_table, days_in_millennium, side="right")
+        - 1
+    )
+    days_in_year = days_in_millennium - np.take(
+        imperial_year_to_imsn_table, years_in_millennium
+    )
+    month = np.searchsorted(imperial_month_to_imsn_table, days_in_year, side="right")
+    days_before_first_day_of_the_month = np.take(
+        imperial_month_to_imsn_table, month - 1
+    )
+    (hour, minute) = np.divmod(
+        np.round(np.asarray(second, dtype=np.float64)).astype(np.int64), 60 * 60
+    )
+    (minute, second) = np.divmod(minute, 60)
+    return (
+        millennium * 1000 + years_in_millennium,
+        month,
+        days_in_year - days_before_first_day_of_the_month + 1,
+        hour,
+        minute,
+        second,
+    )
+
+
+# __pragma__("noskip")
@@ -2,8 +2,22 @@
 
 from imperial_calendar.ImperialSolNumber import ImperialSolNumber
 from imperial_calendar.MarsSolDate import MarsSolDate
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
 
 
 def imsn_to_mrsd(imsn: ImperialSolNumber) -> MarsSolDate:
     """帝國火星日からMSDを算出する."""
     return MarsSolDate(imsn.imperial_sol_number + 0.375 - 901195)
+
+
+# __pragma__("skip")
+def imsn_to_mrsd_array(day: npt.ArrayLike, second: npt.ArrayLike) -> np.ndarray:
+    """帝國火星日の配列 (日, 秒) からMSDの配列を算出する."""
+    imperial_sol_number = np.asarray(day, dtype=np.int64) + (
+        np.asarray(second, dtype=np.float64) / (60.0 * 60.0 * 24.0)
+    )
+    return imperial_sol_number + 0.375 - 901195
+
+
+# __pragma__("noskip")
@@ -7,6 +7,9 @@ cf. http://astronomy.webcrow.jp/time/julianday-gregoriancalendar.html
 from imperial_calendar.GregorianDateTime import GregorianDateTime
 from imperial_calendar.JulianDay import JulianDay
 import math
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
+import typing as t
 
 
 def juld_to_grdt(juld: JulianDay) -> GregorianDateTime:
@@ -26,3 +29,37 @@ def juld_to_grdt(juld: JulianDay) -> GregorianDateTime:
     hour = (hour + 12) % 24
     (minute, second) = divmod(minute, 60)
     return GregorianDateTime(u, v, math.floor(w), hour, minute, second, None)
+
+
+# __pragma__("skip")
+def juld_to_grdt_array(
+    day: npt.ArrayLike, second: npt.ArrayLike
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """ユリウス通日の配列 (日, 秒) をグレゴリオ曆の日時の配列に變換する."""
+    second = np.asarray(second, dtype=np.float64)
+    julian_day = np.asarray(day, dtype=np.int64) + (second / (60.0 * 60.0 * 24.0))
+    A = np.floor(julian_day + 68569.5)
+    B = julian_day + 0.5
+    a = np.floor(A / 36524.25)
+    b = A - np.floor(36524.25 * a + 0.75)
+    c = np.floor((b + 1) / 365.25025)
+    d = b - np.floor(365.25 * c) + 31
+    e = np.floor(d / 30.59)
+    f = np.floor(e / 11.0)
+    u = 100 * (a - 49) + c + f
+    v = e - 12 * f + 2
+    w = d - np.floor(30.59 * e) + (B % 1)
+    (hour, minute) = np.divmod(np.round(second).astype(np.int64), 60 * 60)
+    hour = (hour + 12) % 24
+    (minute, second) = np.divmod(minute, 60)
+    return (
+        u.astype(np.int64),
+        v.astype(np.int64),
+        np.floor(w).astype(np.int64),
+        hour,
+        minute,
+        second,
+    )
+
+
+# __pragma__("noskip")
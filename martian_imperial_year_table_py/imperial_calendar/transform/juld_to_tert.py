@@ -1,9 +1,22 @@
 """ユリウス通日を地球時に變換する."""
 
 from imperial_calendar.JulianDay import JulianDay
+from imperial_calendar.JulianDay import delta_t_array  # __:skip
 from imperial_calendar.TerrestrialTime import TerrestrialTime
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
 
 
 def juld_to_tert(juld: JulianDay) -> TerrestrialTime:
     """ユリウス通日を地球時に變換する."""
     return TerrestrialTime(juld.julian_day + juld.delta_t / (24 * 60 * 60))
+
+
+# __pragma__("skip")
+def juld_to_tert_array(julian_day: npt.ArrayLike) -> np.ndarray:
+    """ユリウス通日の配列を地球時の配列に變換する."""
+    julian_day = np.asarray(julian_day, dtype=np.float64)
+    return julian_day + delta_t_array(julian_day) / (24 * 60 * 60)
+
+
+# __pragma__("noskip")
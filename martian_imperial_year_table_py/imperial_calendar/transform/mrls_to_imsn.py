@@ -0,0 +1,199 @@
+"""
+帝國火星曆の年とMars Ls (Areocentric Solar Longitude; 火星中心太陽黃經) とから、Lsが其の値を過ぎる時刻を求める.
+
+年の始まりからLsの增分が目標に達する時刻を、二分法で挾み込みつつNewton法で解く.
+Lsの增分は平均運動からのずれを (-180, 180] 度に折り返して足す事で、360度で途切れない樣にする.
+Lsの時閒微分は `tert_to_mrls` の式を微分して求める.
+"""
+
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.ImperialSolNumber import ImperialSolNumber
+from imperial_calendar.TerrestrialTime import TerrestrialTime
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn_array  # __:skip
+from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd
+from imperial_calendar.transform.imsn_to_mrsd import imsn_to_mrsd_array  # __:skip
+from imperial_calendar.transform.mrsd_to_imsn import mrsd_to_imsn
+from imperial_calendar.transform.mrsd_to_imsn import mrsd_to_imsn_array  # __:skip
+from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert
+from imperial_calendar.transform.mrsd_to_tert import mrsd_to_tert_array  # __:skip
+from imperial_calendar.transform.tert_to_mrls import (
+    offset_t_j2000_to_areocentric_solar_longitude,
+    offset_t_j2000_to_areocentric_solar_longitude_rate,
+    tert_to_offset_t_j2000,
+)
+from imperial_calendar.transform.tert_to_mrls import (  # __:skip
+    offset_t_j2000_to_areocentric_solar_longitude_rate_array,
+)
+from imperial_calendar.transform.tert_to_mrls import tert_to_mrls_array  # __:skip
+from imperial_calendar.transform.tert_to_mrsd import tert_to_mrsd
+from imperial_calendar.transform.tert_to_mrsd import tert_to_mrsd_array  # __:skip
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
+import typing as t
+
+# 火星の太陽年 (地球時の日)
+mars_tropical_year = 686.9726
+# 挾み込む區閒の上端に足す餘裕 (日). Lsが一周する日數は攝動で太陽年から僅かにずれる
+mrls_crossing_margin = 1.0
+# 收束の判定に使ふ補正量の閾値 (秒)
+mrls_to_imsn_tolerance = 1.0e-3
+mrls_to_imsn_max_iterations = 16
+
+
+def mrls_to_imsn(
+    year: int,
+    mrls: float,
+    tolerance: float = mrls_to_imsn_tolerance,
+    max_iterations: int = mrls_to_imsn_max_iterations,
+) -> ImperialSolNumber:
+    """帝國火星曆のyear年の始まり (標準時) 以後に、Lsが初めてmrlsを過ぎる時刻."""
+    start = tert_to_offset_t_j2000(
+        mrsd_to_tert(
+            imsn_to_mrsd(imdt_to_imsn(ImperialDateTime(year, 1, 1, 0, 0, 0, None)))
+        )
+    )
+    offset_t_j2000 = next_mrls_crossing(start, mrls, tolerance, max_iterations)
+    return mrsd_to_imsn(tert_to_mrsd(TerrestrialTime(offset_t_j2000 + 2451545.0)))
+
+
+def next_mrls_crossing(
+    start: float,
+    mrls: float,
+    tolerance: float = mrls_to_imsn_tolerance,
+    max_iterations: int = mrls_to_imsn_max_iterations,
+) -> float:
+    """
+    J2000元期からの經過日數start以後に、Lsが初めてmrlsを過ぎる時刻 (J2000元期からの經過日數).
+
+    Lsの增分は單調に增え、區閒 [start, start + 太陽年 + 餘裕] の兩端で目標を挾むので、解は唯一つである.
+    Newton法の一步が挾み込んだ區閒を外れる時は二分法の一步に代へる.
+    """
+    start_mrls = offset_t_j2000_to_areocentric_solar_longitude(start)
+    target = (mrls - start_mrls) % 360
+    lower = start
+    upper = start + mars_tropical_year + mrls_crossing_margin
+    offset_t_j2000 = start + target * mars_tropical_year / 360
+    for _ in range(max_iterations):
+        mean_increment = (offset_t_j2000 - start) * 360 / mars_tropical_year
+        residual = (
+            mean_increment
+            + (
+                offset_t_j2000_to_areocentric_solar_longitude(offset_t_j2000)
+                - start_mrls
+                - mean_increment
+                + 180
+            )
+            % 360
+            - 180
+            - target
+        )
+        if residual < 0:
+            lower = offset_t_j2000
+        else:
+            upper = offset_t_j2000
+        next_offset_t_j2000 = offset_t_j2000 - residual / (
+            offset_t_j2000_to_areocentric_solar_longitude_rate(offset_t_j2000)
+        )
+        if not lower <= next_offset_t_j2000 <= upper:
+            next_offset_t_j2000 = (lower + upper) / 2
+        step = abs(next_offset_t_j2000 - offset_t_j2000) * 24 * 60 * 60
+        offset_t_j2000 = next_offset_t_j2000
+        if step <= tolerance:
+            break
+    return offset_t_j2000
+
+
+# __pragma__("skip")
+def mrls_to_imsn_array(
+    year: npt.ArrayLike,
+    mrls: npt.ArrayLike,
+    tolerance: float = mrls_to_imsn_tolerance,
+    max_iterations: int = mrls_to_imsn_max_iterations,
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """
+    年とLsとの配列から、Lsが其の値を過ぎる時刻を帝國火星日の配列 (日, 秒) で求める.
+
+    yearとmrlsとはbroadcastする.
+    """
+    (year, mrls) = np.broadcast_arrays(
+        np.asarray(year, dtype=np.int64), np.asarray(mrls, dtype=np.float64)
+    )
+    shape = year.shape
+    year = year.ravel()
+    mrls = mrls.ravel()
+    ones = np.ones_like(year)
+    zeros = np.zeros_like(year)
+    start = (
+        mrsd_to_tert_array(
+            imsn_to_mrsd_array(
+                *imdt_to_imsn_array(year, ones, ones, zeros, zeros, zeros)
+            )
+        )
+        - 2451545.0
+    )
+    offset_t_j2000 = next_mrls_crossing_array(start, mrls, tolerance, max_iterations)
+    (day, second) = mrsd_to_imsn_array(tert_to_mrsd_array(offset_t_j2000 + 2451545.0))
+    return (day.reshape(shape), second.reshape(shape))
+
+
+def next_mrls_crossing_array(
+    start: npt.ArrayLike,
+    mrls: npt.ArrayLike,
+    tolerance: float = mrls_to_imsn_tolerance,
+    max_iterations: int = mrls_to_imsn_max_iterations,
+) -> np.ndarray:
+    """
+    J2000元期からの經過日數の配列start以後に、Lsが初めてmrlsを過ぎる時刻 (J2000元期からの經過日數) の配列.
+
+    startとmrlsとはbroadcastする. `next_mrls_crossing` と同じ反復を、未だ收束してゐない要素についてのみ繰り返す.
+    """
+    (start, mrls) = np.broadcast_arrays(
+        np.asarray(start, dtype=np.float64), np.asarray(mrls, dtype=np.float64)
+    )
+    shape = start.shape
+    start = start.ravel()
+    mrls = mrls.ravel()
+    start_mrls = tert_to_mrls_array(start + 2451545.0)
+    target = (mrls - start_mrls) % 360
+    lower = start.copy()
+    upper = start + mars_tropical_year + mrls_crossing_margin
+    offset_t_j2000 = start + target * mars_tropical_year / 360
+    active = np.arange(start.size)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        current = offset_t_j2000[active]
+        mean_increment = (current - start[active]) * 360 / mars_tropical_year
+        residual = (
+            mean_increment
+            + (
+                tert_to_mrls_array(current + 2451545.0)
+                - start_mrls[active]
+                - mean_increment
+                + 180
+            )
+            % 360
+            - 180
+            - target[active]
+        )
+        active_lower = np.where(residual < 0, current, lower[active])
+        active_upper = np.where(residual < 0, upper[active], current)
+        next_offset_t_j2000 = current - residual / (
+            offset_t_j2000_to_areocentric_solar_longitude_rate_array(current)
+        )
+        outside = (next_offset_t_j2000 < active_lower) | (
+            active_upper < next_offset_t_j2000
+        )
+        next_offset_t_j2000[outside] = (
+            active_lower[outside] + active_upper[outside]
+        ) / 2
+        step = np.abs(next_offset_t_j2000 - current) * 24 * 60 * 60
+        lower[active] = active_lower
+        upper[active] = active_upper
+        offset_t_j2000[active] = next_offset_t_j2000
+        active = active[step > tolerance]
+    return offset_t_j2000.reshape(shape)
+
+
+# __pragma__("noskip")
@@ -2,8 +2,24 @@
 
 from imperial_calendar.ImperialSolNumber import ImperialSolNumber
 from imperial_calendar.MarsSolDate import MarsSolDate
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
+import typing as t
 
 
 def mrsd_to_imsn(mrsd: MarsSolDate) -> ImperialSolNumber:
     """MSDを帝國火星日に變換する."""
     return ImperialSolNumber(mrsd.mars_sol_date - 0.375 + 901195)
+
+
+# __pragma__("skip")
+def mrsd_to_imsn_array(mars_sol_date: npt.ArrayLike) -> t.Tuple[np.ndarray, np.ndarray]:
+    """MSDの配列を帝國火星日の配列 (日, 秒) に變換する."""
+    imperial_sol_number = np.asarray(mars_sol_date, dtype=np.float64) - 0.375 + 901195
+    return (
+        np.floor(imperial_sol_number).astype(np.int64),
+        (imperial_sol_number % 1) * 60.0 * 60.0 * 24.0,
+    )
+
+
+# __pragma__("noskip")
@@ -2,6 +2,8 @@
 
 from imperial_calendar.MarsSolDate import MarsSolDate
 from imperial_calendar.TerrestrialTime import TerrestrialTime
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
 
 
 def mrsd_to_tert(mrsd: MarsSolDate) -> TerrestrialTime:
@@ -9,3 +11,13 @@ def mrsd_to_tert(mrsd: MarsSolDate) -> TerrestrialTime:
     return TerrestrialTime(
         1.0274912517 * (mrsd.mars_sol_date - 44796 + 0.0009626) + 2451545 + 4.5
     )
+
+
+# __pragma__("skip")
+def mrsd_to_tert_array(mars_sol_date: npt.ArrayLike) -> np.ndarray:
+    """MSDの配列から地球時の配列を算出する."""
+    mars_sol_date = np.asarray(mars_sol_date, dtype=np.float64)
+    return 1.0274912517 * (mars_sol_date - 44796 + 0.0009626) + 2451545 + 4.5
+
+
+# __pragma__("noskip")
@@ -1,15 +1,162 @@
 """地球時をユリウス通日に變換する."""
 
 from imperial_calendar.JulianDay import JulianDay
+from imperial_calendar.JulianDay import delta_t_breakpoints  # __:skip
+from imperial_calendar.JulianDay import delta_t_segment_array  # __:skip
+from imperial_calendar.JulianDay import evaluate_delta_t_array  # __:skip
+from imperial_calendar.JulianDay import julian_day_to_delta_t  # __:skip
+from imperial_calendar.JulianDay import julian_day_to_year_number_array  # __:skip
 from imperial_calendar.TerrestrialTime import TerrestrialTime
-from imperial_calendar.transform.juld_to_tert import juld_to_tert
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
+import typing as t
 
+# 收束の判定に使ふ補正量の閾値 (秒)
+tert_to_juld_tolerance = 1.0e-3
+tert_to_juld_max_iterations = 8
 
-def tert_to_juld(tert: TerrestrialTime) -> JulianDay:
+
+def tert_to_juld(
+    tert: TerrestrialTime,
+    tolerance: float = tert_to_juld_tolerance,
+    max_iterations: int = tert_to_juld_max_iterations,
+) -> JulianDay:
     """地球時をユリウス通日に變換する."""
-    delta_t = JulianDay(tert.terrestrial_time).delta_t
-    juld_prime = JulianDay(tert.terrestrial_time - delta_t / (24 * 60 * 60))
-    tert_prime = juld_to_tert(juld_prime)
     return JulianDay(
-        juld_prime.julian_day + tert.terrestrial_time - tert_prime.terrestrial_time
+        _solve_julian_day(tert.terrestrial_time, tolerance, max_iterations)
+    )
+
+
+def tert_to_juld_with_residual(
+    tert: TerrestrialTime,
+    tolerance: float = tert_to_juld_tolerance,
+    max_iterations: int = tert_to_juld_max_iterations,
+) -> t.Tuple[JulianDay, float]:
+    """
+    地球時をユリウス通日に變換し、殘差 |juld_to_tert(結果) - tert| (秒) と共に返す.
+
+    max_iterations回で收束しなければ其の時の値を返すので、殘差を見て判斷する.
+    """
+    terrestrial_time = tert.terrestrial_time
+    julian_day = _solve_julian_day(terrestrial_time, tolerance, max_iterations)
+    residual = (
+        abs(
+            julian_day
+            + julian_day_to_delta_t(julian_day) / (24 * 60 * 60)
+            - terrestrial_time
+        )
+        * 24
+        * 60
+        * 60
+    )
+    return (JulianDay(julian_day), residual)
+
+
+def _solve_julian_day(
+    terrestrial_time: float, tolerance: float, max_iterations: int
+) -> float:
+    """
+    TT = UT + ΔT(UT) を UT ← TT - ΔT(UT) の反復で解く.
+
+    ΔTの變化は時閒の經過より遙かに遲いので、補正量がtolerance秒以下になれば殘差も其れ以下である.
+    """
+    julian_day = terrestrial_time
+    for _ in range(max_iterations):
+        next_julian_day = terrestrial_time - julian_day_to_delta_t(julian_day) / (
+            24 * 60 * 60
+        )
+        correction = abs(next_julian_day - julian_day) * 24 * 60 * 60
+        julian_day = next_julian_day
+        if correction <= tolerance:
+            break
+    return julian_day
+
+
+# __pragma__("skip")
+_delta_t_lower_bounds = np.concatenate([[-np.inf], delta_t_breakpoints])
+_delta_t_upper_bounds = np.concatenate([delta_t_breakpoints, [np.inf]])
+
+
+def tert_to_juld_array(
+    terrestrial_time: npt.ArrayLike,
+    tolerance: float = tert_to_juld_tolerance,
+    max_iterations: int = tert_to_juld_max_iterations,
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """地球時の配列をユリウス通日の配列 (日, 秒) に變換する."""
+    terrestrial_time = np.asarray(terrestrial_time, dtype=np.float64)
+    (julian_day, _) = _solve_julian_day_array(
+        terrestrial_time.ravel(), tolerance, max_iterations
     )
+    return _split_julian_day(julian_day.reshape(terrestrial_time.shape))
+
+
+def tert_to_juld_array_with_residual(
+    terrestrial_time: npt.ArrayLike,
+    tolerance: float = tert_to_juld_tolerance,
+    max_iterations: int = tert_to_juld_max_iterations,
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """地球時の配列をユリウス通日の配列 (日, 秒) に變換し、殘差 (秒) の配列と共に返す."""
+    terrestrial_time = np.asarray(terrestrial_time, dtype=np.float64)
+    shape = terrestrial_time.shape
+    terrestrial_time = terrestrial_time.ravel()
+    (julian_day, segment) = _solve_julian_day_array(
+        terrestrial_time, tolerance, max_iterations
+    )
+    year_number = julian_day_to_year_number_array(julian_day)
+    moved = (year_number < _delta_t_lower_bounds[segment]) | (
+        _delta_t_upper_bounds[segment] <= year_number
+    )
+    segment[moved] = delta_t_segment_array(year_number[moved])
+    residual = (
+        np.abs(
+            julian_day
+            + evaluate_delta_t_array(year_number, segment) / (24 * 60 * 60)
+            - terrestrial_time
+        )
+        * 24
+        * 60
+        * 60
+    )
+    (day, second) = _split_julian_day(julian_day.reshape(shape))
+    return (day, second, residual.reshape(shape))
+
+
+def _solve_julian_day_array(
+    terrestrial_time: np.ndarray, tolerance: float, max_iterations: int
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """
+    `_solve_julian_day` と同じ反復を、未だ收束してゐない要素についてのみ繰り返す.
+
+    ΔTの多項式の區閒は前回の區閒を外れた要素についてのみ探し直す. ユリウス通日と最後に使った區閒とを返す.
+    """
+    julian_day = terrestrial_time.copy()
+    segment = delta_t_segment_array(julian_day_to_year_number_array(julian_day))
+    active = np.arange(terrestrial_time.size)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        year_number = julian_day_to_year_number_array(julian_day[active])
+        active_segment = segment[active]
+        moved = (year_number < _delta_t_lower_bounds[active_segment]) | (
+            _delta_t_upper_bounds[active_segment] <= year_number
+        )
+        active_segment[moved] = delta_t_segment_array(year_number[moved])
+        next_julian_day = terrestrial_time[active] - evaluate_delta_t_array(
+            year_number, active_segment
+        ) / (24 * 60 * 60)
+        correction = np.abs(next_julian_day - julian_day[active]) * 24 * 60 * 60
+        julian_day[active] = next_julian_day
+        segment[active] = active_segment
+        active = active[correction > tolerance]
+    return (julian_day, segment)
+
+
+def _split_julian_day(julian_day: np.ndarray) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Julian Dayを日と秒とに分ける."""
+    return (
+        np.floor(julian_day).astype(np.int64),
+        (julian_day % 1) * 60.0 * 60.0 * 24.0,
+    )
+
+
+# __pragma__("noskip")
@@ -12,6 +12,13 @@ Planetary and Space Science, 48: pp.215-235
 
 from imperial_calendar.TerrestrialTime import TerrestrialTime
 import math
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
+
+# 攝動の振幅、周期、位相
+perturber_amp = [0.0071, 0.0057, 0.0039, 0.0037, 0.0021, 0.0020, 0.0018]
+perturber_tau = [2.2353, 2.7543, 1.1177, 15.7866, 2.1354, 2.4694, 32.8493]
+perturber_phi = [49.409, 168.173, 191.837, 21.736, 15.704, 95.528, 49.095]
 
 
 def tert_to_offset_t_j2000(tert):
@@ -31,13 +38,10 @@ def offset_t_j2000_to_angle_of_fictitious_mean_sun(offset_t_j2000):
 
 def offset_t_j2000_to_perturbers(offset_t_j2000):
     """PBS=攝動角を求める."""
-    amp = [0.0071, 0.0057, 0.0039, 0.0037, 0.0021, 0.0020, 0.0018]
-    tau = [2.2353, 2.7543, 1.1177, 15.7866, 2.1354, 2.4694, 32.8493]
-    phi = [49.409, 168.173, 191.837, 21.736, 15.704, 95.528, 49.095]
     perturbers = 0
-    for i in range(0, len(amp)):
-        angle = (360 / 365.25) * offset_t_j2000 / tau[i] + phi[i]
-        perturbers += amp[i] * math.cos(math.radians(angle))
+    for i in range(0, len(perturber_amp)):
+        angle = (360 / 365.25) * offset_t_j2000 / perturber_tau[i] + perturber_phi[i]
+        perturbers += perturber_amp[i] * math.cos(math.radians(angle))
     return perturbers
 
 
@@ -64,6 +68,91 @@ def offset_t_j2000_to_areocentric_solar_longitude(offset_t_j2000):
     ) % 360
 
 
+def offset_t_j2000_to_areocentric_solar_longitude_rate(offset_t_j2000):
+    """Lsの時閒微分 (度/日) を求める."""
+    m_m_a_rate = math.radians(0.52402073)
+    angle_m = math.radians(offset_t_j2000_to_mars_mean_anomaly(offset_t_j2000))
+    perturbers_rate = 0
+    for i in range(0, len(perturber_amp)):
+        angle = (360 / 365.25) * offset_t_j2000 / perturber_tau[i] + perturber_phi[i]
+        perturbers_rate -= (
+            perturber_amp[i]
+            * math.sin(math.radians(angle))
+            * math.radians(360 / 365.25 / perturber_tau[i])
+        )
+    return (
+        0.524038496
+        + (3.0 * 10**-7) * math.sin(angle_m)
+        + (
+            (10.691 + (3.0 * 10**-7) * offset_t_j2000) * math.cos(angle_m)
+            + 0.623 * 2 * math.cos(2 * angle_m)
+            + 0.050 * 3 * math.cos(3 * angle_m)
+            + 0.005 * 4 * math.cos(4 * angle_m)
+            + 0.0005 * 5 * math.cos(5 * angle_m)
+        )
+        * m_m_a_rate
+        + perturbers_rate
+    )
+
+
 def tert_to_mrls(tert: TerrestrialTime) -> float:
     """地球時からMars Ls (Areocentric Solar Longitude; 火星中心太陽黃經) を算出する."""
     return offset_t_j2000_to_areocentric_solar_longitude(tert_to_offset_t_j2000(tert))
+
+
+# __pragma__("skip")
+def tert_to_mrls_array(terrestrial_time: npt.ArrayLike) -> np.ndarray:
+    """
+    地球時の配列からMars Ls (Areocentric Solar Longitude; 火星中心太陽黃經) の配列を算出する.
+
+    `tert_to_mrls` と同じ式を配列演算で評價する.
+    """
+    offset_t_j2000 = np.asarray(terrestrial_time, dtype=np.float64) - 2451545.0
+    angle_m = np.radians(offset_t_j2000_to_mars_mean_anomaly(offset_t_j2000))
+    perturbers = np.zeros_like(offset_t_j2000)
+    for amp, tau, phi in zip(perturber_amp, perturber_tau, perturber_phi):
+        angle = (360 / 365.25) * offset_t_j2000 / tau + phi
+        perturbers += amp * np.cos(np.radians(angle))
+    equation_of_center = (
+        (10.691 + (3.0 * 10**-7) * offset_t_j2000) * np.sin(angle_m)
+        + 0.623 * np.sin(2 * angle_m)
+        + 0.050 * np.sin(3 * angle_m)
+        + 0.005 * np.sin(4 * angle_m)
+        + 0.0005 * np.sin(5 * angle_m)
+        + perturbers
+    )
+    return (
+        offset_t_j2000_to_angle_of_fictitious_mean_sun(offset_t_j2000)
+        + equation_of_center
+    ) % 360
+
+
+def offset_t_j2000_to_areocentric_solar_longitude_rate_array(
+    offset_t_j2000: npt.ArrayLike,
+) -> np.ndarray:
+    """J2000元期からの經過日數の配列からLsの時閒微分 (度/日) の配列を求める."""
+    offset_t_j2000 = np.asarray(offset_t_j2000, dtype=np.float64)
+    m_m_a_rate = np.radians(0.52402073)
+    angle_m = np.radians(offset_t_j2000_to_mars_mean_anomaly(offset_t_j2000))
+    perturbers_rate = np.zeros_like(offset_t_j2000)
+    for amp, tau, phi in zip(perturber_amp, perturber_tau, perturber_phi):
+        angle = (360 / 365.25) * offset_t_j2000 / tau + phi
+        perturbers_rate -= (
+            amp * np.sin(np.radians(angle)) * np.radians(360 / 365.25 / tau)
+        )
+    return (
+        0.524038496
+        + (3.0 * 10**-7) * np.sin(angle_m)
+        + (
+            (10.691 + (3.0 * 10**-7) * offset_t_j2000) * np.cos(angle_m)
+            + 0.623 * 2 * np.cos(2 * angle_m)
+            + 0.050 * 3 * np.cos(3 * angle_m)
+            + 0.005 * 4 * np.cos(4 * angle_m)
+            + 0.0005 * 5 * np.cos(5 * angle_m)
+        )
+        * m_m_a_rate
+        + perturbers_rate
+    )
+
+
+# __pragma__("noskip")
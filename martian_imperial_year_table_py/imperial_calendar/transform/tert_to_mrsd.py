@@ -2,6 +2,8 @@
 
 from imperial_calendar.MarsSolDate import MarsSolDate
 from imperial_calendar.TerrestrialTime import TerrestrialTime
+import numpy as np  # __:skip
+import numpy.typing as npt  # __:skip
 
 
 def tert_to_mrsd(tert: TerrestrialTime) -> MarsSolDate:
@@ -9,3 +11,13 @@ def tert_to_mrsd(tert: TerrestrialTime) -> MarsSolDate:
     return MarsSolDate(
         (tert.terrestrial_time - 2451545 - 4.5) / 1.0274912517 + 44796 - 0.0009626
     )
+
+
+# __pragma__("skip")
+def tert_to_mrsd_array(terrestrial_time: npt.ArrayLike) -> np.ndarray:
+    """地球時の配列からMSDの配列を算出する."""
+    terrestrial_time = np.asarray(terrestrial_time, dtype=np.float64)
+    return (terrestrial_time - 2451545 - 4.5) / 1.0274912517 + 44796 - 0.0009626
+
+
+# __pragma__("noskip")
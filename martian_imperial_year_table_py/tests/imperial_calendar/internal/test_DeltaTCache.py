@@ -0,0 +1,69 @@
+"""Test DeltaTCache."""
+
+from imperial_calendar import GregorianDateTime
+from imperial_calendar.internal.DeltaTCache import DeltaTCache, gregorian_new_years_day
+from imperial_calendar.JulianDay import delta_t_array
+from imperial_calendar.transform import grdt_to_juld
+import math
+import unittest
+
+
+class TestDeltaTCache(unittest.TestCase):
+    """Test DeltaTCache."""
+
+    def test_gregorian_new_years_day(self):
+        """1月1日正子のユリウス通日."""
+        for year in [1583, 1600, 1900, 1970, 2000, 2024, 2100, 3000]:
+            with self.subTest(year=year):
+                self.assertEqual(
+                    grdt_to_juld(
+                        GregorianDateTime(year, 1, 1, 0, 0, 0, None)
+                    ).julian_day,
+                    gregorian_new_years_day(year),
+                )
+
+    def test_hits_and_misses(self):
+        """同じ年の二度目からは記憶した値を使ふ."""
+        cache = DeltaTCache()
+        january_1st = gregorian_new_years_day(2000)
+        for day in range(366):
+            cache.of(january_1st + day + 0.25)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(365, cache.hits)
+        cache.of(january_1st + 366.25)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(2, len(cache))
+        cache.clear()
+        self.assertEqual((0, 0, 0), (cache.hits, cache.misses, len(cache)))
+
+    def test_eviction(self):
+        """maxsizeを超えると最も古く使った年から捨てる."""
+        cache = DeltaTCache(maxsize=2)
+        cache.year(2000)
+        cache.year(2001)
+        cache.year(2000)
+        cache.year(2002)
+        self.assertEqual(2, len(cache))
+        cache.year(2000)
+        self.assertEqual(2, cache.hits)
+        cache.year(2001)
+        self.assertEqual(4, cache.misses)
+
+    def test_delta_t(self):
+        """配列版ΔTと一致する."""
+        cache = DeltaTCache()
+        julian_days = [
+            gregorian_new_years_day(year) + offset
+            for year in range(1583, 2300, 7)
+            for offset in [0.0, 100.5, 364.75]
+        ]
+        for julian_day, expected in zip(julian_days, delta_t_array(julian_days)):
+            with self.subTest(julian_day=julian_day):
+                self.assertTrue(
+                    math.isclose(
+                        float(expected),
+                        cache.of(julian_day).delta_t(julian_day),
+                        rel_tol=1e-12,
+                        abs_tol=1e-6,
+                    )
+                )
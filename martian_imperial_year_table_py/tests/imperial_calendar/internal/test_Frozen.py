@@ -0,0 +1,142 @@
+"""Test Frozen."""
+
+from imperial_calendar import (
+    FrozenGregorianDateTime,
+    FrozenImperialDateTime,
+    FrozenImperialSolNumber,
+    FrozenImperialYearMonth,
+    FrozenJulianDay,
+    FrozenMarsSolDate,
+    FrozenTerrestrialTime,
+    GregorianDateTime,
+    ImperialDateTime,
+    ImperialSolNumber,
+    ImperialYearMonth,
+    JulianDay,
+    MarsSolDate,
+    TerrestrialTime,
+)
+import pickle
+import unittest
+
+
+class TestFrozen(unittest.TestCase):
+    """Test Frozen."""
+
+    # (凍結したobject, 等値な凍結したobject, 等値な凍結してゐないobject, replaceの引數, replaceの結果)
+    cases = [
+        (
+            FrozenGregorianDateTime(2020, 2, 29, 12, 34, 56, "Asia/Tokyo"),
+            FrozenGregorianDateTime(2020, 2, 29, 12, 34, 56, "Asia/Tokyo"),
+            GregorianDateTime(2020, 2, 29, 12, 34, 56, "Asia/Tokyo"),
+            {"timezone": None},
+            GregorianDateTime(2020, 2, 29, 12, 34, 56, None),
+        ),
+        (
+            FrozenImperialDateTime(1425, 24, 28, 12, 34, 56, "+09:00"),
+            FrozenImperialDateTime(1425, 24, 28, 12, 34, 56, "+09:00"),
+            ImperialDateTime(1425, 24, 28, 12, 34, 56, "+09:00"),
+            {"year": 1426, "month": 1},
+            ImperialDateTime(1426, 1, 28, 12, 34, 56, "+09:00"),
+        ),
+        (
+            FrozenImperialSolNumber(100.5),
+            FrozenImperialSolNumber(100, 43200.1),
+            ImperialSolNumber(100.5),
+            {"second": 0.0},
+            ImperialSolNumber(100.0),
+        ),
+        (
+            FrozenImperialYearMonth(1425, 24),
+            FrozenImperialYearMonth(1425, 24),
+            ImperialYearMonth(1425, 24),
+            {"month": 1},
+            ImperialYearMonth(1425, 1),
+        ),
+        (
+            FrozenJulianDay(2451545.0),
+            FrozenJulianDay(2451545, 0.25),
+            JulianDay(2451545.0),
+            {"day": 2451546},
+            JulianDay(2451546.0),
+        ),
+        (
+            FrozenMarsSolDate(44796.25),
+            FrozenMarsSolDate(44796.250001),
+            MarsSolDate(44796.25),
+            {"mars_sol_date": 1.0},
+            MarsSolDate(1.0),
+        ),
+        (
+            FrozenTerrestrialTime(2451545.75),
+            FrozenTerrestrialTime(2451545.750001),
+            TerrestrialTime(2451545.75),
+            {"terrestrial_time": 1.0},
+            TerrestrialTime(1.0),
+        ),
+    ]
+
+    def test_hash(self):
+        """等値なobjectのhashは等しく、dictのkeyに使へる."""
+        for frozen, same, mutable, _, _ in self.cases:
+            with self.subTest(frozen=frozen):
+                self.assertEqual(frozen, same)
+                self.assertEqual(frozen, mutable)
+                self.assertEqual(hash(frozen), hash(same))
+                self.assertEqual(1, len({frozen, same}))
+                self.assertEqual(42, {frozen: 42}[same])
+
+    def test_hash_with_mutable(self):
+        """凍結したImperialDateTimeと等値なImperialDateTimeとは、setやdictで同じ要素になる."""
+        frozen = FrozenImperialDateTime(1425, 1, 1, 0, 0, 0, "+09:00")
+        mutable = ImperialDateTime(1425, 1, 1, 0, 0, 0, "+09:00")
+        self.assertEqual(frozen, mutable)
+        self.assertEqual(hash(frozen), hash(mutable))
+        self.assertEqual(1, len({frozen, mutable}))
+        self.assertEqual(42, {frozen: 42}[mutable])
+        self.assertEqual(frozen.sort_key, mutable.sort_key)
+
+    def test_immutable(self):
+        """屬性を變更できない."""
+        for frozen, _, _, changes, _ in self.cases:
+            for name in changes:
+                with self.subTest(frozen=frozen, name=name):
+                    with self.assertRaises(Exception):
+                        setattr(frozen, name, None)
+                    with self.assertRaises(Exception):
+                        delattr(frozen, name)
+
+    def test_replace(self):
+        """一部の屬性を置き換へた凍結したobjectを返す."""
+        for frozen, _, mutable, changes, expected in self.cases:
+            with self.subTest(frozen=frozen):
+                replaced = frozen.replace(**changes)
+                self.assertIs(type(frozen), type(replaced))
+                self.assertEqual(expected, replaced)
+                self.assertEqual(mutable, frozen)
+                with self.assertRaises(Exception):
+                    frozen.replace(unknown=None)
+
+    def test_pickle(self):
+        """pickleで凍結したobjectを復元できる."""
+        for frozen, _, _, _, _ in self.cases:
+            with self.subTest(frozen=frozen):
+                restored = pickle.loads(pickle.dumps(frozen))
+                self.assertIs(type(frozen), type(restored))
+                self.assertEqual(frozen, restored)
+                self.assertEqual(hash(frozen), hash(restored))
+
+    def test_timezone_conversions(self):
+        """時閒帶の變換は元のobjectを變へずに同じ型のobjectを返す."""
+        grdt = FrozenGregorianDateTime(2020, 1, 1, 0, 0, 0, "+09:00")
+        utc = grdt.to_utc_naive()
+        self.assertIsInstance(utc, FrozenGregorianDateTime)
+        self.assertEqual(GregorianDateTime(2019, 12, 31, 15, 0, 0, None), utc)
+        self.assertEqual(grdt, FrozenGregorianDateTime.from_utc_naive(utc, "+09:00"))
+        imdt = FrozenImperialDateTime(1425, 1, 1, 0, 0, 0, "+09:00")
+        standard = imdt.to_standard_naive()
+        self.assertIsInstance(standard, FrozenImperialDateTime)
+        self.assertEqual(ImperialDateTime(1424, 24, 27, 15, 0, 0, None), standard)
+        self.assertEqual(
+            imdt, FrozenImperialDateTime.from_standard_naive(standard, "+09:00")
+        )
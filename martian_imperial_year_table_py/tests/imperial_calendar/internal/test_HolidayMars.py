@@ -72,6 +72,72 @@ class TestHolidayMars(unittest.TestCase):
         with self.subTest(start=start, end=end):
             self.assertEqual(expected, HolidayMars.between(start, end))
 
+    def test_count_between(self):
+        """該當期閒中の祝日の數."""
+        Holidays.setUpForTest(
+            {1425: {1: {1: Internal(name="僞1"), 3: Internal(name="僞2")}}}
+        )
+        for expected, start, end in [
+            (2, HolidayMars(1425, 1, 1), HolidayMars(1425, 1, 3)),
+            (1, HolidayMars(1425, 1, 2), HolidayMars(1425, 1, 5)),
+            (0, HolidayMars(1425, 1, 2), HolidayMars(1425, 1, 2)),
+            (0, HolidayMars(1425, 1, 3), HolidayMars(1425, 1, 1)),
+        ]:
+            with self.subTest(start=start, end=end):
+                self.assertEqual(expected, HolidayMars.count_between(start, end))
+
+    def test_next_holiday(self):
+        """次の祝日と前の祝日."""
+        Holidays.setUpForTest(
+            {
+                1425: {24: {26: Internal(name="僞1")}},
+                1426: {1: {1: Internal(name="僞2")}},
+            }
+        )
+        self.assertEqual(
+            HolidayMars(1426, 1, 1), HolidayMars.next_holiday(HolidayMars(1425, 24, 26))
+        )
+        self.assertIsNone(HolidayMars.next_holiday(HolidayMars(1426, 1, 1)))
+        self.assertEqual(
+            HolidayMars(1425, 24, 26),
+            HolidayMars.previous_holiday(HolidayMars(1426, 1, 1)),
+        )
+        self.assertIsNone(HolidayMars.previous_holiday(HolidayMars(1425, 24, 26)))
+
+    def test_of(self):
+        """祝日のobjectは共有する."""
+        Holidays.setUpForTest({1425: {1: {1: Internal(name="僞1")}}})
+        self.assertIs(HolidayMars.of(1425, 1, 1), HolidayMars.of(1425, 1, 1))
+        self.assertEqual(HolidayMars(1425, 1, 2), HolidayMars.of(1425, 1, 2))
+        Holidays.setUpForTest({1425: {1: {2: Internal(name="僞2")}}})
+        self.assertFalse(HolidayMars.of(1425, 1, 1).is_holiday)
+        self.assertEqual(["僞2"], HolidayMars.of(1425, 1, 2).names)
+
+    def test_generates(self):
+        """HOLIDAYSに無い年の祝日は規則から生成する."""
+        Holidays.setUpForTest({1425: {1: {2: Internal(name="僞1")}}}, generates=True)
+        self.assertEqual(["僞1"], HolidayMars(1425, 1, 2).names)
+        self.assertFalse(HolidayMars(1425, 1, 1).is_holiday)
+        self.assertEqual(
+            ["四方節", "振替休日"],
+            [
+                holiday.names[0]
+                for holiday in HolidayMars.between(
+                    HolidayMars(1500, 1, 1), HolidayMars(1500, 1, 2)
+                )
+            ],
+        )
+        self.assertIs(HolidayMars.of(1500, 1, 1), HolidayMars.of(1500, 1, 1))
+        self.assertEqual(
+            HolidayMars(1426, 1, 1), HolidayMars.next_holiday(HolidayMars(1425, 1, 2))
+        )
+        self.assertEqual(
+            HolidayMars(1425, 1, 2),
+            HolidayMars.previous_holiday(HolidayMars(1426, 1, 1)),
+        )
+        Holidays.tearDownForTest()
+        self.assertEqual(["四方節"], HolidayMars(1500, 1, 1).names)
+
     def test_is_holiday(self):
         """その日が祝日であるか否か."""
         Holidays.setUpForTest({1425: {1: {1: Internal(name="僞1")}}})
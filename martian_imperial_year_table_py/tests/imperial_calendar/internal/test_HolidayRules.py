@@ -0,0 +1,83 @@
+"""Test HolidayRules."""
+
+from imperial_calendar import ImperialDateTime
+from imperial_calendar.internal.HolidayMars import HOLIDAYS
+from imperial_calendar.internal.HolidayRules import (
+    generate_holidays,
+    is_sunday,
+    solar_longitude_dates,
+    year_dates,
+)
+from imperial_calendar.transform import (
+    imdt_to_imsn,
+    imsn_to_mrsd,
+    mrsd_to_tert,
+    tert_to_mrls,
+)
+import unittest
+
+
+def mrls_at(year: int, month: int, day: int) -> float:
+    """其の日の始まりのLs."""
+    imdt = ImperialDateTime(year, month, day, 0, 0, 0, None)
+    return tert_to_mrls(mrsd_to_tert(imsn_to_mrsd(imdt_to_imsn(imdt))))
+
+
+class TestHolidayRules(unittest.TestCase):
+    """Test HolidayRules."""
+
+    def test_generate_holidays(self):
+        """規則から生成した祝日は公表した祝日と一致する."""
+        self.assertEqual(
+            {
+                month: {day: [internal.name] for (day, internal) in days.items()}
+                for (month, days) in HOLIDAYS[1425].items()
+            },
+            generate_holidays(1425),
+        )
+
+    def test_generate_holidays_year_end(self):
+        """年末の三日閒は月の日數に從ふ."""
+        for year, last_day in [(1425, 28), (1426, 27)]:
+            with self.subTest(year=year):
+                self.assertEqual(
+                    {
+                        last_day - 2: ["大祓前々日"],
+                        last_day - 1: ["大祓前日"],
+                        last_day: ["年越大祓"],
+                    },
+                    generate_holidays(year)[24],
+                )
+
+    def test_generate_holidays_substitute(self):
+        """日曜の祝日の後の最初の祝日でない日が振替休日."""
+        for year in range(1000, 2000, 37):
+            holidays = generate_holidays(year)
+            for month, days in holidays.items():
+                for day, names in days.items():
+                    if not is_sunday(day) or "振替休日" in names:
+                        continue
+                    with self.subTest(year=year, month=month, day=day):
+                        following = day + 1
+                        while "振替休日" not in days.get(following, ["振替休日"]):
+                            following += 1
+                        self.assertEqual(["振替休日"], days.get(following))
+
+    def test_is_sunday(self):
+        """日曜は各月の1, 8, 15, 22日."""
+        self.assertEqual(
+            [1, 8, 15, 22], [day for day in range(1, 29) if is_sunday(day)]
+        )
+
+    def test_solar_longitude_dates(self):
+        """其の日の閒にLsが値を過ぎる."""
+        for year in [0, 1000, 1425, 1426, 2000]:
+            dates = year_dates(year)
+            found = solar_longitude_dates(year, dates)
+            for ls, (month, day) in found.items():
+                with self.subTest(year=year, ls=ls):
+                    following = dates[dates.index((month, day)) + 1]
+                    start = (mrls_at(year, month, day) - ls + 180.0) % 360.0 - 180.0
+                    end = (mrls_at(year, *following) - ls + 180.0) % 360.0 - 180.0
+                    self.assertTrue(start <= 0.0 < end)
+            self.assertEqual([0.0, 180.0], sorted(found.keys()))
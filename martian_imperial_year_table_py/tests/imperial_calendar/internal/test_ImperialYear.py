@@ -1,6 +1,14 @@
 """Test ImperialYear."""
 
-from imperial_calendar.internal.ImperialYear import ImperialYear
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.internal.ImperialYear import (
+    ImperialYear,
+    days_array,
+    is_leap_year_array,
+    new_years_day_array,
+)
+from imperial_calendar.transform.imdt_to_imsn import imdt_to_imsn
+import numpy as np
 import unittest
 
 
@@ -18,3 +26,36 @@ class TestImperialYear(unittest.TestCase):
         """この年の日數."""
         for year, days in [(0, 668), (2, 668), (1, 669), (10, 669), (250, 668)]:
             self.assertEqual(days, ImperialYear(year).days())
+
+    def test_is_leap_year_array(self):
+        """各年が閏年か否かの配列."""
+        for start_year, stop_year in [(-1000, 1000), (1425, 1426), (0, 0)]:
+            with self.subTest(start_year=start_year, stop_year=stop_year):
+                self.assertEqual(
+                    [
+                        ImperialYear(year).is_leap_year()
+                        for year in range(start_year, stop_year)
+                    ],
+                    is_leap_year_array(start_year, stop_year).tolist(),
+                )
+
+    def test_days_array(self):
+        """各年の日數の配列."""
+        self.assertEqual(
+            [ImperialYear(year).days() for year in range(-1000, 1000)],
+            days_array(-1000, 1000).tolist(),
+        )
+
+    def test_new_years_day_array(self):
+        """各年の元日の通算日の配列."""
+        new_years_days = new_years_day_array(-1000, 1000)
+        self.assertEqual(2001, len(new_years_days))
+        self.assertTrue(
+            np.array_equal(days_array(-1000, 1000), np.diff(new_years_days))
+        )
+        for year in [-1000, -251, -1, 0, 1, 250, 999, 1000]:
+            with self.subTest(year=year):
+                self.assertEqual(
+                    imdt_to_imsn(ImperialDateTime(year, 1, 1, 0, 0, 0, None)).day,
+                    new_years_days[year + 1000],
+                )
@@ -0,0 +1,119 @@
+"""Test MonthGrid."""
+
+from imperial_calendar import GregorianDateTime, ImperialDateTime, ImperialYearMonth
+from imperial_calendar.internal.MonthGrid import month_grid
+from imperial_calendar.transform import (
+    grdt_to_juld,
+    imdt_to_imsn,
+    imsn_to_imdt,
+    imsn_to_mrsd,
+    juld_to_grdt,
+    juld_to_tert,
+    mrsd_to_imsn,
+    mrsd_to_tert,
+    tert_to_juld,
+    tert_to_mrsd,
+)
+import pickle
+import unittest
+
+
+def imdt_to_grdt(imdt: ImperialDateTime, timezone: str) -> GregorianDateTime:
+    """一つづつ變換したグレゴリオ曆の日時."""
+    if imdt.timezone is not None:
+        imdt = imdt.to_standard_naive()
+    juld = tert_to_juld(mrsd_to_tert(imsn_to_mrsd(imdt_to_imsn(imdt))))
+    return GregorianDateTime.from_utc_naive(juld_to_grdt(juld), timezone)
+
+
+def grdt_to_imdt(grdt: GregorianDateTime, timezone: str) -> ImperialDateTime:
+    """一つづつ變換した帝國火星曆の日時."""
+    imdt = imsn_to_imdt(
+        mrsd_to_imsn(tert_to_mrsd(juld_to_tert(grdt_to_juld(grdt.to_utc_naive()))))
+    )
+    if timezone is None:
+        return imdt
+    return ImperialDateTime.from_standard_naive(imdt, timezone)
+
+
+class TestMonthGrid(unittest.TestCase):
+    """Test MonthGrid."""
+
+    def test_month_grid(self):
+        """各日を一つづつ變換した結果と一致する."""
+        for year, month, grdt_timezone, imdt_timezone in [
+            (1425, 1, "+09:00", None),
+            (1425, 24, "Asia/Tokyo", "+09:00"),
+            (1424, 24, "America/New_York", "-05:30"),
+            (300, 1, "+00:00", None),
+            (-100, 1, "Asia/Tokyo", "+09:00"),
+        ]:
+            with self.subTest(year=year, month=month, grdt_timezone=grdt_timezone):
+                grid = month_grid(year, month, grdt_timezone, imdt_timezone)
+                self.assertEqual(ImperialYearMonth(year, month).days(), grid.days)
+                self.assertEqual(4, grid.rows)
+                for sol in grid.sols:
+                    imdt = ImperialDateTime(
+                        year, month, sol.day, 0, 0, 0, imdt_timezone
+                    )
+                    self.assertEqual(imdt_to_grdt(imdt, grdt_timezone), sol.grdt)
+                    self.assertEqual((sol.day - 1) % 7, sol.weekday)
+                    self.assertEqual((sol.day - 1) // 7, sol.row)
+                    self.assertEqual(imdt.holiday is not None, sol.is_holiday)
+                    self.assertEqual(sol.grdt.is_holiday, sol.is_grdt_holiday)
+                next_month = ImperialYearMonth(year, month).next_month()
+                self.assertEqual(
+                    imdt_to_grdt(
+                        ImperialDateTime(
+                            next_month.year, next_month.month, 1, 0, 0, 0, imdt_timezone
+                        ),
+                        grdt_timezone,
+                    ),
+                    grid.end,
+                )
+                for grdt_day in grid.grdt_days:
+                    self.assertEqual(
+                        grdt_to_imdt(grdt_day.grdt, imdt_timezone), grdt_day.imdt
+                    )
+                self.assertEqual(
+                    (grid.start.year, grid.start.month, grid.start.day),
+                    (
+                        grid.grdt_days[0].grdt.year,
+                        grid.grdt_days[0].grdt.month,
+                        grid.grdt_days[0].grdt.day,
+                    ),
+                )
+                self.assertEqual(
+                    (year, month),
+                    (grid.grdt_days[-1].imdt.year, grid.grdt_days[-1].imdt.month),
+                )
+
+    def test_holidays(self):
+        """帝國火星曆と日本との祝日."""
+        grid = month_grid(1425, 1, "+09:00")
+        self.assertEqual(
+            [1, 2, 3, 15, 16], [sol.day for sol in grid.sols if sol.is_holiday]
+        )
+        self.assertEqual(("振替休日",), grid.sols[1].holiday_names)
+        self.assertEqual(
+            [GregorianDateTime(2019, 1, 14, 0, 0, 0, "+09:00")],
+            [grdt_day.grdt for grdt_day in grid.grdt_days if grdt_day.is_holiday],
+        )
+
+    def test_cache(self):
+        """同じ年月と時閒帶とには同じ暦を返す."""
+        grid = ImperialYearMonth(1425, 2).grid("+09:00")
+        self.assertIs(grid, ImperialYearMonth(1425, 2).grid("+09:00"))
+        self.assertIsNot(grid, ImperialYearMonth(1425, 2).grid("+00:00"))
+        with self.assertRaises(Exception):
+            grid.sols[0].grdt.day = 1
+
+    def test_pickle(self):
+        """pickleで等値なobjectを復元できる."""
+        for value in [
+            month_grid(1425, 1, "+09:00").sols[0],
+            month_grid(1425, 1, "+09:00").grdt_days[0],
+        ]:
+            with self.subTest(value=value):
+                self.assertFalse(hasattr(value, "__dict__"))
+                self.assertEqual(value, pickle.loads(pickle.dumps(value)))
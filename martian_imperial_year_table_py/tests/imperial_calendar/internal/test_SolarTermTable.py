@@ -0,0 +1,48 @@
+"""Test SolarTermTable."""
+
+from imperial_calendar.internal.SolarTermTable import (
+    generate_solar_term_table,
+    load_solar_term_table,
+    save_solar_term_table,
+    year_start_imsn_array,
+)
+import numpy as np
+import os.path
+import tempfile
+import unittest
+
+
+class TestSolarTermTable(unittest.TestCase):
+    """Test SolarTermTable."""
+
+    def test_generate_solar_term_table(self):
+        """境界は漏れも重複も無く時刻順に竝ぶ."""
+        table = generate_solar_term_table(1400, 1450)
+        year_starts = year_start_imsn_array(1400, 1450)
+        self.assertEqual(50 * 24, len(table))
+        self.assertTrue(np.all(np.diff(table["imperial_sol_number"]) > 20.0))
+        self.assertTrue(np.all(np.diff(table["term"].astype(np.int64)) % 24 == 1))
+        self.assertLessEqual(year_starts[0], table["imperial_sol_number"][0])
+        self.assertLess(table["imperial_sol_number"][-1], year_starts[-1])
+
+    def test_load_solar_term_table(self):
+        """保存した表をmemory-mapして檢索する."""
+        table = generate_solar_term_table(1425, 1427)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solar_terms.npy")
+            save_solar_term_table(path, table)
+            loaded = load_solar_term_table(path)
+            self.assertIsInstance(loaded.table, np.memmap)
+            self.assertEqual(len(table), len(loaded))
+            (start, term) = table[5]
+            self.assertEqual((int(term), float(start)), loaded.find(start + 1.0))
+            self.assertEqual(
+                (int(table[4][1]), float(table[4][0])), loaded.find(start - 1.0)
+            )
+            self.assertIsNone(loaded.find(table[0][0] - 1.0))
+            self.assertIsNone(loaded.find(table[-1][0]))
+            self.assertEqual(
+                [(int(term), float(start)) for (start, term) in table[5:8]],
+                loaded.between(table[5][0], table[8][0]),
+            )
+            del loaded
@@ -0,0 +1,117 @@
+"""Test TimezoneTransitions."""
+
+from datetime import date, datetime, timedelta
+from imperial_calendar import GregorianDateTime
+from imperial_calendar.internal.TimezoneTransitions import (
+    civil_from_days,
+    civil_to_seconds,
+    civil_to_seconds_array,
+    days_from_civil,
+    epoch,
+    seconds_to_civil,
+    timezone_transitions,
+)
+from pytz import AmbiguousTimeError, NonExistentTimeError, timezone as tz, utc
+import unittest
+
+
+class TestTimezoneTransitions(unittest.TestCase):
+    """Test TimezoneTransitions."""
+
+    zones = [
+        "America/New_York",
+        "America/Santiago",
+        "Asia/Tokyo",
+        "Australia/Lord_Howe",
+        "EST",
+        "Europe/London",
+        "UTC",
+    ]
+
+    def instants(self, zone):
+        """切替の前後の時刻と、切替から離れた時刻と."""
+        instants = [datetime(1800, 1, 1), datetime(2000, 7, 1), datetime(2100, 1, 1)]
+        for transition in getattr(zone, "_utc_transition_times", [])[1:]:
+            if transition.year < 1900 or 2040 < transition.year:
+                continue
+            for seconds in [-3601, -3600, -1801, -1, 0, 1, 1800, 3599, 3600, 7200]:
+                instants.append(transition + timedelta(seconds=seconds))
+        return instants
+
+    def test_civil_to_seconds_array(self):
+        """scalar版と一致する."""
+        fields = [(1, 1, 1, 0, 0, 0), (1970, 1, 1, 0, 0, 1), (2024, 2, 29, 23, 59, 59)]
+        actual = civil_to_seconds_array(*zip(*fields))
+        for i, row in enumerate(fields):
+            with self.subTest(row=row):
+                self.assertEqual(civil_to_seconds(*row), actual[i])
+
+    def test_days_from_civil(self):
+        """`date` と一致し、`date` で表せない年も往復できる."""
+        unix_epoch = date(1970, 1, 1).toordinal()
+        for ordinal in range(1, date(9999, 12, 31).toordinal() + 1, 997):
+            grdt_date = date.fromordinal(ordinal)
+            with self.subTest(grdt_date=grdt_date):
+                civil = (grdt_date.year, grdt_date.month, grdt_date.day)
+                self.assertEqual(ordinal - unix_epoch, days_from_civil(*civil))
+                self.assertEqual(civil, civil_from_days(ordinal - unix_epoch))
+        self.assertEqual(
+            date(1, 1, 1).toordinal() - unix_epoch - 1, days_from_civil(0, 12, 31)
+        )
+        self.assertEqual((0, 2, 29), civil_from_days(days_from_civil(0, 3, 1) - 1))
+        for days in range(-5000000, 5000000, 9973):
+            with self.subTest(days=days):
+                self.assertEqual(days, days_from_civil(*civil_from_days(days)))
+        self.assertEqual(
+            (-100, 3, 1, 23, 59, 59),
+            seconds_to_civil(civil_to_seconds(-100, 3, 1, 23, 59, 59)),
+        )
+
+    def test_utc_offsets(self):
+        """UTCの時刻に對するオフセットはpytzのastimezoneと一致する."""
+        for name in self.zones:
+            zone = tz(name)
+            transitions = timezone_transitions(name)
+            instants = self.instants(zone)
+            actual = transitions.utc_offsets(
+                [(instant - epoch) // timedelta(seconds=1) for instant in instants]
+            )
+            for instant, offset in zip(instants, actual):
+                with self.subTest(zone=name, instant=instant):
+                    expected = utc.localize(instant).astimezone(zone).utcoffset()
+                    self.assertEqual(expected // timedelta(seconds=1), offset)
+
+    def test_local_offsets(self):
+        """地方時の時刻に對するオフセットはpytzのlocalizeと一致する."""
+        for name in self.zones:
+            zone = tz(name)
+            transitions = timezone_transitions(name)
+            instants = self.instants(zone)
+            seconds = [
+                (instant - epoch) // timedelta(seconds=1) for instant in instants
+            ]
+            for is_dst in [False, True]:
+                actual = transitions.local_offsets(seconds, is_dst)
+                for i, instant in enumerate(instants):
+                    with self.subTest(zone=name, instant=instant, is_dst=is_dst):
+                        expected = zone.localize(
+                            instant, is_dst
+                        ).utcoffset() // timedelta(seconds=1)
+                        self.assertEqual(expected, actual[i])
+                        self.assertEqual(
+                            expected, transitions.local_offset(seconds[i], is_dst)
+                        )
+
+    def test_fixed_offset(self):
+        """固定オフセットの時閒帶には表を作らない."""
+        self.assertIsNone(timezone_transitions("+09:00"))
+
+    def test_gregorian_date_time_offset(self):
+        """GregorianDateTime.offsetは曖昧な時刻と存在しない時刻とで例外を投げる."""
+        with self.assertRaises(AmbiguousTimeError):
+            GregorianDateTime(2021, 11, 7, 1, 30, 0, "America/New_York").offset
+        with self.assertRaises(NonExistentTimeError):
+            GregorianDateTime(2021, 3, 14, 2, 30, 0, "America/New_York").offset
+        self.assertEqual(
+            -4.0, GregorianDateTime(2021, 7, 1, 0, 0, 0, "America/New_York").offset
+        )
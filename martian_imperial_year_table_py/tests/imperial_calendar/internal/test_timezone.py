@@ -0,0 +1,54 @@
+"""Test timezone."""
+
+from datetime import timedelta
+from imperial_calendar.internal.timezone import (
+    fixed_offset_seconds,
+    offset_hours,
+    parse_fixed_offset,
+    resolve_timezone,
+)
+import unittest
+
+
+class TestTimezone(unittest.TestCase):
+    """Test timezone."""
+
+    def test_parse_fixed_offset(self):
+        """`±HH:MM` 形式を (符號, 時, 分) に分ける."""
+        for expected, timezone in [
+            [(1, 9, 0), "+09:00"],
+            [(1, 9, 0), "+9:0"],
+            [(-1, 5, 30), "-05:30"],
+            [(-1, 0, 0), "-00:00"],
+            [(1, 12, 45), "+12:45\n"],
+            [None, "09:00"],
+            [None, "+090:00"],
+            [None, "+09-00"],
+            [None, "+0９:00x"],
+            [None, "Asia/Tokyo"],
+            [None, ""],
+        ]:
+            with self.subTest(timezone=timezone):
+                self.assertEqual(expected, parse_fixed_offset(timezone))
+
+    def test_resolve_timezone(self):
+        """同じオフセットには同じobjectを返す."""
+        self.assertIs(resolve_timezone("+09:00"), resolve_timezone("+9:00"))
+        self.assertEqual(
+            timedelta(hours=-5, minutes=-30), resolve_timezone("-05:30").utcoffset(None)
+        )
+        self.assertIs(resolve_timezone("Asia/Tokyo"), resolve_timezone("Asia/Tokyo"))
+        self.assertEqual("Asia/Tokyo", str(resolve_timezone("Asia/Tokyo")))
+
+    def test_fixed_offset_seconds(self):
+        """固定オフセットの秒數. 名前附きの時閒帶ならNone."""
+        self.assertEqual(9 * 60 * 60, fixed_offset_seconds("+09:00"))
+        self.assertEqual(-(5 * 60 + 30) * 60, fixed_offset_seconds("-05:30"))
+        self.assertIsNone(fixed_offset_seconds("UTC"))
+
+    def test_offset_hours(self):
+        """オフセットの時閒數. 名前附きの時閒帶は扱へない."""
+        self.assertEqual(9.0, offset_hours("+09:00"))
+        self.assertEqual(-5.5, offset_hours("-05:30"))
+        with self.assertRaises(Exception):
+            offset_hours("Asia/Tokyo")
@@ -0,0 +1,68 @@
+"""Test CalendarImage."""
+
+from imperial_calendar.CalendarImage import CalendarImage, draw_calendar_svg
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.internal.HolidayMars import HolidayMars
+from xml.dom import minidom
+import io
+import unittest
+
+
+class TestCalendarImage(unittest.TestCase):
+    """Test CalendarImage."""
+
+    def test_draw_as_svg(self):
+        """生成されたSVGに表題と文字とを含む."""
+        imdt = ImperialDateTime(1425, 1, 1, 0, 0, 0, "+00:00")
+        svg = CalendarImage(imdt, "+09:00").draw_as_svg()
+        self.assertIn("帝國火星暦", svg)
+        document = minidom.parseString(svg)
+        self.assertEqual(
+            "帝國火星曆1425年1月",
+            document.getElementsByTagName("title")[0].firstChild.data,
+        )
+        texts = [
+            "".join(node.data for node in text.childNodes)
+            for text in document.getElementsByTagName("text")
+        ]
+        for expected in [
+            "1425年",
+            "1月",
+            "(立春月)",
+            "2019/1/10(木)13:06:47",
+            "2/8(金)07:35:13",
+        ]:
+            with self.subTest(expected=expected):
+                self.assertIn(expected, texts)
+        self.assertIn("・".join(HolidayMars(1425, 1, 1).names), texts)
+
+    def test_draw_calendar_svg(self):
+        """draw_calendar_svg經由でも描畫できる."""
+        imdt = ImperialDateTime(1425, 2, 1, 0, 0, 0, "+00:00")
+        svg = draw_calendar_svg(imdt, "+09:00")
+        self.assertTrue(svg.startswith("<svg"))
+        self.assertEqual(svg, draw_calendar_svg(imdt, "+09:00"))
+
+    def test_write_svg(self):
+        """streamに書き出す."""
+        imdt = ImperialDateTime(1425, 24, 3, 4, 5, 6, "+00:00")
+        stream = io.StringIO()
+        CalendarImage(imdt, "Asia/Tokyo").write_svg(stream)
+        self.assertEqual(
+            CalendarImage(imdt, "Asia/Tokyo").draw_as_svg(), stream.getvalue()
+        )
+
+    def test_static_frame(self):
+        """27日の月は最後の週が六日."""
+        for expected, imdt in [
+            ("157.5mm", ImperialDateTime(1245, 24, 1, 0, 0, 0, "+00:00")),
+            ("135mm", ImperialDateTime(1246, 24, 1, 0, 0, 0, "+00:00")),
+        ]:
+            with self.subTest(imdt=imdt):
+                document = minidom.parseString(
+                    CalendarImage(imdt, "+09:00").draw_as_svg()
+                )
+                self.assertEqual(
+                    expected,
+                    document.getElementsByTagName("rect")[3].getAttribute("width"),
+                )
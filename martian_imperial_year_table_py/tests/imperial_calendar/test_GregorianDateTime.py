@@ -1,6 +1,8 @@
 """Test GregorianDateTime."""
 
 from imperial_calendar.GregorianDateTime import GregorianDateTime
+import copy
+import pickle
 import unittest
 
 
@@ -57,6 +59,7 @@ class TestGregorianDateTime(unittest.TestCase):
         self.assertFalse(
             GregorianDateTime(2020, 2, 25, 0, 0, 0, "Asia/Tokyo").is_holiday
         )
+        self.assertFalse(GregorianDateTime(0, 1, 1, 0, 0, 0, "Asia/Tokyo").is_holiday)
 
     def test_to_utc_naive(self):
         """Convert to naive GregorianDateTime as UTC."""
@@ -90,3 +93,17 @@ class TestGregorianDateTime(unittest.TestCase):
         """正しい曜日を取得する."""
         self.assertEqual(3, GregorianDateTime(2020, 1, 1, 0, 0, 0, "+09:00").weekday)
         self.assertEqual(4, GregorianDateTime(2020, 12, 31, 0, 0, 0, "+09:00").weekday)
+        # 紀元前1年 (0年) 12月31日は西暦1年1月1日 (月曜) の前日
+        self.assertEqual(7, GregorianDateTime(0, 12, 31, 0, 0, 0, "+09:00").weekday)
+
+    def test_pickle(self):
+        """pickleとcopyとで等値なobjectを復元できる."""
+        for value in [
+            GregorianDateTime(2020, 2, 29, 12, 34, 56, None),
+            GregorianDateTime(2020, 2, 29, 12, 34, 56, "Asia/Tokyo"),
+        ]:
+            with self.subTest(value=value):
+                self.assertFalse(hasattr(value, "__dict__"))
+                self.assertEqual(value, pickle.loads(pickle.dumps(value)))
+                self.assertEqual(value, copy.copy(value))
+                self.assertEqual(value, copy.deepcopy(value))
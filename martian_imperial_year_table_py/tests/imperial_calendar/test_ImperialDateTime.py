@@ -2,7 +2,10 @@
 
 from imperial_calendar.ImperialDateTime import ImperialDateTime
 from imperial_calendar.internal.HolidayMars import HolidayMars
+from imperial_calendar.transform import imdt_to_imsn
+import copy
 import math
+import pickle
 import unittest
 
 
@@ -93,6 +96,52 @@ class TestImperialDateTime(unittest.TestCase):
         with self.subTest(lhs=lhs, rhs=rhs):
             self.assertTrue(lhs < rhs)
 
+    def test_comparisons(self):
+        """時閒帶を跨いで瞬閒の前後で比較する."""
+        earlier = ImperialDateTime(1425, 1, 1, 9, 0, 0, "+09:00")
+        same = ImperialDateTime(1424, 24, 27, 23, 0, 0, "-01:00")
+        later = ImperialDateTime(1425, 1, 1, 0, 0, 1, None)
+        self.assertTrue(earlier <= same and earlier >= same)
+        self.assertFalse(earlier < same or earlier > same)
+        self.assertTrue(earlier < later and earlier <= later)
+        self.assertTrue(later > same and later >= same)
+        self.assertEqual(hash(earlier), hash(same))
+        self.assertEqual([later, earlier], sorted([later, earlier], reverse=True))
+
+    def test_equality_across_timezones(self):
+        """時閒帶の違ふ同じ瞬閒は、大小の比較では竝ぶが、等値ではない."""
+        tokyo = ImperialDateTime(1425, 1, 1, 9, 0, 0, "+09:00")
+        utc = ImperialDateTime(1425, 1, 1, 0, 0, 0, "+00:00")
+        self.assertTrue(tokyo <= utc and utc <= tokyo)
+        self.assertFalse(tokyo < utc or utc < tokyo)
+        self.assertNotEqual(tokyo, utc)
+        self.assertEqual(tokyo.sort_key, utc.sort_key)
+        self.assertEqual(hash(tokyo), hash(utc))
+        self.assertEqual(2, len({tokyo, utc}))
+
+    def test_sort_key(self):
+        """標準時の通算秒."""
+        for imdt in [
+            ImperialDateTime(1425, 1, 1, 0, 0, 0, None),
+            ImperialDateTime(1425, 24, 28, 23, 59, 59, "+09:00"),
+            ImperialDateTime(-1, 12, 27, 12, 34, 56, "-05:30"),
+        ]:
+            with self.subTest(imdt=imdt):
+                standard = imdt.to_standard_naive() if imdt.timezone else imdt
+                imsn = imdt_to_imsn(standard)
+                self.assertEqual(
+                    imsn.day * 24 * 60 * 60 + round(imsn.second), imdt.sort_key
+                )
+
+    def test_sort_key_invalidation(self):
+        """屬性を變更するとsort_keyも變はる."""
+        imdt = ImperialDateTime(1425, 1, 1, 0, 0, 0, None)
+        sort_key = imdt.sort_key
+        imdt.hour = 1
+        self.assertEqual(sort_key + 60 * 60, imdt.sort_key)
+        imdt.timezone = "+01:00"
+        self.assertEqual(sort_key, imdt.sort_key)
+
     def test_from_standard_naive(self):
         """From standard timezone naive ImperialDateTime."""
         for hour, minute in [
@@ -174,3 +223,15 @@ class TestImperialDateTime(unittest.TestCase):
                         1398, 1, 1, hour, minute, 0, timezone
                     ).to_standard_naive(),
                 )
+
+    def test_pickle(self):
+        """pickleとcopyとで等値なobjectを復元できる."""
+        for value in [
+            ImperialDateTime(1425, 24, 28, 12, 34, 56, None),
+            ImperialDateTime(1425, 24, 28, 12, 34, 56, "+09:00"),
+        ]:
+            with self.subTest(value=value):
+                self.assertFalse(hasattr(value, "__dict__"))
+                self.assertEqual(value, pickle.loads(pickle.dumps(value)))
+                self.assertEqual(value, copy.copy(value))
+                self.assertEqual(value, copy.deepcopy(value))
@@ -0,0 +1,95 @@
+"""Test ImperialDateTimeArray."""
+
+from imperial_calendar import ImperialDateTime, ImperialDateTimeArray
+from imperial_calendar.ImperialDateTime import format_timezone
+from imperial_calendar.transform import imdt_to_imsn
+import numpy as np
+import unittest
+
+
+class TestImperialDateTimeArray(unittest.TestCase):
+    """Test ImperialDateTimeArray."""
+
+    imdts = [
+        ImperialDateTime(1425, 1, 1, 0, 0, 0, "+09:00"),
+        ImperialDateTime(1425, 24, 28, 23, 59, 59, "+09:00"),
+        ImperialDateTime(-1, 12, 27, 12, 34, 56, "+09:00"),
+    ]
+
+    def test_format_timezone(self):
+        """オフセットを時閒帶の文字列にする."""
+        for expected, offset in [
+            ["+00:00", 0.0],
+            ["+09:00", 9.0],
+            ["-05:30", -5.5],
+            ["+12:45", 12.75],
+        ]:
+            with self.subTest(offset=offset):
+                self.assertEqual(expected, format_timezone(offset))
+
+    def test_from_imperial_date_times(self):
+        """ImperialDateTimeの列と相互に變換できる."""
+        mixed = self.imdts + [ImperialDateTime(1425, 1, 1, 0, 0, 0, "-01:30")]
+        for imdts in [self.imdts, mixed, [imdt.to_standard_naive() for imdt in mixed]]:
+            with self.subTest(imdts=imdts):
+                array = ImperialDateTimeArray.from_imperial_date_times(imdts)
+                self.assertEqual(len(imdts), len(array))
+                self.assertEqual(imdts, list(array))
+
+    def test_getitem(self):
+        """添字でImperialDateTimeを、sliceでImperialDateTimeArrayを返す."""
+        array = ImperialDateTimeArray.from_imperial_date_times(self.imdts)
+        self.assertEqual(self.imdts[1], array[1])
+        self.assertEqual(self.imdts[-1], array[-1])
+        self.assertEqual(self.imdts[1:], list(array[1:]))
+        self.assertEqual([self.imdts[2], self.imdts[0]], list(array[[2, 0]]))
+
+    def test_imperial_sol_numbers(self):
+        """通算日の配列と相互に變換できる."""
+        for timezone in [None, "+09:00", "-01:30"]:
+            with self.subTest(timezone=timezone):
+                imdts = [
+                    ImperialDateTime(
+                        imdt.year,
+                        imdt.month,
+                        imdt.day,
+                        imdt.hour,
+                        imdt.minute,
+                        imdt.second,
+                        timezone,
+                    )
+                    for imdt in self.imdts
+                ]
+                array = ImperialDateTimeArray.from_imperial_date_times(imdts)
+                (day, second) = array.to_imperial_sol_numbers()
+                for i, imdt in enumerate(imdts):
+                    if timezone is not None:
+                        imdt = imdt.to_standard_naive()
+                    imsn = imdt_to_imsn(imdt)
+                    self.assertEqual((imsn.day, imsn.second), (day[i], second[i]))
+                self.assertEqual(
+                    imdts,
+                    list(
+                        ImperialDateTimeArray.from_imperial_sol_numbers(
+                            day, second, timezone
+                        )
+                    ),
+                )
+
+    def test_offsets(self):
+        """行毎のオフセットを持てる."""
+        array = ImperialDateTimeArray.from_imperial_sol_numbers(
+            [952749, 952749], [0.0, 0.0], offsets=[9.0, -1.5]
+        )
+        np.testing.assert_array_equal([9.0, -1.5], array.offsets)
+        self.assertEqual(
+            [
+                ImperialDateTime(1425, 1, 1, 9, 0, 0, "+09:00"),
+                ImperialDateTime(1424, 24, 27, 22, 30, 0, "-01:30"),
+            ],
+            list(array),
+        )
+        self.assertEqual(
+            [ImperialDateTime(1425, 1, 1, 0, 0, 0, None)] * 2,
+            list(array.to_standard_naive()),
+        )
@@ -1,6 +1,8 @@
 """Test ImperialSolNumber."""
 
 from imperial_calendar import ImperialSolNumber
+import copy
+import pickle
 import unittest
 
 
@@ -11,3 +13,12 @@ class TestImperialSolNumber(unittest.TestCase):
         """等値性."""
         self.assertEqual(ImperialSolNumber(0.0), ImperialSolNumber(0.0))
         self.assertNotEqual(ImperialSolNumber(0.0), ImperialSolNumber(0.1))
+
+    def test_pickle(self):
+        """pickleとcopyとで等値なobjectを復元できる."""
+        for value in [ImperialSolNumber(0.0), ImperialSolNumber(123, 45.5)]:
+            with self.subTest(value=value):
+                self.assertFalse(hasattr(value, "__dict__"))
+                self.assertEqual(value, pickle.loads(pickle.dumps(value)))
+                self.assertEqual(value, copy.copy(value))
+                self.assertEqual(value, copy.deepcopy(value))
@@ -1,6 +1,8 @@
 """Test ImperialYearMonth."""
 
 from imperial_calendar.ImperialYearMonth import ImperialYearMonth
+import copy
+import pickle
 import unittest
 
 
@@ -33,3 +35,12 @@ class TestImperialYearMonth(unittest.TestCase):
         ]:
             with self.subTest(month=month):
                 self.assertEqual(expected, month.prev_month())
+
+    def test_pickle(self):
+        """pickleとcopyとで等値なobjectを復元できる."""
+        for value in [ImperialYearMonth(1425, 1), ImperialYearMonth(-1, 24)]:
+            with self.subTest(value=value):
+                self.assertFalse(hasattr(value, "__dict__"))
+                self.assertEqual(value, pickle.loads(pickle.dumps(value)))
+                self.assertEqual(value, copy.copy(value))
+                self.assertEqual(value, copy.deepcopy(value))
@@ -0,0 +1,86 @@
+"""Test JulianDay."""
+
+from imperial_calendar import GregorianDateTime
+from imperial_calendar.JulianDay import (
+    JulianDay,
+    delta_t_array,
+    delta_t_breakpoints,
+    julian_day_to_gregorian_year,
+    julian_day_to_gregorian_year_array,
+    julian_day_to_julian_year,
+    julian_day_to_julian_year_array,
+)
+from imperial_calendar.transform import grdt_to_juld
+import copy
+import math
+import pickle
+import unittest
+
+
+class TestJulianDay(unittest.TestCase):
+    """Test JulianDay."""
+
+    def test_delta_t_array(self):
+        """配列版ΔTは區閒の境界の前後を含めてscalar版と一致する."""
+        julian_days = [-2000000.0, 0.0, 1000000.5, 2299160.0, 2299160.5, 2299161.25]
+        julian_days += [
+            grdt_to_juld(GregorianDateTime(year, 1, 1, 0, 0, 0, None)).julian_day
+            + offset
+            for year in range(1600, 2200, 50)
+            for offset in [-0.5, 0.0, 0.5]
+        ]
+        julian_days += [
+            grdt_to_juld(GregorianDateTime(int(year), 1, 1, 0, 0, 0, None)).julian_day
+            + offset
+            for year in delta_t_breakpoints
+            if year >= 1600
+            for offset in [-1.0e-3, 0.0, 1.0e-3]
+        ]
+        actual = delta_t_array(julian_days)
+        for julian_day, delta_t in zip(julian_days, actual):
+            with self.subTest(julian_day=julian_day):
+                self.assertTrue(
+                    math.isclose(
+                        JulianDay(julian_day).delta_t,
+                        float(delta_t),
+                        rel_tol=1e-12,
+                        abs_tol=1e-6,
+                    )
+                )
+
+    def test_julian_day_to_julian_year_array(self):
+        """ユリウス年表示の配列."""
+        julian_days = [-1000000.25, 0.0, 1721117.5, 1721423.5, 2000000.0, 2299160.0]
+        for julian_day, year in zip(
+            julian_days, julian_day_to_julian_year_array(julian_days)
+        ):
+            with self.subTest(julian_day=julian_day):
+                self.assertEqual(
+                    julian_day_to_julian_year(JulianDay(julian_day)), float(year)
+                )
+
+    def test_julian_day_to_gregorian_year_array(self):
+        """グレゴリオ年表示の配列."""
+        julian_days = [2299160.5, 2400000.5, 2451544.5, 2451545.0, 2460000.75]
+        for julian_day, year in zip(
+            julian_days, julian_day_to_gregorian_year_array(julian_days)
+        ):
+            with self.subTest(julian_day=julian_day):
+                self.assertEqual(
+                    julian_day_to_gregorian_year(JulianDay(julian_day)), float(year)
+                )
+
+    def test_eq(self):
+        """等値性."""
+        self.assertEqual(JulianDay(2451545.0), JulianDay(2451545, 0.25))
+        self.assertNotEqual(JulianDay(2451545.0), JulianDay(2451546.0))
+        self.assertNotEqual(JulianDay(2451545.0), JulianDay(2451545.5))
+
+    def test_pickle(self):
+        """pickleとcopyとで等値なobjectを復元できる."""
+        for value in [JulianDay(2451545.0), JulianDay(2451545, 43200.5)]:
+            with self.subTest(value=value):
+                self.assertFalse(hasattr(value, "__dict__"))
+                self.assertEqual(value, pickle.loads(pickle.dumps(value)))
+                self.assertEqual(value, copy.copy(value))
+                self.assertEqual(value, copy.deepcopy(value))
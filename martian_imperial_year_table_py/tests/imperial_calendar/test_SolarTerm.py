@@ -0,0 +1,107 @@
+"""Test SolarTerm."""
+
+from imperial_calendar import ImperialDateTime, ImperialSolNumber
+from imperial_calendar.internal.SolarTermTable import generate_solar_term_table
+from imperial_calendar.SolarTerm import (
+    SolarTerm,
+    SolarTerms,
+    solar_term_of,
+    solar_terms_of_year,
+)
+from imperial_calendar.transform import imsn_to_mrsd, mrsd_to_tert, tert_to_mrls
+import math
+import pickle
+import unittest
+
+
+def imsn_to_mrls(imsn: ImperialSolNumber) -> float:
+    """Convert one by one."""
+    return tert_to_mrls(mrsd_to_tert(imsn_to_mrsd(imsn)))
+
+
+class TestSolarTerm(unittest.TestCase):
+    """Test SolarTerm."""
+
+    def tearDown(self):
+        """Restore the solar term table."""
+        SolarTerms.tearDownForTest()
+
+    def test_name(self):
+        """節氣の名は月名と同じ."""
+        solar_term = SolarTerm(21, ImperialSolNumber(952749, 0.0))
+        self.assertEqual("冬至", solar_term.name)
+        self.assertEqual(270.0, solar_term.mrls)
+        self.assertEqual(solar_term, pickle.loads(pickle.dumps(solar_term)))
+
+    def test_solar_term_of(self):
+        """其の時刻を含む節氣."""
+        for imdt in [
+            ImperialDateTime(1425, 1, 1, 0, 0, 0, None),
+            ImperialDateTime(1425, 3, 15, 12, 0, 0, "+09:00"),
+            ImperialDateTime(1425, 22, 1, 0, 0, 0, None),
+            ImperialDateTime(500, 12, 1, 0, 0, 0, None),
+            ImperialDateTime(3000, 12, 1, 0, 0, 0, None),
+        ]:
+            with self.subTest(imdt=imdt):
+                solar_term = solar_term_of(imdt)
+                self.assertTrue(
+                    math.isclose(
+                        0.0,
+                        (imsn_to_mrls(solar_term.start) - solar_term.mrls + 180.0)
+                        % 360.0
+                        - 180.0,
+                        abs_tol=1.0e-7,
+                    )
+                )
+                mrls = imsn_to_mrls(
+                    ImperialSolNumber(
+                        solar_term_of(imdt).start.imperial_sol_number + 1.0
+                    )
+                )
+                self.assertEqual(
+                    solar_term.term, math.floor((mrls - 315.0) % 360.0 / 15.0)
+                )
+
+    def test_solar_term_of_boundary_outside_table(self):
+        """表の範圍外でも、境界の直前は前の節氣、直後は其の境界から始まる節氣になる."""
+        for year in [500, 3000, 3003]:
+            for imperial_sol_number, term in generate_solar_term_table(year, year + 1):
+                (imperial_sol_number, term) = (float(imperial_sol_number), int(term))
+                for epsilon in [1.0e-4, 0.02]:
+                    with self.subTest(year=year, term=term, epsilon=epsilon):
+                        before = solar_term_of(
+                            ImperialSolNumber(imperial_sol_number - epsilon)
+                        )
+                        self.assertEqual((term - 1) % 24, before.term)
+                        self.assertLess(
+                            before.start.imperial_sol_number, imperial_sol_number - 1.0
+                        )
+                        after = solar_term_of(
+                            ImperialSolNumber(imperial_sol_number + epsilon)
+                        )
+                        self.assertEqual(term, after.term)
+                        self.assertTrue(
+                            math.isclose(
+                                imperial_sol_number,
+                                after.start.imperial_sol_number,
+                                abs_tol=1.0e-6,
+                            )
+                        )
+
+    def test_solar_term_of_without_table(self):
+        """表が無くても同じ節氣を求める."""
+        imdt = ImperialDateTime(1425, 3, 15, 12, 0, 0, None)
+        expected = solar_term_of(imdt)
+        SolarTerms.setUpForTest(None)
+        self.assertEqual(expected, solar_term_of(imdt))
+
+    def test_solar_terms_of_year(self):
+        """其の年に始まる節氣."""
+        solar_terms = solar_terms_of_year(1425)
+        self.assertEqual(24, len(solar_terms))
+        self.assertEqual(
+            [(term + 1) % 24 for term in range(24)],
+            [solar_term.term for solar_term in solar_terms],
+        )
+        SolarTerms.setUpForTest(None)
+        self.assertEqual(solar_terms, solar_terms_of_year(1425))
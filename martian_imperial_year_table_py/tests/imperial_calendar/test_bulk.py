@@ -0,0 +1,155 @@
+"""Test bulk."""
+
+from imperial_calendar import bulk
+from imperial_calendar.ImperialDateTime import ImperialDateTime
+from imperial_calendar.ImperialDateTimeArray import ImperialDateTimeArray
+from imperial_calendar.ImperialSolNumber import ImperialSolNumber
+import numpy as np
+import unittest
+
+
+class TestBulk(unittest.TestCase):
+    """Test bulk."""
+
+    def setUp(self):
+        """Set up."""
+        self.values = [
+            ImperialDateTime(1425, 1, 2, 0, 0, 0, None),
+            ImperialDateTime(1425, 1, 1, 9, 0, 0, "+09:00"),
+            ImperialDateTime(1425, 1, 1, 12, 0, 0, None),
+            ImperialDateTime(1424, 24, 27, 22, 0, 0, "-01:00"),
+            ImperialDateTime(1425, 1, 1, 0, 0, 0, None),
+        ]
+
+    def test_sort(self):
+        """時刻の列を竝べる."""
+        self.assertEqual(
+            [
+                self.values[3],
+                self.values[1],
+                self.values[4],
+                self.values[2],
+                self.values[0],
+            ],
+            bulk.sort(self.values),
+        )
+        self.assertEqual([3, 1, 4, 2, 0], list(bulk.argsort(self.values)))
+
+    def test_sort_array(self):
+        """ImperialDateTimeArrayと通算日の配列の組とを竝べる."""
+        naive = [
+            value.to_standard_naive() if value.timezone else value
+            for value in self.values
+        ]
+        array = ImperialDateTimeArray.from_imperial_date_times(naive)
+        self.assertEqual(sorted(naive), list(bulk.sort(array)))
+        day, second = array.to_imperial_sol_numbers()
+        sorted_day, sorted_second = bulk.sort((day, second))
+        self.assertEqual(
+            (array.to_imperial_sol_numbers()[0][bulk.argsort(array)]).tolist(),
+            sorted_day.tolist(),
+        )
+        self.assertTrue(np.all(np.diff(sorted_day * 86400 + sorted_second) >= 0))
+
+    def test_searchsorted(self):
+        """竝びを崩さずに插入できる位置."""
+        values = bulk.sort(self.values)
+        target = ImperialDateTime(1425, 1, 1, 6, 0, 0, None)
+        self.assertEqual(3, bulk.searchsorted(values, target))
+        self.assertEqual(1, bulk.searchsorted(values, values[1]))
+        self.assertEqual(3, bulk.searchsorted(values, values[1], side="right"))
+        self.assertEqual(
+            [0, 3, 5],
+            bulk.searchsorted(
+                values,
+                [
+                    ImperialDateTime(1400, 1, 1, 0, 0, 0, None),
+                    target,
+                    ImperialSolNumber(952749 + 10, 0.0),
+                ],
+            ).tolist(),
+        )
+
+    def test_searchsorted_keys(self):
+        """鍵の配列を渡しても同じ位置になる."""
+        values = bulk.sort(self.values)
+        keys = bulk.sort_keys(values)
+        for target in values + [ImperialDateTime(1425, 1, 1, 6, 0, 0, None)]:
+            for side in ["left", "right"]:
+                with self.subTest(target=target, side=side):
+                    self.assertEqual(
+                        bulk.searchsorted(values, target, side=side),
+                        bulk.searchsorted(keys, target, side=side),
+                    )
+        self.assertEqual(
+            bulk.searchsorted(values, values).tolist(),
+            bulk.searchsorted(keys, values).tolist(),
+        )
+
+    def test_sub_second(self):
+        """一秒に滿たない差でも順序を保つ."""
+        values = [
+            ImperialSolNumber(10, 0.7),
+            ImperialSolNumber(10, 0.3),
+            ImperialSolNumber(10, 0.6),
+            ImperialSolNumber(-1, 86399.9),
+        ]
+        expected = [values[3], values[1], values[2], values[0]]
+        self.assertEqual(expected, bulk.sort(values))
+        day = np.array([value.day for value in values])
+        second = np.array([value.second for value in values])
+        sorted_day, sorted_second = bulk.sort((day, second))
+        self.assertEqual([-1, 10, 10, 10], sorted_day.tolist())
+        self.assertEqual([86399.9, 0.3, 0.6, 0.7], sorted_second.tolist())
+        self.assertEqual(2, bulk.searchsorted(expected, ImperialSolNumber(10, 0.5)))
+        self.assertEqual(
+            [values[2]],
+            bulk.between(
+                values, ImperialSolNumber(10, 0.5), ImperialSolNumber(10, 0.7)
+            ),
+        )
+        self.assertEqual(
+            expected,
+            list(bulk.merge([values[3], values[1], values[0]], [values[2]])),
+        )
+
+    def test_between(self):
+        """start以上end未滿の時刻を元の順で返す."""
+        self.assertEqual(
+            [self.values[1], self.values[2], self.values[4]],
+            bulk.between(
+                self.values,
+                ImperialSolNumber(952749, 0.0),
+                ImperialDateTime(1425, 1, 2, 0, 0, 0, None),
+            ),
+        )
+
+    def test_merge(self):
+        """竝んだ時刻の列を併合する."""
+        lhs = bulk.sort(self.values[:2])
+        rhs = bulk.sort(self.values[2:])
+        self.assertEqual(bulk.sort(self.values), list(bulk.merge(lhs, rhs)))
+
+    def test_merge_arrays(self):
+        """竝んだ配列を併合する."""
+        lhs = ImperialDateTimeArray.from_imperial_date_times(
+            [
+                ImperialDateTime(1425, 1, 1, 0, 0, 0, "+09:00"),
+                ImperialDateTime(1425, 1, 2, 0, 0, 0, "+09:00"),
+            ]
+        )
+        rhs = ImperialDateTimeArray.from_imperial_date_times(
+            [
+                ImperialDateTime(1425, 1, 1, 0, 0, 0, "-01:00"),
+                ImperialDateTime(1425, 1, 3, 0, 0, 0, "-01:00"),
+            ]
+        )
+        merged = bulk.merge_arrays(lhs, rhs)
+        self.assertEqual(
+            [lhs[0], rhs[0], lhs[1], rhs[1]],
+            list(merged),
+        )
+        self.assertEqual(
+            ["+09:00", "-01:00", "+09:00", "-01:00"],
+            [value.timezone for value in merged],
+        )
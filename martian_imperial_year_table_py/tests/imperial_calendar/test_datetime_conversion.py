@@ -0,0 +1,85 @@
+"""Test datetime_conversion."""
+
+from datetime import datetime, timezone
+from imperial_calendar.datetime_conversion import (
+    build_current_imperial_date_time_response,
+    build_gregorian_to_imperial_response,
+    build_imperial_to_gregorian_response,
+    validate_timezone,
+)
+import unittest
+
+
+class TestDateTimeConversion(unittest.TestCase):
+    """Test datetime_conversion."""
+
+    def test_validate_timezone(self):
+        """`validateTimezone` と同じ檢證."""
+        for value, expected in [
+            ("+00:00", None),
+            ("-23:59", None),
+            ("+0900", "Invalid timezone format"),
+            ("Asia/Tokyo", "Invalid timezone format"),
+            ("+09:00\n", "Invalid timezone format"),
+            ("+24:00", "Invalid timezone value"),
+            ("+09:60", "Invalid timezone value"),
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(expected, validate_timezone(value))
+
+    def test_build_imperial_to_gregorian_response(self):
+        """帝國火星曆の日時をグレゴリオ曆の日時に變換する."""
+        self.assertEqual(
+            {"gregorianDateTime": "2019-01-09T23:06:47-05:00"},
+            build_imperial_to_gregorian_response("1425-01-01T00:00:00+00:00", "-05:00"),
+        )
+        self.assertEqual(
+            {"gregorianDateTime": "2019-01-10T04:06:47+00:00"},
+            build_imperial_to_gregorian_response("1425-01-01T09:00:00+09:00", "+00:00"),
+        )
+        for value in [
+            "1425-01-01 00:00:00+00:00",
+            "1425-25-01T00:00:00+00:00",
+            "1425-24-29T00:00:00+00:00",
+            "1425-01-01T24:00:00+00:00",
+            "1425-01-01T00:00:00+24:00",
+        ]:
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(
+                    Exception, "^Invalid imperialDateTimeFormatted$"
+                ):
+                    build_imperial_to_gregorian_response(value, "+00:00")
+
+    def test_build_gregorian_to_imperial_response(self):
+        """時閒帶附きのグレゴリオ曆の日時を帝國火星曆の日時に變換する."""
+        expected = {
+            "imperialDateTime": {
+                "year": 1425,
+                "month": 1,
+                "day": 1,
+                "hour": 17,
+                "minute": 45,
+                "second": 34,
+                "timezone": "+09:00",
+            },
+            "imperialDateTimeFormatted": "1425-01-01T17:45:34+09:00",
+        }
+        for value in ["2019-01-10T13:06:47.5Z", "2019-01-10T22:06:47.500+09:00"]:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    expected, build_gregorian_to_imperial_response(value, "+09:00")
+                )
+        with self.assertRaisesRegex(Exception, "^Invalid gregorianDateTime format$"):
+            build_gregorian_to_imperial_response("2019-01-10T13:06:47", "+09:00")
+        with self.assertRaisesRegex(Exception, "^Invalid gregorianDateTime$"):
+            build_gregorian_to_imperial_response("2019-13-10T13:06:47Z", "+09:00")
+
+    def test_build_current_imperial_date_time_response(self):
+        """現在の日時の應答."""
+        now = datetime(2019, 1, 10, 13, 6, 47, 500000, tzinfo=timezone.utc)
+        response = build_current_imperial_date_time_response(now, "+09:00")
+        self.assertEqual("2019-01-10T13:06:47.500Z", response["gregorianDateTime"])
+        self.assertEqual(
+            "1425-01-01T17:45:34+09:00", response["imperialDateTimeFormatted"]
+        )
+        self.assertEqual("+09:00", response["imperialDateTime"]["timezone"])
@@ -0,0 +1,130 @@
+"""Test parallel."""
+
+from imperial_calendar import GregorianDateTime, ImperialDateTime
+from imperial_calendar.parallel import convert_fields_many, convert_many
+from imperial_calendar.transform import (
+    grdt_to_juld,
+    imdt_to_imsn,
+    imsn_to_imdt,
+    imsn_to_mrsd,
+    juld_to_grdt,
+    juld_to_tert,
+    mrsd_to_imsn,
+    mrsd_to_tert,
+    tert_to_juld,
+    tert_to_mrsd,
+)
+import random
+import unittest
+
+
+def imdt_to_grdt(imdt: ImperialDateTime, timezone: str) -> GregorianDateTime:
+    """一つづつ變換したグレゴリオ曆の日時."""
+    if imdt.timezone is not None:
+        imdt = imdt.to_standard_naive()
+    juld = tert_to_juld(mrsd_to_tert(imsn_to_mrsd(imdt_to_imsn(imdt))))
+    return GregorianDateTime.from_utc_naive(juld_to_grdt(juld), timezone)
+
+
+def grdt_to_imdt(grdt: GregorianDateTime, timezone: str) -> ImperialDateTime:
+    """一つづつ變換した帝國火星曆の日時."""
+    imdt = imsn_to_imdt(
+        mrsd_to_imsn(tert_to_mrsd(juld_to_tert(grdt_to_juld(grdt.to_utc_naive()))))
+    )
+    return ImperialDateTime.from_standard_naive(imdt, timezone)
+
+
+class TestParallel(unittest.TestCase):
+    """Test parallel."""
+
+    def setUp(self):
+        """Set up."""
+        rng = random.Random(1425)
+        self.values = []
+        for i in range(200):
+            fields = (
+                rng.randint(1, 24),
+                rng.randint(1, 27),
+                rng.randint(0, 23),
+                rng.randint(0, 59),
+                rng.randint(0, 59),
+            )
+            if i % 2 == 0:
+                self.values.append(
+                    GregorianDateTime(
+                        rng.randint(1800, 2200),
+                        (fields[0] + 1) // 2,
+                        *fields[1:],
+                        rng.choice(["+00:00", "Asia/Tokyo", "America/New_York"]),
+                    )
+                )
+            else:
+                self.values.append(
+                    ImperialDateTime(
+                        rng.randint(1000, 3000), *fields, rng.choice([None, "+09:00"])
+                    )
+                )
+
+    def test_convert_many(self):
+        """一つづつ變換した結果と入力の順に一致する."""
+        expected = [
+            (
+                grdt_to_imdt(value, "+09:00")
+                if isinstance(value, GregorianDateTime)
+                else imdt_to_grdt(value, "Asia/Tokyo")
+            )
+            for value in self.values
+        ]
+        for chunk_size, max_workers in [(8192, 1), (7, 1), (16, 2)]:
+            with self.subTest(chunk_size=chunk_size, max_workers=max_workers):
+                self.assertEqual(
+                    expected,
+                    convert_many(
+                        self.values,
+                        "Asia/Tokyo",
+                        "+09:00",
+                        chunk_size=chunk_size,
+                        max_workers=max_workers,
+                    ),
+                )
+
+    def test_convert_fields_many(self):
+        """配列の組を入力の順に變換する."""
+        grdts = [value for value in self.values if isinstance(value, GregorianDateTime)]
+        fields = [
+            [getattr(grdt, name) for grdt in grdts]
+            for name in ("year", "month", "day", "hour", "minute", "second")
+        ]
+        for timezone in ["+00:00", "Asia/Tokyo"]:
+            expected = [
+                grdt_to_imdt(
+                    GregorianDateTime(*row[:6], timezone),
+                    "+09:00",
+                )
+                for row in zip(*fields)
+            ]
+            for chunk_size, max_workers in [(8192, 1), (5, 2)]:
+                with self.subTest(timezone=timezone, max_workers=max_workers):
+                    converted = convert_fields_many(
+                        fields,
+                        True,
+                        timezone,
+                        "+09:00",
+                        chunk_size=chunk_size,
+                        max_workers=max_workers,
+                    )
+                    self.assertEqual(
+                        expected,
+                        [
+                            ImperialDateTime(*row, "+09:00")
+                            for row in zip(*(column.tolist() for column in converted))
+                        ],
+                    )
+
+    def test_convert_many_invalid(self):
+        """不正な入力."""
+        self.assertEqual([], convert_many([]))
+        with self.assertRaises(Exception):
+            convert_many(self.values, chunk_size=0)
+        with self.assertRaises(Exception):
+            convert_many([self.values[0], "1425-01-01"])  # type: ignore
@@ -0,0 +1,108 @@
+"""Test ranges."""
+
+from datetime import datetime
+from imperial_calendar import GregorianDateTime, ImperialDateTime
+from imperial_calendar.ImperialSolNumber import ImperialSolNumber
+from imperial_calendar.ranges import imdt_grdt_range, imdt_range
+from imperial_calendar.transform import (
+    imdt_to_imsn,
+    imsn_to_imdt,
+    imsn_to_mrsd,
+    juld_to_grdt,
+    mrsd_to_tert,
+    tert_to_juld,
+)
+import unittest
+
+
+def imdt_to_grdt(imdt: ImperialDateTime, timezone: str) -> GregorianDateTime:
+    """一つづつ變換したグレゴリオ曆の日時."""
+    if imdt.timezone is not None:
+        imdt = imdt.to_standard_naive()
+    juld = tert_to_juld(mrsd_to_tert(imsn_to_mrsd(imdt_to_imsn(imdt))))
+    return GregorianDateTime.from_utc_naive(juld_to_grdt(juld), timezone)
+
+
+def step_imdts(start: ImperialDateTime, count: int, step: int):
+    """一つづつ變換した帝國火星曆の日時の一覽."""
+    imsn = imdt_to_imsn(start.to_standard_naive() if start.timezone else start)
+    seconds = imsn.day * 24 * 60 * 60 + round(imsn.second)
+    imdts = []
+    for i in range(count):
+        (day, second) = divmod(seconds + i * step, 24 * 60 * 60)
+        imdt = imsn_to_imdt(ImperialSolNumber(day, second))
+        if start.timezone is not None:
+            imdt = ImperialDateTime.from_standard_naive(imdt, start.timezone)
+        imdts.append(imdt)
+    return imdts
+
+
+def seconds_of(grdt: GregorianDateTime) -> float:
+    """地方時の1970年1月1日正子からの秒數."""
+    return (
+        datetime(grdt.year, grdt.month, grdt.day, grdt.hour, grdt.minute, grdt.second)
+        - datetime(1970, 1, 1)
+    ).total_seconds()
+
+
+class TestRanges(unittest.TestCase):
+    """Test ranges."""
+
+    def test_imdt_range(self):
+        """一つづつ變換した結果と一致する."""
+        for start, end, step in [
+            # 閏月と年の境とを跨ぐ
+            (
+                ImperialDateTime(1424, 24, 20, 5, 0, 0, None),
+                ImperialDateTime(1425, 2, 3, 0, 0, 0, None),
+                60 * 60,
+            ),
+            (
+                ImperialDateTime(1425, 3, 27, 23, 59, 50, "+09:00"),
+                ImperialDateTime(1426, 1, 1, 0, 0, 0, "+09:00"),
+                3 * 24 * 60 * 60 + 7,
+            ),
+            (
+                ImperialDateTime(1400, 1, 1, 0, 0, 0, None),
+                ImperialDateTime(1410, 1, 1, 0, 0, 0, None),
+                100 * 24 * 60 * 60,
+            ),
+        ]:
+            with self.subTest(start=start, step=step):
+                imdts = list(imdt_range(start, end, step))
+                self.assertEqual(start, imdts[0])
+                self.assertEqual(step_imdts(start, len(imdts), step), imdts)
+                self.assertLess(imdts[-1].sort_key, end.sort_key)
+                self.assertGreaterEqual(imdts[-1].sort_key + step, end.sort_key)
+
+    def test_imdt_range_empty(self):
+        """endがstart以前なら何も返さない."""
+        start = ImperialDateTime(1425, 1, 1, 0, 0, 0, None)
+        self.assertEqual([], list(imdt_range(start, start, 1)))
+        self.assertEqual(
+            [],
+            list(imdt_range(start, ImperialDateTime(1424, 1, 1, 0, 0, 0, None), 1)),
+        )
+
+    def test_imdt_range_step(self):
+        """stepは正の數."""
+        start = ImperialDateTime(1425, 1, 1, 0, 0, 0, None)
+        end = ImperialDateTime(1425, 1, 2, 0, 0, 0, None)
+        for step in [0, -1]:
+            with self.subTest(step=step):
+                with self.assertRaises(Exception):
+                    list(imdt_range(start, end, step))
+
+    def test_imdt_grdt_range(self):
+        """一つづつ變換した結果と丸めの差の一秒以內で一致し、resync_secondsが0なら完全に一致する."""
+        start = ImperialDateTime(1424, 24, 20, 5, 0, 0, "+09:00")
+        end = ImperialDateTime(1425, 2, 3, 0, 0, 0, "+09:00")
+        pairs = list(imdt_grdt_range(start, end, 60 * 60, "Asia/Tokyo"))
+        self.assertEqual(list(imdt_range(start, end, 60 * 60)), [p[0] for p in pairs])
+        for imdt, grdt in pairs:
+            expected = imdt_to_grdt(imdt, "Asia/Tokyo")
+            self.assertLessEqual(abs(seconds_of(expected) - seconds_of(grdt)), 1)
+        for imdt, grdt in imdt_grdt_range(
+            start, end, 60 * 60 * 7, "Asia/Tokyo", resync_seconds=0
+        ):
+            self.assertEqual(imdt_to_grdt(imdt, "Asia/Tokyo"), grdt)
@@ -0,0 +1,246 @@
+"""Test server."""
+
+from imperial_calendar.server import DateTimeConversionServer
+import asyncio
+import json
+from unittest.mock import patch
+import unittest
+
+
+def request(method: str, target: str, body: dict = None, close: bool = False) -> bytes:
+    """HTTP/1.1の要求."""
+    payload = b"" if body is None else json.dumps(body).encode("utf-8")
+    return (
+        f"{method} {target} HTTP/1.1\r\n"
+        "Host: localhost\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        + ("Connection: close\r\n" if close else "")
+        + "\r\n"
+    ).encode("latin-1") + payload
+
+
+async def read_response(reader: asyncio.StreamReader):
+    """應答を一つ讀んで (status, headers, body) を返す."""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    headers = dict(
+        (name.lower(), value.strip())
+        for (name, _, value) in (line.partition(":") for line in head[1:] if line)
+    )
+    body = await reader.readexactly(int(headers["content-length"]))
+    return (int(head[0].split(" ")[1]), headers, json.loads(body))
+
+
+class TestDateTimeConversionServer(unittest.TestCase):
+    """Test DateTimeConversionServer."""
+
+    def setUp(self):
+        """Set up."""
+        self.now = 1547125607.5
+        self.server = DateTimeConversionServer(clock=lambda: self.now)
+
+    def test_handle(self):
+        """各經路の應答."""
+        for method, target, body, status, expected in [
+            (
+                "POST",
+                "/api/gregorian-datetime/from-imperial",
+                {
+                    "imperialDateTimeFormatted": "1425-01-01T00:00:00+00:00",
+                    "gregorianTimezone": "-05:00",
+                },
+                200,
+                {"gregorianDateTime": "2019-01-09T23:06:47-05:00"},
+            ),
+            (
+                "POST",
+                "/api/gregorian-datetime/from-imperial",
+                {
+                    "imperialDateTimeFormatted": "1425-01-01",
+                    "gregorianTimezone": "-05:00",
+                },
+                400,
+                {"message": "Invalid imperialDateTimeFormatted"},
+            ),
+            (
+                "POST",
+                "/api/imperial-datetime/from-gregorian",
+                {"gregorianDateTime": "2019-01-10T13:06:47Z", "imperialTimezone": 9},
+                400,
+                {"message": "Invalid request body"},
+            ),
+            (
+                "POST",
+                "/api/imperial-datetime/from-gregorian",
+                {
+                    "gregorianDateTime": "2019-01-10T13:06:47Z",
+                    "imperialTimezone": "+9:00",
+                },
+                400,
+                {"message": "Invalid timezone format"},
+            ),
+            (
+                "POST",
+                "/api/imperial-datetime/from-gregorian",
+                {
+                    "gregorianDateTime": "2019/01/10",
+                    "imperialTimezone": "+09:00",
+                },
+                400,
+                {"message": "Invalid gregorianDateTime format"},
+            ),
+            (
+                "GET",
+                "/api/imperial-datetime/current?timezone=%2B24:00",
+                None,
+                400,
+                {"message": "Invalid timezone value"},
+            ),
+            ("GET", "/api/unknown", None, 404, {"message": "Not Found"}),
+            ("GET", "/api/gregorian-datetime/from-imperial", None, 404, None),
+        ]:
+            with self.subTest(method=method, target=target, body=body):
+                payload = b"" if body is None else json.dumps(body).encode("utf-8")
+                (actual_status, actual) = self.server.handle(method, target, payload)
+                self.assertEqual(status, actual_status)
+                if expected is not None:
+                    self.assertEqual(expected, json.loads(actual))
+        self.assertEqual(
+            (400, b'{"message":"Invalid request body"}'),
+            self.server.handle(
+                "POST", "/api/imperial-datetime/from-gregorian", b"{broken"
+            ),
+        )
+
+    def test_current_cache(self):
+        """現在の日時の應答は一秒の閒は同じものを返す."""
+        (status, body) = self.server.handle(
+            "GET", "/api/imperial-datetime/current?timezone=%2B09:00", b""
+        )
+        self.assertEqual(200, status)
+        self.assertEqual(
+            {
+                "gregorianDateTime": "2019-01-10T13:06:47.000Z",
+                "imperialDateTime": {
+                    "year": 1425,
+                    "month": 1,
+                    "day": 1,
+                    "hour": 17,
+                    "minute": 45,
+                    "second": 34,
+                    "timezone": "+09:00",
+                },
+                "imperialDateTimeFormatted": "1425-01-01T17:45:34+09:00",
+            },
+            json.loads(body),
+        )
+        self.now += 0.4
+        self.assertIs(
+            body,
+            self.server.handle(
+                "GET", "/api/imperial-datetime/current?timezone=%2B09:00", b""
+            )[1],
+        )
+        self.now += 0.2
+        self.assertEqual(
+            "2019-01-10T13:06:48.000Z",
+            json.loads(
+                self.server.handle(
+                    "GET", "/api/imperial-datetime/current?timezone=%2B09:00", b""
+                )[1]
+            )["gregorianDateTime"],
+        )
+        self.assertEqual(
+            "+00:00",
+            json.loads(
+                self.server.handle("GET", "/api/imperial-datetime/current", b"")[1]
+            )["imperialDateTime"]["timezone"],
+        )
+
+    def test_connection(self):
+        """一つの接續で續けて送った要求に順に應答し、Connection: closeで閉ぢる."""
+
+        async def run():
+            server = await self.server.start("127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                (reader, writer) = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(
+                    request("GET", "/api/imperial-datetime/current")
+                    + request("GET", "/api/unknown")
+                    + request(
+                        "POST",
+                        "/api/gregorian-datetime/from-imperial",
+                        {
+                            "imperialDateTimeFormatted": "1425-01-01T00:00:00+00:00",
+                            "gregorianTimezone": "+00:00",
+                        },
+                        close=True,
+                    )
+                )
+                await writer.drain()
+                responses = [await read_response(reader) for _ in range(3)]
+                self.assertEqual(b"", await reader.read())
+                writer.close()
+                return responses
+
+        responses = asyncio.run(run())
+        self.assertEqual([200, 404, 200], [status for (status, _, _) in responses])
+        self.assertEqual(
+            ["keep-alive", "keep-alive", "close"],
+            [headers["connection"] for (_, headers, _) in responses],
+        )
+        self.assertEqual(
+            {"gregorianDateTime": "2019-01-10T04:06:47+00:00"}, responses[2][2]
+        )
+
+    def test_bad_request(self):
+        """解釋できない要求には400で應へて閉ぢる."""
+
+        async def run():
+            server = await self.server.start("127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                (reader, writer) = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"GARBAGE\r\n\r\n")
+                await writer.drain()
+                response = await read_response(reader)
+                self.assertEqual(b"", await reader.read())
+                writer.close()
+                return response
+
+        (status, headers, _) = asyncio.run(run())
+        self.assertEqual(400, status)
+        self.assertEqual("close", headers["connection"])
+
+    def test_truncated_body(self):
+        """bodyを送り切らずに閉ぢた接續も、送りかけて止まった接續も靜かに閉ぢる."""
+
+        async def run():
+            errors = []
+            asyncio.get_running_loop().set_exception_handler(
+                lambda loop, context: errors.append(context)
+            )
+            server = await self.server.start("127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                (reader, writer) = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(
+                    request("POST", "/api/gregorian-datetime/from-imperial", {})[:-1]
+                )
+                writer.write_eof()
+                truncated = await reader.read()
+                writer.close()
+                (reader, writer) = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(
+                    request("POST", "/api/gregorian-datetime/from-imperial", {})[:-1]
+                )
+                with patch("imperial_calendar.server.server_keep_alive_timeout", 0.1):
+                    stalled = await asyncio.wait_for(reader.read(), 5.0)
+                writer.close()
+            await asyncio.sleep(0)
+            return (truncated, stalled, errors)
+
+        (truncated, stalled, errors) = asyncio.run(run())
+        self.assertEqual(b"", truncated)
+        self.assertEqual(b"", stalled)
+        self.assertEqual([], errors)
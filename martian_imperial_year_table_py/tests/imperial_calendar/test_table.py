@@ -0,0 +1,113 @@
+"""Test table."""
+
+from contextlib import redirect_stderr, redirect_stdout
+from imperial_calendar import GregorianDateTime, ImperialDateTime
+from imperial_calendar.__main__ import main
+from imperial_calendar.internal.HolidayMars import HolidayMars
+from imperial_calendar.table import format_year, table_columns, table_rows, write_table
+from imperial_calendar.transform import (
+    imdt_to_imsn,
+    imsn_to_mrsd,
+    juld_to_grdt,
+    mrsd_to_tert,
+    tert_to_juld,
+    tert_to_mrls,
+)
+import csv
+import io
+import json
+import unittest
+
+
+def row_of(imdt: ImperialDateTime, grdt_timezone: str):
+    """一つづつ變換した行."""
+    standard = imdt if imdt.timezone is None else imdt.to_standard_naive()
+    mrsd = imsn_to_mrsd(imdt_to_imsn(standard))
+    tert = mrsd_to_tert(mrsd)
+    grdt = GregorianDateTime.from_utc_naive(
+        juld_to_grdt(tert_to_juld(tert)), grdt_timezone
+    )
+    return (
+        f"{imdt.year:04d}-{imdt.month:02d}-{imdt.day:02d}",
+        f"{grdt.year:04d}-{grdt.month:02d}-{grdt.day:02d}"
+        f"T{grdt.hour:02d}:{grdt.minute:02d}:{grdt.second:02d}",
+        mrsd.mars_sol_date,
+        tert_to_mrls(tert),
+        tuple(HolidayMars(imdt.year, imdt.month, imdt.day).names),
+    )
+
+
+class TestTable(unittest.TestCase):
+    """Test table."""
+
+    def test_table_rows(self):
+        """各日を一つづつ變換した結果と一致する."""
+        for imdt_timezone, grdt_timezone in [
+            (None, "+00:00"),
+            ("+09:00", "Asia/Tokyo"),
+        ]:
+            with self.subTest(imdt_timezone=imdt_timezone):
+                rows = list(table_rows(1424, 1425, grdt_timezone, imdt_timezone))
+                self.assertEqual(668 + 669, len(rows))
+                self.assertEqual("1424-01-01", rows[0][0])
+                self.assertEqual("1425-24-28", rows[-1][0])
+                for row in rows[::37] + rows[-3:]:
+                    (year, month, day) = map(int, row[0].split("-"))
+                    expected = row_of(
+                        ImperialDateTime(year, month, day, 0, 0, 0, imdt_timezone),
+                        grdt_timezone,
+                    )
+                    self.assertEqual(expected[:2], row[:2])
+                    self.assertAlmostEqual(expected[2], row[2], places=6)
+                    self.assertAlmostEqual(expected[3], row[3], places=6)
+                    self.assertEqual(expected[4], row[4])
+
+    def test_table_rows_before_year_one(self):
+        """0年以前の年は符號を附けて四桁で書く."""
+        self.assertEqual("-0005", format_year(-5))
+        self.assertEqual("0000", format_year(0))
+        rows = list(table_rows(-1, 0, "+00:00"))
+        self.assertEqual("-0001-01-01", rows[0][0])
+        self.assertEqual("0000-24-27", rows[-1][0])
+        self.assertRegex(rows[0][1], r"^-0664-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$")
+
+    def test_write_table(self):
+        """CSVとJSON Linesとで同じ內容を書き出す."""
+        rows = list(table_rows(1425, 1425, "+09:00"))
+        stream = io.StringIO()
+        write_table(rows, stream, "csv")
+        records = list(csv.reader(io.StringIO(stream.getvalue())))
+        self.assertEqual(list(table_columns), records[0])
+        self.assertEqual(len(rows), len(records) - 1)
+        self.assertEqual("・".join(rows[1][4]), records[2][4])
+        self.assertEqual(rows[1][2], float(records[2][2]))
+        stream = io.StringIO()
+        write_table(rows, stream, "jsonl")
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(rows), len(lines))
+        for row, line in zip(rows, lines):
+            self.assertEqual(
+                dict(zip(table_columns, row[:-1] + (list(row[-1]),))), json.loads(line)
+            )
+        with self.assertRaises(Exception):
+            write_table(rows, io.StringIO(), "xml")
+
+    def test_main(self):
+        """`python -m imperial_calendar table` で表を書き出す."""
+        stream = io.StringIO()
+        with redirect_stdout(stream):
+            main(["table", "1425", "1426", "--format", "jsonl", "--timezone", "+09:00"])
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(669 + 668, len(lines))
+        self.assertEqual("1425-01-01", json.loads(lines[0])["imperial_date"])
+        self.assertEqual("1426-24-27", json.loads(lines[-1])["imperial_date"])
+
+    def test_main_unknown_timezone(self):
+        """知らない時閒帶は使ひ方の誤りとして終はる."""
+        for argv in [
+            ["table", "1425", "1425", "--timezone", "Foo/Bar"],
+            ["table", "1425", "1425", "--imdt-timezone", "Asia/Tokyo"],
+        ]:
+            with self.subTest(argv=argv):
+                with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                    main(argv)
@@ -0,0 +1,67 @@
+"""Test batch conversions GregorianDateTime to ImperialDateTime."""
+
+from imperial_calendar import GregorianDateTime, ImperialDateTime
+from imperial_calendar.transform import (
+    grdt_to_imdt_array,
+    grdt_to_juld,
+    imsn_to_imdt,
+    juld_to_tert,
+    mrsd_to_imsn,
+    tert_to_mrsd,
+)
+import unittest
+
+
+def grdt_to_imdt(grdt: GregorianDateTime, imperial_timezone: str) -> ImperialDateTime:
+    """Convert one by one."""
+    if grdt.timezone is not None:
+        grdt = grdt.to_utc_naive()
+    imsn = mrsd_to_imsn(tert_to_mrsd(juld_to_tert(grdt_to_juld(grdt))))
+    return ImperialDateTime.from_standard_naive(imsn_to_imdt(imsn), imperial_timezone)
+
+
+class Test_grdt_to_imdt(unittest.TestCase):
+    """Test batch conversions GregorianDateTime to ImperialDateTime."""
+
+    def test_grdt_to_imdt_array(self):
+        """一括變換の結果は一件づつ變換した結果と一致する."""
+        fields = [
+            (1582, 10, 15, 12, 0, 0),
+            (1858, 11, 17, 0, 0, 0),
+            (1970, 1, 1, 0, 0, 0),
+            (2000, 1, 1, 12, 0, 0),
+            (2020, 2, 29, 23, 59, 59),
+            (2021, 3, 14, 1, 30, 0),
+            (2021, 11, 7, 1, 30, 0),
+            (2024, 12, 31, 23, 59, 59),
+            (2318, 7, 18, 12, 0, 0),
+        ]
+        columns = [list(column) for column in zip(*fields)]
+        for timezone, imperial_timezone in [
+            (None, "+00:00"),
+            ("+00:00", "+00:00"),
+            ("+09:00", "+12:30"),
+            ("-05:30", "-01:00"),
+            ("Asia/Tokyo", "+09:00"),
+            ("America/New_York", "-05:00"),
+        ]:
+            with self.subTest(timezone=timezone, imperial_timezone=imperial_timezone):
+                actual = grdt_to_imdt_array(*columns, timezone, imperial_timezone)
+                for i, row in enumerate(fields):
+                    expected = grdt_to_imdt(
+                        GregorianDateTime(*row, timezone), imperial_timezone
+                    )
+                    self.assertEqual(
+                        expected,
+                        ImperialDateTime(
+                            *(int(column[i]) for column in actual), imperial_timezone
+                        ),
+                    )
+
+    def test_grdt_to_imdt_array_naive(self):
+        """imperial_timezoneを省略すると標準時の日時を返す."""
+        actual = grdt_to_imdt_array([2000], [1], [1], [12], [0], [0], None)
+        self.assertEqual(
+            grdt_to_imdt(GregorianDateTime(2000, 1, 1, 12, 0, 0, None), "+00:00"),
+            ImperialDateTime(*(int(column[0]) for column in actual), "+00:00"),
+        )
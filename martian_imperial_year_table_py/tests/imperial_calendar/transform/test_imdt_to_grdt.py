@@ -0,0 +1,66 @@
+"""Test batch conversions ImperialDateTime to GregorianDateTime."""
+
+from imperial_calendar import GregorianDateTime, ImperialDateTime
+from imperial_calendar.transform import (
+    imdt_to_grdt_array,
+    imdt_to_imsn,
+    imsn_to_mrsd,
+    juld_to_grdt,
+    mrsd_to_tert,
+    tert_to_juld,
+)
+import unittest
+
+
+def imdt_to_grdt(imdt: ImperialDateTime, grdt_timezone: str) -> GregorianDateTime:
+    """Convert one by one."""
+    if imdt.timezone is not None:
+        imdt = imdt.to_standard_naive()
+    juld = tert_to_juld(mrsd_to_tert(imsn_to_mrsd(imdt_to_imsn(imdt))))
+    return GregorianDateTime.from_utc_naive(juld_to_grdt(juld), grdt_timezone)
+
+
+class Test_imdt_to_grdt(unittest.TestCase):
+    """Test batch conversions ImperialDateTime to GregorianDateTime."""
+
+    def test_imdt_to_grdt_array(self):
+        """一括變換の結果は一件づつ變換した結果と一致する."""
+        fields = [
+            (1000, 1, 1, 0, 0, 0),
+            (1398, 1, 1, 0, 0, 0),
+            (1425, 1, 1, 0, 0, 0),
+            (1425, 12, 27, 23, 59, 59),
+            (1425, 24, 28, 12, 34, 56),
+            (1426, 6, 27, 6, 0, 0),
+            (1427, 13, 1, 18, 30, 0),
+            (1500, 17, 19, 0, 0, 0),
+        ]
+        columns = [list(column) for column in zip(*fields)]
+        for timezone, grdt_timezone in [
+            (None, "+00:00"),
+            ("+00:00", "UTC"),
+            ("+12:30", "+09:00"),
+            ("-01:00", "-05:30"),
+            ("+09:00", "Asia/Tokyo"),
+            ("-05:00", "America/New_York"),
+        ]:
+            with self.subTest(timezone=timezone, grdt_timezone=grdt_timezone):
+                actual = imdt_to_grdt_array(*columns, timezone, grdt_timezone)
+                for i, row in enumerate(fields):
+                    expected = imdt_to_grdt(
+                        ImperialDateTime(*row, timezone), grdt_timezone
+                    )
+                    self.assertEqual(
+                        expected,
+                        GregorianDateTime(
+                            *(int(column[i]) for column in actual), grdt_timezone
+                        ),
+                    )
+
+    def test_imdt_to_grdt_array_naive(self):
+        """grdt_timezoneを省略するとUTCの日時を返す."""
+        actual = imdt_to_grdt_array([1425], [1], [1], [0], [0], [0], None)
+        self.assertEqual(
+            imdt_to_grdt(ImperialDateTime(1425, 1, 1, 0, 0, 0, None), "+00:00"),
+            GregorianDateTime(*(int(column[0]) for column in actual), "+00:00"),
+        )
@@ -1,7 +1,7 @@
 """Test conversions ImperialSolNumber to ImperialDateTime."""
 
-from imperial_calendar import ImperialDateTime, ImperialSolNumber
-from imperial_calendar.transform import imsn_to_imdt
+from imperial_calendar import ImperialDateTime, ImperialSolNumber, ImperialYearMonth
+from imperial_calendar.transform import imdt_to_imsn, imsn_to_imdt
 import unittest
 
 
@@ -23,3 +23,12 @@ class Test_imsn_to_imdt(unittest.TestCase):
         ]:
             with self.subTest(imsn=imsn):
                 self.assertEqual(imdt, imsn_to_imdt(imsn))
+
+    def test_imsn_to_imdt_boundaries(self):
+        """前後一萬年の各月の初日と末日は imdt_to_imsn の逆變換になる."""
+        for year in list(range(-10000, 10001, 17)) + list(range(-3, 1004)):
+            for month in range(1, 25):
+                for day in [1, ImperialYearMonth(year, month).days()]:
+                    imdt = ImperialDateTime(year, month, day, 0, 0, 0, None)
+                    with self.subTest(imdt=imdt):
+                        self.assertEqual(imdt, imsn_to_imdt(imdt_to_imsn(imdt)))
@@ -0,0 +1,112 @@
+"""Test conversions Mars Ls to ImperialSolNumber."""
+
+from imperial_calendar import ImperialDateTime
+from imperial_calendar.transform import (
+    imdt_to_imsn,
+    imsn_to_mrsd,
+    mrls_to_imsn,
+    mrls_to_imsn_array,
+    mrsd_to_tert,
+    tert_to_mrls,
+)
+from imperial_calendar.transform.mrls_to_imsn import (
+    mars_tropical_year,
+    mrls_crossing_margin,
+    next_mrls_crossing,
+    next_mrls_crossing_array,
+)
+from imperial_calendar.transform.tert_to_mrls import (
+    offset_t_j2000_to_areocentric_solar_longitude,
+)
+import math
+import unittest
+
+
+def imsn_to_mrls(imsn) -> float:
+    """Convert one by one."""
+    return tert_to_mrls(mrsd_to_tert(imsn_to_mrsd(imsn)))
+
+
+class Test_mrls_to_imsn(unittest.TestCase):
+    """Test conversions Mars Ls to ImperialSolNumber."""
+
+    years = [-500, 0, 1000, 1425, 1426, 3000]
+    mrls = [0.0, 45.0, 90.0, 180.0, 270.0, 315.0, 359.5]
+
+    def test_mrls_to_imsn(self):
+        """其の年の始まり以後に初めてLsが其の値を過ぎる時刻."""
+        for year in self.years:
+            start = imdt_to_imsn(ImperialDateTime(year, 1, 1, 0, 0, 0, None))
+            for mrls in self.mrls:
+                with self.subTest(year=year, mrls=mrls):
+                    imsn = mrls_to_imsn(year, mrls)
+                    self.assertTrue(
+                        math.isclose(
+                            0.0,
+                            (imsn_to_mrls(imsn) - mrls + 180.0) % 360.0 - 180.0,
+                            abs_tol=1.0e-7,
+                        )
+                    )
+                    self.assertLessEqual(
+                        start.imperial_sol_number, imsn.imperial_sol_number
+                    )
+                    self.assertLess(
+                        imsn.imperial_sol_number, start.imperial_sol_number + 669
+                    )
+
+    def test_mrls_to_imsn_solstice(self):
+        """冬至は冬至月の始め頃."""
+        imsn = mrls_to_imsn(1425, 270.0)
+        self.assertEqual(
+            imdt_to_imsn(ImperialDateTime(1425, 22, 1, 0, 0, 0, None)).day, imsn.day
+        )
+
+    def test_mrls_to_imsn_array(self):
+        """一括變換の結果は一件づつ變換した結果と一致する."""
+        (day, second) = mrls_to_imsn_array([[year] for year in self.years], self.mrls)
+        self.assertEqual((len(self.years), len(self.mrls)), day.shape)
+        for i, year in enumerate(self.years):
+            for j, mrls in enumerate(self.mrls):
+                with self.subTest(year=year, mrls=mrls):
+                    imsn = mrls_to_imsn(year, mrls)
+                    self.assertEqual(imsn.day, day[i, j])
+                    self.assertTrue(
+                        math.isclose(imsn.second, second[i, j], abs_tol=1.0e-3)
+                    )
+
+    def test_next_mrls_crossing_near_start(self):
+        """目標のLsが始まりのLsの僅か手前なら凡そ一太陽年後に、僅か先なら始まりの直後に解がある."""
+        starts = [-300000.0 + 12345.678 * i for i in range(50)]
+        for delta in [1.0e-7, 1.0e-3, 0.01, -1.0e-7]:
+            targets = [
+                (offset_t_j2000_to_areocentric_solar_longitude(start) - delta) % 360
+                for start in starts
+            ]
+            crossings = next_mrls_crossing_array(starts, targets)
+            for i, (start, target) in enumerate(zip(starts, targets)):
+                with self.subTest(start=start, delta=delta):
+                    crossing = next_mrls_crossing(start, target)
+                    self.assertTrue(
+                        math.isclose(crossing, crossings[i], abs_tol=1.0e-6)
+                    )
+                    self.assertTrue(
+                        math.isclose(
+                            0.0,
+                            (
+                                offset_t_j2000_to_areocentric_solar_longitude(crossing)
+                                - target
+                                + 180.0
+                            )
+                            % 360.0
+                            - 180.0,
+                            abs_tol=1.0e-7,
+                        )
+                    )
+                    self.assertLessEqual(start, crossing)
+                    self.assertLess(
+                        crossing, start + mars_tropical_year + mrls_crossing_margin
+                    )
+                    if delta > 0.0:
+                        self.assertGreater(crossing, start + mars_tropical_year - 1.0)
+                    else:
+                        self.assertLess(crossing, start + 1.0)
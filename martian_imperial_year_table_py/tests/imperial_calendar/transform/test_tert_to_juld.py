@@ -0,0 +1,86 @@
+"""Test conversions TerrestrialTime to JulianDay."""
+
+from imperial_calendar import TerrestrialTime
+from imperial_calendar.transform import (
+    juld_to_tert,
+    tert_to_juld,
+    tert_to_juld_array,
+    tert_to_juld_array_with_residual,
+    tert_to_juld_with_residual,
+)
+import math
+import unittest
+
+
+class Test_tert_to_juld(unittest.TestCase):
+    """Test conversions TerrestrialTime to JulianDay."""
+
+    terrestrial_times = [
+        -1000000.0,
+        0.5,
+        1000000.25,
+        2299160.5,
+        2451545.0,
+        2460000.75,
+        2469807.5,
+        3000000.0,
+    ]
+
+    def test_tert_to_juld_with_residual(self):
+        """juld_to_tertの逆變換になり、殘差はtolerance以下になる."""
+        for terrestrial_time in self.terrestrial_times:
+            with self.subTest(terrestrial_time=terrestrial_time):
+                (juld, residual) = tert_to_juld_with_residual(
+                    TerrestrialTime(terrestrial_time), 1.0e-4
+                )
+                self.assertLessEqual(residual, 1.0e-4)
+                self.assertTrue(
+                    math.isclose(
+                        residual,
+                        abs(juld_to_tert(juld).terrestrial_time - terrestrial_time)
+                        * 24
+                        * 60
+                        * 60,
+                        abs_tol=1.0e-4,
+                    )
+                )
+                self.assertTrue(
+                    math.isclose(
+                        terrestrial_time,
+                        juld_to_tert(juld).terrestrial_time,
+                        abs_tol=1.0e-4 / (24 * 60 * 60),
+                    )
+                )
+
+    def test_tert_to_juld_max_iterations(self):
+        """max_iterationsで打ち切ると殘差がtoleranceを超えて殘る."""
+        (_, residual) = tert_to_juld_with_residual(
+            TerrestrialTime(2451545.0), max_iterations=0
+        )
+        self.assertGreater(residual, 60.0)
+
+    def test_tert_to_juld_array(self):
+        """配列版はscalar版と一致する."""
+        (day, second) = tert_to_juld_array(self.terrestrial_times)
+        for i, terrestrial_time in enumerate(self.terrestrial_times):
+            with self.subTest(terrestrial_time=terrestrial_time):
+                expected = tert_to_juld(TerrestrialTime(terrestrial_time))
+                self.assertEqual(expected.day, int(day[i]))
+                self.assertTrue(
+                    math.isclose(expected.second, float(second[i]), abs_tol=1.0e-3)
+                )
+
+    def test_tert_to_juld_array_with_residual(self):
+        """配列版の殘差はscalar版と一致し、全てtolerance以下になる."""
+        (_, _, residual) = tert_to_juld_array_with_residual(
+            self.terrestrial_times, 1.0e-4
+        )
+        self.assertTrue((residual <= 1.0e-4).all())
+        for i, terrestrial_time in enumerate(self.terrestrial_times):
+            with self.subTest(terrestrial_time=terrestrial_time):
+                (_, expected) = tert_to_juld_with_residual(
+                    TerrestrialTime(terrestrial_time), 1.0e-4
+                )
+                self.assertTrue(
+                    math.isclose(expected, float(residual[i]), abs_tol=1.0e-4)
+                )
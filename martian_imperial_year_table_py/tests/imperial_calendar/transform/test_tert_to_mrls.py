@@ -0,0 +1,25 @@
+"""Test conversions TerrestrialTime to Mars LS."""
+
+from imperial_calendar import TerrestrialTime
+from imperial_calendar.transform import tert_to_mrls, tert_to_mrls_array
+import math
+import unittest
+
+
+class Test_tert_to_mrls(unittest.TestCase):
+    """Test conversions TerrestrialTime to Mars LS."""
+
+    def test_tert_to_mrls_array(self):
+        """配列版はscalar版と一致する."""
+        terrestrial_times = [
+            2451545.0 + 0.37 * i for i in range(-50000, 50000, 997)
+        ] + [1000000.0, 2000000.5, 3000000.25, 4000000.75]
+        for terrestrial_time, mrls in zip(
+            terrestrial_times, tert_to_mrls_array(terrestrial_times)
+        ):
+            with self.subTest(terrestrial_time=terrestrial_time):
+                expected = tert_to_mrls(TerrestrialTime(terrestrial_time))
+                self.assertTrue(
+                    math.isclose(expected, float(mrls), abs_tol=1e-9)
+                    or math.isclose(abs(expected - float(mrls)), 360, abs_tol=1e-9)
+                )